@@ -0,0 +1,42 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+
+def bar_dicts(n: int, start_epoch: int = 1704205860000) -> List[Dict[str, Any]]:
+    """Synthetic minute bars shaped like the barcharts endpoint output."""
+    bars = []
+    price = 100.0
+    for i in range(n):
+        epoch = start_epoch + i * 60_000
+        price += ((i * 7919) % 11 - 5) * 0.01
+        bars.append(
+            {
+                "High": f"{price + 0.12:.2f}",
+                "Low": f"{price - 0.09:.2f}",
+                "Open": f"{price - 0.03:.2f}",
+                "Close": f"{price:.2f}",
+                "TimeStamp": datetime.fromtimestamp(
+                    epoch / 1000, tz=timezone.utc
+                ).strftime(r"%Y-%m-%dT%H:%M:%SZ"),
+                "TotalVolume": str(1000 + i % 500),
+                "DownTicks": 40 + i % 7,
+                "DownVolume": 400 + i % 250,
+                "OpenInterest": "0",
+                "IsRealtime": False,
+                "IsEndOfHistory": i == n - 1,
+                "TotalTicks": 100 + i % 13,
+                "UnchangedTicks": 10,
+                "UnchangedVolume": 100,
+                "UpTicks": 50 + i % 6,
+                "UpVolume": 500 + i % 250,
+                "Epoch": epoch,
+                "BarStatus": "Closed",
+            }
+        )
+    return bars
+
+
+def bars_payload(n: int, start_epoch: int = 1704205860000) -> bytes:
+    """Raw JSON body for ``n`` synthetic bars."""
+    return json.dumps({"Bars": bar_dicts(n, start_epoch)}).encode()
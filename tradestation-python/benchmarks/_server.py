@@ -0,0 +1,94 @@
+import asyncio
+import multiprocessing
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple
+
+from _payloads import bars_payload
+
+
+def _serve(
+    latency: float, n_bars: int, body: Optional[bytes], port: Any, connections: Any
+) -> None:
+    if body is None:
+        body = bars_payload(n_bars)
+    response = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+    )
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        with connections.get_lock():
+            connections.value += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                length = _content_length(head)
+                if length:
+                    await reader.readexactly(length)
+                if latency:
+                    await asyncio.sleep(latency)
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        port.value = server.sockets[0].getsockname()[1]
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def _content_length(head: bytes) -> int:
+    for line in head.lower().split(b"\r\n"):
+        if line.startswith(b"content-length:"):
+            return int(line.split(b":", 1)[1])
+    return 0
+
+
+class ServerInfo:
+    def __init__(self, connections: Any) -> None:
+        self._connections = connections
+
+    @property
+    def connections(self) -> int:
+        """TCP connections accepted so far."""
+        return self._connections.value
+
+
+@contextmanager
+def local_server(
+    latency: float = 0.0, n_bars: int = 100, body: Optional[bytes] = None
+) -> Iterator[Tuple[str, ServerInfo]]:
+    """
+    Run a keep-alive HTTP/1.1 server that answers every request with bars.
+
+    Pass `body` to answer with that JSON instead. Request bodies are read
+    and discarded.
+
+    The server is a minimal asyncio loop in its own process, so it neither
+    competes with the client for the GIL nor needs a thread per connection.
+    Yields the API base URL and a ServerInfo.
+    """
+    port = multiprocessing.Value("i", 0)
+    connections = multiprocessing.Value("i", 0)
+    process = multiprocessing.Process(
+        target=_serve, args=(latency, n_bars, body, port, connections), daemon=True
+    )
+    process.start()
+    try:
+        while not port.value:
+            time.sleep(0.01)
+        yield f"http://127.0.0.1:{port.value}/v3", ServerInfo(connections)
+    finally:
+        process.terminate()
+        process.join()
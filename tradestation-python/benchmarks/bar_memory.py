@@ -0,0 +1,52 @@
+"""
+Compare the memory held per bar by `BarsResponse` and by `BarsFrame`.
+
+Measures retained allocations with tracemalloc after decoding a payload,
+and the cost of keeping every `BarRecord` view of a frame alive.
+
+Usage: python benchmarks/bar_memory.py [n_bars]
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Callable, Tuple
+
+from _payloads import bars_payload
+
+from tradestation_python.types.responses import BarsFrame, BarsResponse
+
+
+def retained(build: Callable[[], object]) -> Tuple[object, int]:
+    """Return the built object and the bytes it keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    value = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return value, size
+
+
+def main(n: int) -> None:
+    payload = bars_payload(n)
+    response, response_size = retained(
+        lambda: BarsResponse.model_validate_json(payload)
+    )
+    del response
+    frame, frame_size = retained(lambda: BarsFrame.from_json(payload))
+    assert isinstance(frame, BarsFrame)
+    records, records_size = retained(lambda: list(frame))
+    del records
+
+    print(f"{n} bars")
+    print(f"{'BarsResponse':>22} | {response_size / n:7.1f} bytes/bar")
+    print(f"{'BarsFrame':>22} | {frame_size / n:7.1f} bytes/bar")
+    print(f"{'+ all BarRecord views':>22} | {records_size / n:7.1f} bytes/bar")
+    print(f"{'reduction':>22} | {response_size / frame_size:7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
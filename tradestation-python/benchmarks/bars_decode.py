@@ -0,0 +1,38 @@
+"""
+Compare decoding a barcharts payload into `BarsResponse` against `BarsFrame`.
+
+Usage: python benchmarks/bars_decode.py [n_bars ...]
+"""
+
+import json
+import sys
+from timeit import repeat
+
+from _payloads import bars_payload
+
+from tradestation_python.types.responses import BarsFrame, BarsResponse
+
+
+def main(sizes: list) -> None:
+    for n in sizes:
+        payload = bars_payload(n)
+        number = max(1, 20_000 // n)
+        model = min(
+            repeat(
+                lambda: BarsResponse.model_validate(json.loads(payload)),
+                number=number,
+                repeat=5,
+            )
+        )
+        frame = min(
+            repeat(lambda: BarsFrame.from_json(payload), number=number, repeat=5)
+        )
+        print(
+            f"{n:>8} bars | BarsResponse {model / number * 1e3:9.2f} ms"
+            f" | BarsFrame {frame / number * 1e3:9.2f} ms"
+            f" | speedup {model / frame:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000])
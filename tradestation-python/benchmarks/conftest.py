@@ -0,0 +1,29 @@
+"""
+Fixtures for the pytest-benchmark suite, run against `MockTradeStation`.
+
+Usage: pytest benchmarks --benchmark-only [--benchmark-autosave]
+       [--benchmark-compare --benchmark-compare-fail=median:15%]
+
+Needs the `benchmark` extra. The mock answers in process, so with zero
+latency the timings are SDK overhead alone.
+"""
+
+import pytest
+
+from tradestation_python import AsyncTradeStation, TradeStation
+from tradestation_python.testing import MockTradeStation
+
+
+@pytest.fixture
+def mock() -> MockTradeStation:
+    return MockTradeStation()
+
+
+@pytest.fixture
+def ts(mock: MockTradeStation) -> TradeStation:
+    return mock.client()
+
+
+@pytest.fixture
+def ats(mock: MockTradeStation) -> AsyncTradeStation:
+    return mock.async_client()
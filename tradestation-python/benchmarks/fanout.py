@@ -0,0 +1,50 @@
+"""
+Compare N-symbol bar fan-out on the sync client against the async client.
+
+MockTradeStation sleeps for a fixed latency per request, so the numbers
+show how well each client overlaps network waits.
+
+Usage: python benchmarks/fanout.py [n_symbols] [latency_ms]
+"""
+
+import asyncio
+import sys
+import time
+
+from tradestation_python.testing import MockTradeStation
+
+
+def run_sync(symbols: list, latency: float) -> float:
+    ts = MockTradeStation(latency=latency).client()
+    start = time.perf_counter()
+    for symbol in symbols:
+        ts.market_data.bars(symbol, barsback=100)
+    return time.perf_counter() - start
+
+
+async def run_async(symbols: list, latency: float) -> float:
+    async with MockTradeStation(latency=latency).async_client() as ts:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(ts.market_data.bars(symbol, barsback=100) for symbol in symbols)
+        )
+        return time.perf_counter() - start
+
+
+def main(n_symbols: int, latency: float) -> None:
+    symbols = [f"SYM{i}" for i in range(n_symbols)]
+    sync_elapsed = run_sync(symbols, latency)
+    async_elapsed = asyncio.run(run_async(symbols, latency))
+    for name, elapsed in (("sync", sync_elapsed), ("async", async_elapsed)):
+        print(
+            f"{name:>5} | {n_symbols} symbols in {elapsed:7.3f} s"
+            f" | {n_symbols / elapsed:8.1f} req/s"
+        )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        int(args[0]) if args else 200,
+        (float(args[1]) if len(args) > 1 else 20.0) / 1000,
+    )
@@ -0,0 +1,54 @@
+"""
+Report `python -X importtime` costs of common entry points into the SDK.
+
+Each statement runs in a fresh interpreter. The median total import time,
+startup included, is shown with the slowest modules of the last run.
+
+Usage: python benchmarks/import_time.py [runs] [top]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+STATEMENTS = [
+    # Interpreter startup alone, for reference.
+    "pass",
+    "import tradestation_python",
+    "from tradestation_python import TradeStation",
+    "from tradestation_python import TradeStation; TradeStation(auth=None).market_data",
+]
+
+
+def import_times(statement: str) -> List[Tuple[str, int, int]]:
+    """(module, self us, cumulative us) for every module `statement` imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            rows.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return rows
+
+
+def main(runs: int, top: int) -> None:
+    for statement in STATEMENTS:
+        samples = [import_times(statement) for _ in range(runs)]
+        totals = [sum(own for _, own, _ in rows) for rows in samples]
+        print(f"{statement}\n  total {statistics.median(totals) / 1000:8.1f} ms")
+        slowest = sorted(samples[-1], key=lambda row: row[1], reverse=True)[:top]
+        for module, own, _ in slowest:
+            print(f"  {own / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [5, 8][len(args) :]))
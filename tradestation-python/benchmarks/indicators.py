@@ -0,0 +1,151 @@
+"""
+Compare `lib.indicators` on BarsFrame columns with naive loops over `Bar` models.
+
+The naive versions are the usual hand-written loops: a window sum per bar for
+the SMA and per-bar attribute access for the rest. Decoding time is excluded.
+
+Usage: python benchmarks/indicators.py [n_bars] [period]
+"""
+
+import sys
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from _payloads import bars_payload
+
+from tradestation_python.lib import indicators
+from tradestation_python.types.responses import Bar, BarsFrame, BarsResponse
+
+
+def naive_sma(bars: List[Bar], period: int) -> List[float]:
+    out = []
+    for i in range(len(bars)):
+        if i + 1 < period:
+            out.append(float("nan"))
+        else:
+            window = bars[i + 1 - period : i + 1]
+            out.append(sum(bar.close for bar in window) / period)
+    return out
+
+
+def naive_ema(bars: List[Bar], period: int) -> List[float]:
+    alpha = 2 / (period + 1)
+    out: List[float] = []
+    for i, bar in enumerate(bars):
+        if i + 1 < period:
+            out.append(float("nan"))
+        elif i + 1 == period:
+            out.append(sum(b.close for b in bars[:period]) / period)
+        else:
+            out.append(out[-1] + alpha * (bar.close - out[-1]))
+    return out
+
+
+def naive_rsi(bars: List[Bar], period: int) -> List[float]:
+    out = [float("nan")]
+    gain = loss = 0.0
+    for i in range(1, len(bars)):
+        change = bars[i].close - bars[i - 1].close
+        up, down = max(change, 0.0), max(-change, 0.0)
+        if i < period:
+            gain += up
+            loss += down
+            out.append(float("nan"))
+            continue
+        if i == period:
+            gain = (gain + up) / period
+            loss = (loss + down) / period
+        else:
+            gain = (gain * (period - 1) + up) / period
+            loss = (loss * (period - 1) + down) / period
+        out.append(100.0 if loss == 0 else 100 - 100 / (1 + gain / loss))
+    return out
+
+
+def naive_atr(bars: List[Bar], period: int) -> List[float]:
+    ranges = [bars[0].high - bars[0].low]
+    for prev, bar in zip(bars, bars[1:]):
+        ranges.append(
+            max(
+                bar.high - bar.low,
+                abs(bar.high - prev.close),
+                abs(bar.low - prev.close),
+            )
+        )
+    out: List[float] = []
+    for i, tr in enumerate(ranges):
+        if i + 1 < period:
+            out.append(float("nan"))
+        elif i + 1 == period:
+            out.append(sum(ranges[:period]) / period)
+        else:
+            out.append((out[-1] * (period - 1) + tr) / period)
+    return out
+
+
+def naive_vwap(bars: List[Bar]) -> List[float]:
+    out = []
+    weighted = volume = 0.0
+    for bar in bars:
+        weighted += (bar.high + bar.low + bar.close) / 3 * bar.total_volume
+        volume += bar.total_volume
+        out.append(weighted / volume if volume else float("nan"))
+    return out
+
+
+def timed(fn: Callable[[], object]) -> float:
+    start = perf_counter()
+    fn()
+    return (perf_counter() - start) * 1e3
+
+
+def main(n: int, period: int) -> None:
+    payload = bars_payload(n)
+    bars = BarsResponse.model_validate_json(payload).bars
+    f = BarsFrame.from_json(payload)
+
+    cases: Dict[str, List[Callable[[], object]]] = {
+        "SMA": [
+            lambda: naive_sma(bars, period),
+            lambda: indicators.sma(f.close, period),
+        ],
+        "EMA": [
+            lambda: naive_ema(bars, period),
+            lambda: indicators.ema(f.close, period),
+        ],
+        "RSI": [
+            lambda: naive_rsi(bars, period),
+            lambda: indicators.rsi(f.close, period),
+        ],
+        "ATR": [
+            lambda: naive_atr(bars, period),
+            lambda: indicators.atr(f.high, f.low, f.close, period),
+        ],
+        "VWAP": [
+            lambda: naive_vwap(bars),
+            lambda: indicators.vwap(f.high, f.low, f.close, f.total_volume),
+        ],
+    }
+
+    def incremental() -> None:
+        sma = indicators.SMA(period)
+        for close in f.close:
+            sma.update(close)
+
+    print(f"{n} bars, period {period}")
+    for name, (naive, columnar) in cases.items():
+        slow, fast = timed(naive), timed(columnar)
+        print(
+            f"{name:>5} | naive {slow:9.1f} ms | columnar {fast:8.1f} ms"
+            f" | {slow / fast:5.1f}x"
+        )
+    per_bar = timed(incremental) / n * 1e3
+    print(f"incremental SMA update: {per_bar:.2f} us/bar")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        int(args[0]) if args else 100_000,
+        int(args[1]) if len(args) > 1 else 20,
+    )
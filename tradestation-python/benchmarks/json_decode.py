@@ -0,0 +1,51 @@
+"""
+Compare JSON decode backends on realistic barcharts payloads.
+
+For every installed backend, times decoding into `BarsResponse` models and
+into a columnar `BarsFrame`. Backends whose package is missing are skipped.
+
+Usage: python benchmarks/json_decode.py [n_bars ...]
+"""
+
+import sys
+from timeit import repeat
+from typing import Callable, List
+
+from _payloads import bars_payload
+
+from tradestation_python import get_decoder
+from tradestation_python._decoding import DECODERS
+from tradestation_python.types.responses import BarsFrame, BarsResponse
+
+
+def best(fn: Callable[[], object], number: int) -> float:
+    """Best per-call time in milliseconds over five runs."""
+    return min(repeat(fn, number=number, repeat=5)) / number * 1e3
+
+
+def main(sizes: List[int]) -> None:
+    decoders = []
+    for name in DECODERS:
+        try:
+            decoders.append(get_decoder(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    for n in sizes:
+        payload = bars_payload(n)
+        number = max(1, 50_000 // n)
+        print(f"\n{n} bars ({len(payload) / 1e6:.1f} MB)")
+        baseline = None
+        for decoder in decoders:
+            model = best(lambda: decoder.validate(payload, BarsResponse), number)
+            frame = best(lambda: BarsFrame.from_json(payload, decoder.loads), number)
+            if baseline is None:
+                baseline = model
+            print(
+                f"{decoder.name:>10} | BarsResponse {model:9.2f} ms"
+                f" ({baseline / model:4.2f}x) | BarsFrame {frame:9.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
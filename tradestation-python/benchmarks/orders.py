@@ -0,0 +1,121 @@
+"""
+Measure the client-side cost of placing an order.
+
+Compares building and validating an `OrderRequest` per order with patching a
+pre-serialized `OrderTemplate`, first on their own, then through `place`
+with an in-process transport (pure client overhead: request building, auth,
+retries, response validation), then against a local keep-alive server.
+Finally compares the first order on a cold client with one sent after
+`warm()` has opened the connection.
+
+Usage: python benchmarks/orders.py [n_orders]
+"""
+
+import json
+import sys
+from decimal import Decimal
+from time import perf_counter
+from typing import Callable, List, Optional
+
+import httpx
+from _server import local_server
+
+from tradestation_python import RateLimiter, TradeStation
+from tradestation_python.resources.order_execution import OrderTemplate
+from tradestation_python.types.enums import OrderType, TradeAction
+from tradestation_python.types.requests import OrderRequest
+
+RESPONSE = json.dumps(
+    {"Orders": [{"OrderID": "123456789", "Message": "Sent order: BUY 10 MSFT"}]}
+).encode()
+
+
+def make_order(i: int) -> OrderRequest:
+    return OrderRequest(
+        account_id="11111111",
+        symbol="MSFT",
+        quantity=10 + i % 5,
+        order_type=OrderType.LIMIT,
+        trade_action=TradeAction.BUY,
+        limit_price=Decimal(100) + Decimal(i % 100) / 100,
+    )
+
+
+def per_call(fn: Callable[[int], object], n: int) -> float:
+    """Mean microseconds per call."""
+    start = perf_counter()
+    for i in range(n):
+        fn(i)
+    return (perf_counter() - start) / n * 1e6
+
+
+def client(
+    base_url: str, transport: Optional[httpx.BaseTransport] = None
+) -> TradeStation:
+    return TradeStation(
+        base_url=base_url,
+        auth=httpx.Auth(),
+        transport=transport,
+        rate_limiter=RateLimiter({}),
+    )
+
+
+def main(n: int) -> None:
+    template = OrderTemplate(make_order(0))
+
+    def build(i: int) -> bytes:
+        return make_order(i).to_json()
+
+    def render(i: int) -> bytes:
+        return template.render(quantity=10 + i % 5, limit_price=100 + i % 100 / 100)
+
+    rows: List[tuple] = [("serialize", per_call(build, n), per_call(render, n))]
+
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=RESPONSE)
+    )
+    ts = client("https://api.test/v3", transport)
+    orders = ts.order_execution
+    rows.append(
+        (
+            "place, in-process",
+            per_call(lambda i: orders.place(make_order(i)), n),
+            per_call(lambda i: orders.place(render(i)), n),
+        )
+    )
+
+    with local_server(body=RESPONSE) as (base_url, server):
+        ts = client(base_url)
+        orders = ts.order_execution
+        orders.warm()
+        rows.append(
+            (
+                "place, local server",
+                per_call(lambda i: orders.place(make_order(i)), n),
+                per_call(lambda i: orders.place(render(i)), n),
+            )
+        )
+
+        cold = []
+        warm = []
+        for _ in range(20):
+            ts = client(base_url)
+            cold.append(per_call(lambda i: ts.order_execution.place(render(i)), 1))
+            ts = client(base_url)
+            ts.order_execution.warm()
+            warm.append(per_call(lambda i: ts.order_execution.place(render(i)), 1))
+        connections = server.connections
+
+    print(f"{n} orders, microseconds per order")
+    print(f"{'':>20} | {'model':>8} | {'template':>8}")
+    for name, model, rendered in rows:
+        print(f"{name:>20} | {model:8.1f} | {rendered:8.1f}")
+    print(
+        f"first order: cold client {sorted(cold)[10]:.0f} us, "
+        f"after warm() {sorted(warm)[10]:.0f} us (medians, {connections} connections)"
+    )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 5000)
@@ -0,0 +1,105 @@
+"""
+Compare concurrent `bars` throughput across connection pool configurations.
+
+Runs the async client against a local keep-alive HTTP/1.1 server and
+reports requests per second and the number of TCP connections opened. The
+HTTP/2 row only appears when the `http2` extra is installed; against the
+plain-text local server it negotiates HTTP/1.1, so it shows the overhead
+of enabling it rather than multiplexing gains.
+
+Usage: python benchmarks/pool.py [n_requests] [concurrency] [latency_ms]
+"""
+
+import asyncio
+import importlib.util
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from _server import local_server
+
+from tradestation_python import AsyncTradeStation, RateLimiter, ResponseCache
+
+CONFIGS: Dict[str, Dict[str, object]] = {
+    "no keep-alive": {"limits": httpx.Limits(max_keepalive_connections=0)},
+    "httpx default": {"limits": httpx.Limits()},
+    "pool 10": {
+        "limits": httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    },
+    "pool 100": {
+        "limits": httpx.Limits(max_connections=100, max_keepalive_connections=100)
+    },
+}
+if importlib.util.find_spec("h2") is not None:
+    CONFIGS["pool 100 + http2"] = {**CONFIGS["pool 100"], "http2": True}
+
+
+async def run(
+    base_url: str,
+    n_requests: int,
+    concurrency: int,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    clients: int = 1,
+    **options: object,
+) -> float:
+    instances: List[AsyncTradeStation] = [
+        AsyncTradeStation(
+            base_url=base_url,
+            auth=httpx.Auth(),
+            transport=transport,
+            rate_limiter=RateLimiter({}),
+            response_cache=ResponseCache({}),
+            **options,  # type: ignore[arg-type]
+        )
+        for _ in range(clients)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(i: int) -> None:
+        async with semaphore:
+            await instances[i % clients].market_data.bars(f"SYM{i}", barsback=100)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch(i) for i in range(n_requests)))
+    elapsed = time.perf_counter() - start
+    for ts in instances:
+        await ts.__aexit__(None, None, None)
+    return elapsed
+
+
+def report(name: str, n_requests: int, elapsed: float, connections: int) -> None:
+    print(
+        f"{name:>24} | {n_requests / elapsed:8.1f} req/s | {connections:4d} connections"
+    )
+
+
+def main(n_requests: int, concurrency: int, latency: float) -> None:
+    print(f"{n_requests} requests, {concurrency} in flight, {latency * 1000:.0f} ms")
+    results: List[Tuple[str, float, int]] = []
+    for name, options in CONFIGS.items():
+        with local_server(latency) as (base_url, server):
+            elapsed = asyncio.run(run(base_url, n_requests, concurrency, **options))
+            results.append((name, elapsed, server.connections))
+
+    # Four clients sharing one injected transport reuse a single pool.
+    with local_server(latency) as (base_url, server):
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100)
+        )
+        elapsed = asyncio.run(
+            run(base_url, n_requests, concurrency, transport=transport, clients=4)
+        )
+        results.append(("4 clients, shared pool", elapsed, server.connections))
+
+    for name, elapsed, connections in results:
+        report(name, n_requests, elapsed, connections)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        int(args[0]) if args else 1000,
+        int(args[1]) if len(args) > 1 else 16,
+        (float(args[2]) if len(args) > 2 else 20.0) / 1000,
+    )
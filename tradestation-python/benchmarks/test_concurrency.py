@@ -0,0 +1,52 @@
+"""How request fan-out scales with concurrency when every response is slow."""
+
+import asyncio
+
+import pytest
+
+from tradestation_python.testing import MockTradeStation
+
+pytest.importorskip("pytest_benchmark")
+
+SYMBOLS = [f"SYM{i}" for i in range(32)]
+LATENCY = 0.005
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 8, 32])
+def test_sync_bars_many(benchmark, max_in_flight: int):
+    ts = MockTradeStation(latency=LATENCY).client()
+
+    results = benchmark.pedantic(
+        ts.market_data.bars_many,
+        args=(SYMBOLS,),
+        kwargs={"barsback": 100, "max_in_flight": max_in_flight},
+        rounds=5,
+    )
+
+    assert all(result.error is None for result in results.values())
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 8, 32])
+def test_async_bars_many(benchmark, max_in_flight: int):
+    ts = MockTradeStation(latency=LATENCY).async_client()
+
+    def run() -> dict:
+        return asyncio.run(
+            ts.market_data.bars_many(SYMBOLS, barsback=100, max_in_flight=max_in_flight)
+        )
+
+    results = benchmark.pedantic(run, rounds=5)
+
+    assert all(result.error is None for result in results.values())
+
+
+def test_retries_under_rate_limiting(benchmark):
+    mock = MockTradeStation(latency=LATENCY, rate_limit_every=4)
+    ts = mock.client()
+
+    results = benchmark.pedantic(
+        ts.market_data.bars_many, args=(SYMBOLS,), kwargs={"barsback": 100}, rounds=3
+    )
+
+    assert all(result.error is None for result in results.values())
+    assert mock.rate_limited
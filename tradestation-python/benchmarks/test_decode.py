@@ -0,0 +1,55 @@
+"""Decode and validation throughput for large barcharts and brokerage bodies."""
+
+import importlib.util
+
+import pytest
+
+from tradestation_python import TradeStation, get_decoder
+from tradestation_python.testing import MockTradeStation
+from tradestation_python.types.responses import (
+    BarsFrame,
+    BarsResponse,
+    PositionsResponse,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+DECODERS = [
+    name
+    for name in ("pydantic", "json", "orjson", "msgspec")
+    if name in ("pydantic", "json") or importlib.util.find_spec(name)
+]
+
+
+@pytest.fixture(scope="module")
+def bars_body() -> bytes:
+    mock = MockTradeStation()
+    ts = mock.client()
+    response = ts._request(
+        "GET", "marketdata/barcharts/MSFT", params={"barsback": "10000"}
+    )
+    return response.content
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+def test_bars_response(benchmark, bars_body: bytes, decoder: str):
+    validate = get_decoder(decoder).validate
+
+    response = benchmark(validate, bars_body, BarsResponse)
+
+    assert len(response.bars) == 10_000
+
+
+def test_bars_frame(benchmark, bars_body: bytes):
+    frame = benchmark(BarsFrame.from_json, bars_body)
+
+    assert len(frame) == 10_000
+
+
+def test_positions_end_to_end(benchmark, ts: TradeStation):
+    accounts = [str(11000000 + i) for i in range(100)]
+
+    response = benchmark(ts.brokerage.positions, accounts)
+
+    assert isinstance(response, PositionsResponse)
+    assert len(response.positions) == 500
@@ -0,0 +1,52 @@
+"""Per-request SDK overhead: a round trip to the zero-latency mock."""
+
+from decimal import Decimal
+
+import pytest
+
+from tradestation_python import TradeStation
+from tradestation_python.resources.order_execution import OrderTemplate
+from tradestation_python.types.enums import OrderType, TradeAction
+from tradestation_python.types.requests import OrderRequest
+
+pytest.importorskip("pytest_benchmark")
+
+ORDER = OrderRequest(
+    account_id="11000000",
+    symbol="MSFT",
+    quantity=100,
+    order_type=OrderType.LIMIT,
+    trade_action=TradeAction.BUY,
+    limit_price=Decimal("410.25"),
+)
+
+
+def test_small_bars_request(benchmark, ts: TradeStation):
+    ts.market_data.bars("MSFT", barsback=1)
+
+    response = benchmark(ts.market_data.bars, "MSFT", barsback=1)
+
+    assert len(response.bars) == 1
+
+
+def test_balances_request(benchmark, ts: TradeStation):
+    response = benchmark(ts.brokerage.balances, "11000000")
+
+    assert response.balances[0].account_id == "11000000"
+
+
+def test_place_order_from_model(benchmark, ts: TradeStation):
+    response = benchmark(ts.order_execution.place, ORDER)
+
+    assert response.orders
+
+
+def test_place_order_from_template(benchmark, ts: TradeStation):
+    template = OrderTemplate(ORDER)
+
+    def place() -> object:
+        return ts.order_execution.place(template.render(limit_price=410.5))
+
+    response = benchmark(place)
+
+    assert response.orders
@@ -0,0 +1,36 @@
+"""Throughput of decoding a bar stream, one open-bar update per line."""
+
+import asyncio
+from itertools import islice
+
+import pytest
+
+from tradestation_python.testing import MockTradeStation
+
+pytest.importorskip("pytest_benchmark")
+
+UPDATES = 10_000
+
+
+def test_stream_bars(benchmark):
+    ts = MockTradeStation(stream_updates=UPDATES).client()
+
+    def consume() -> int:
+        stream = ts.market_data.stream_bars("MSFT", barsback=1)
+        return sum(1 for _ in islice(stream, UPDATES + 1))
+
+    assert benchmark.pedantic(consume, rounds=5) == UPDATES + 1
+
+
+def test_async_stream_bars(benchmark):
+    ts = MockTradeStation(stream_updates=UPDATES).async_client()
+
+    async def consume() -> int:
+        count = 0
+        async for _ in ts.market_data.stream_bars("MSFT", barsback=1):
+            count += 1
+            if count == UPDATES + 1:
+                break
+        return count
+
+    assert benchmark.pedantic(lambda: asyncio.run(consume()), rounds=5) == UPDATES + 1
@@ -1,6 +1,56 @@
+from typing import TYPE_CHECKING
+
+from tradestation_python._lazy import lazy_exports
+
 try:
     from tradestation_python._version import version as __version__
 except ImportError:  # pragma: no cover
     __version__ = "unknown"
 
-from tradestation_python._client import TradeStation  # noqa: F401
+# Submodules are imported on first use, keeping `import tradestation_python`
+# cheap for CLI tools and short-lived processes.
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        "._cache": ["ResponseCache"],
+        "._client": ["AsyncTradeStation", "TradeStation"],
+        "._decoding": [
+            "JSONDecoder",
+            "MsgspecDecoder",
+            "OrjsonDecoder",
+            "PydanticDecoder",
+            "get_decoder",
+        ],
+        "._instrumentation": ["Instrumentation", "RequestRecord"],
+        "._rate_limit": ["RateLimiter"],
+        "._retry": ["RetryPolicy"],
+        "._streaming": ["StreamError"],
+        "._token_store": ["FileTokenStore", "MemoryTokenStore", "TokenStore"],
+    },
+)
+
+if TYPE_CHECKING:
+    from tradestation_python._cache import ResponseCache  # noqa: F401
+    from tradestation_python._client import (  # noqa: F401
+        AsyncTradeStation,
+        TradeStation,
+    )
+    from tradestation_python._decoding import (  # noqa: F401
+        JSONDecoder,
+        MsgspecDecoder,
+        OrjsonDecoder,
+        PydanticDecoder,
+        get_decoder,
+    )
+    from tradestation_python._instrumentation import (  # noqa: F401
+        Instrumentation,
+        RequestRecord,
+    )
+    from tradestation_python._rate_limit import RateLimiter  # noqa: F401
+    from tradestation_python._retry import RetryPolicy  # noqa: F401
+    from tradestation_python._streaming import StreamError  # noqa: F401
+    from tradestation_python._token_store import (  # noqa: F401
+        FileTokenStore,
+        MemoryTokenStore,
+        TokenStore,
+    )
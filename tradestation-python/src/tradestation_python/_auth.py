@@ -1,78 +1,22 @@
 import threading
-import urllib.parse
-from http.server import BaseHTTPRequestHandler, HTTPServer
 from time import time
-from typing import Dict, Generator, List, Optional
-from webbrowser import open_new
+from typing import AsyncGenerator, Generator, List, Optional
 
+import anyio.to_thread
 from httpx import Auth, Request
 from httpx._models import Response
 from pydantic import HttpUrl
 
 from ._base_client import SyncAuthClient
 from ._config import AuthSettings
+from ._discovery import discover_openid
+from ._instrumentation import Instrumentation
+from ._token_store import FileTokenStore, MemoryTokenStore, StoredToken, TokenStore
 from .types.enums.scope import Scope
-from .types.responses import TokenInfo
+from .types.responses import OpenID, TokenInfo
 from .types.responses.token import TokenInfoWithRefresh
 
 
-class AuthHTTPServer(HTTPServer):
-    received_params: Dict[str, str]
-
-    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
-        super().__init__(*args, **kwargs)
-        self.received_params = {}
-
-
-class ParamsHandler(BaseHTTPRequestHandler):
-    sever: AuthHTTPServer
-
-    def do_GET(self) -> None:
-        # Enusre proper type with parameter handling.
-        if not isinstance(self.server, AuthHTTPServer):
-            raise TypeError("Server must be of type `AuthHTTPServer`.")
-
-        # Parse query parameters.
-        parsed_path = urllib.parse.urlparse(self.path)
-        params = urllib.parse.parse_qs(parsed_path.query)
-        self.server.received_params = {k: v[0] for k, v in params.items()}  # flatten
-
-        # Respond to client.
-        self.send_response(200)
-        self.send_header("Content-type", "text/html")
-        self.end_headers()
-        html_response = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Authorization Complete</title>
-        </head>
-        <body>
-            <h2>Authorization successful!</h2>
-            <p>Parameters received. This window will close automatically...</p>
-            <script>
-                // Close the window after a short delay
-                setTimeout(function() {
-                    window.close();
-                }, 2000);
-                
-                // Fallback: try to close immediately for popup windows
-                if (window.opener) {
-                    window.close();
-                }
-            </script>
-        </body>
-        </html>
-        """
-        self.wfile.write(html_response.encode("utf-8"))
-
-        # Shut down the server in a background thread to avoid blocking.
-        threading.Thread(target=self.server.shutdown).start()
-
-    def log_message(self, format: str, *args) -> None:  # noqa: ANN002
-        pass
-
-
 class OAuth2PasswordBearer(SyncAuthClient):
     def __init__(
         self,
@@ -140,11 +84,26 @@ class OAuth2PasswordBearer(SyncAuthClient):
 
         self.refresh_token = self.settings.refresh_token
 
+    @property
+    def openid(self) -> OpenID:
+        """OpenID configuration, discovered once per process over `client`."""
+        return discover_openid(
+            self.base_url,
+            client=self.client,
+            cache_path=self.settings.openid_cache_path,
+            ttl=self.settings.openid_cache_ttl,
+        )
+
     def _get_code(self) -> str:
+        # Only the interactive flow needs a browser and a local HTTP server.
+        from webbrowser import open_new
+
+        from ._redirect_server import AuthHTTPServer, ParamsHandler
+
         # Start authentication flow in a new window.
         scope = " ".join([scope.value for scope in self.scopes])
         auth_url = (
-            f"{self.settings.openid.authorization_endpoint}"
+            f"{self.openid.authorization_endpoint}"
             f"?response_type={self.response_type}"
             f"&client_id={self.client_id}"
             f"&redirect_uri={self.redirect_uri}"
@@ -175,21 +134,27 @@ class OAuth2PasswordBearer(SyncAuthClient):
         else:
             return httpd.received_params["code"]
 
-    def get_token_info(self) -> TokenInfo:
+    def get_token_info(self, code: Optional[str] = None) -> TokenInfo:
+        """
+        Exchange an authorization code, or else the refresh token, for a token.
+
+        Runs the interactive flow for a code when there is neither.
+        """
         data = {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
         }
         headers = {"content-type": "application/x-www-form-urlencoded"}
         info = None
-        if not self.refresh_token:
-            code = self._get_code()
+        if code is not None or not self.refresh_token:
+            if code is None:
+                code = self._get_code()
             data["code"] = code
             data["grant_type"] = "authorization_code"
             data["redirect_uri"] = self.redirect_uri
             info = self._make_request(
                 method="POST",
-                url=self.settings.openid.token_endpoint,
+                url=self.openid.token_endpoint,
                 response_model=TokenInfoWithRefresh,
                 headers=headers,
                 data=data,
@@ -200,27 +165,181 @@ class OAuth2PasswordBearer(SyncAuthClient):
             data["refresh_token"] = self.refresh_token
             info = self._make_request(
                 method="POST",
-                url=self.settings.openid.token_endpoint,
+                url=self.openid.token_endpoint,
                 response_model=TokenInfo,
                 headers=headers,
                 data=data,
+                idempotent=True,
             )
+            # Honour refresh token rotation when the server issues a new one.
+            rotated = getattr(info, "refresh_token", None)
+            if rotated:
+                self.refresh_token = rotated
         return info
 
 
 class TradeStationAuth(Auth):
+    """
+    httpx auth that attaches a bearer token and keeps it fresh.
+
+    Refreshes are single-flight: concurrent requests that find the token
+    expiring wait for one refresh and reuse its result. Once the token is
+    within `refresh_ahead` seconds of expiry, requests keep using it while a
+    background thread fetches the next one, so the request path only blocks
+    on the token endpoint when there is no usable token at all.
+
+    Tokens are kept in `token_store`. Before refreshing, the store is
+    checked for a newer token saved by another client or process, and its
+    refresh token is reused so a restart never needs the interactive flow.
+
+    Both margins shrink for short-lived tokens: the refresh starts no earlier
+    than half way through the token's lifetime, and the buffer is at most
+    half of that, so the background refresh still gets its window.
+
+    Args:
+        buffer_seconds: Treat the token as expired this many seconds early
+        refresh_ahead: Start a background refresh this many seconds before expiry
+        token_store: Where tokens are persisted (default: the file at
+            TS_AUTH_TOKEN_STORE_PATH if set, otherwise memory)
+    """
+
     _token_info: Optional[TokenInfo]
 
-    def __init__(self, buffer_seconds: int = 180) -> None:
-        self.oauth_client = OAuth2PasswordBearer()
+    def __init__(
+        self,
+        buffer_seconds: int = 180,
+        refresh_ahead: int = 600,
+        token_store: Optional[TokenStore] = None,
+    ) -> None:
         self.buffer_seconds = buffer_seconds
+        self.refresh_ahead = refresh_ahead
+        self.refreshes = 0
+        # Set by an instrumented client to count refreshes in its metrics.
+        self.instrumentation: Optional[Instrumentation] = None
+        self._oauth_client: Optional[OAuth2PasswordBearer] = None
+        self._token_store = token_store
         self._token_info = None
+        self._init_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._background_lock = threading.Lock()
+        self._background: Optional[threading.Thread] = None
+
+    @property
+    def oauth_client(self) -> OAuth2PasswordBearer:
+        """The OAuth client, created (and settings read) on the first request."""
+        if self._oauth_client is None:
+            with self._init_lock:
+                if self._oauth_client is None:
+                    self._oauth_client = OAuth2PasswordBearer()
+        return self._oauth_client
+
+    @oauth_client.setter
+    def oauth_client(self, oauth_client: OAuth2PasswordBearer) -> None:
+        self._oauth_client = oauth_client
+
+    @property
+    def token_store(self) -> TokenStore:
+        if self._token_store is None:
+            path = self.oauth_client.settings.token_store_path
+            with self._init_lock:
+                if self._token_store is None:
+                    self._token_store = (
+                        FileTokenStore(path) if path else MemoryTokenStore()
+                    )
+        return self._token_store
+
+    @token_store.setter
+    def token_store(self, token_store: TokenStore) -> None:
+        self._token_store = token_store
+
+    def _refresh_ahead(self, token_info: TokenInfo) -> float:
+        return min(self.refresh_ahead, token_info.expires_in / 2)
+
+    def _is_expiring(self, token_info: TokenInfo) -> bool:
+        buffer = min(self.buffer_seconds, self._refresh_ahead(token_info) / 2)
+        return int(time()) >= token_info.expires_at - buffer
+
+    def _is_stale(self, token_info: TokenInfo) -> bool:
+        return int(time()) >= token_info.expires_at - self._refresh_ahead(token_info)
+
+    def _refresh(self, stale: Optional[TokenInfo]) -> TokenInfo:
+        """Replace `stale` with a new token unless another caller already did."""
+        with self._lock:
+            with self.token_store.lock():
+                token_info = self._reuse(stale)
+                if token_info is not None:
+                    return token_info
+                if self.oauth_client.refresh_token:
+                    return self._fetch()
+            # The interactive flow waits on a person, so it runs without the
+            # store lock that other clients and processes block on.
+            code = self.oauth_client._get_code()
+            with self.token_store.lock():
+                token_info = self._reuse(stale)
+                if token_info is not None:
+                    return token_info
+                return self._fetch(code)
+
+    def _reuse(self, stale: Optional[TokenInfo]) -> Optional[TokenInfo]:
+        """A token newer than `stale`, from this client or the store, if any."""
+        token_info = self._token_info
+        if token_info is not None and token_info is not stale:
+            return token_info
+        stored = self.token_store.load()
+        if stored is not None:
+            if stored.refresh_token:
+                self.oauth_client.refresh_token = stored.refresh_token
+            if not self._is_stale(stored.token_info):
+                self._token_info = stored.token_info
+                return stored.token_info
+        return None
+
+    def _fetch(self, code: Optional[str] = None) -> TokenInfo:
+        token_info = self._token_info = self.oauth_client.get_token_info(code)
+        self.refreshes += 1
+        if self.instrumentation is not None:
+            self.instrumentation.record_auth_refresh()
+        self.token_store.save(StoredToken(token_info, self.oauth_client.refresh_token))
+        return token_info
+
+    def _refresh_in_background(self, stale: TokenInfo) -> None:
+        with self._background_lock:
+            if self._background is not None and self._background.is_alive():
+                return
+            self._background = threading.Thread(
+                target=self._refresh_quietly,
+                args=(stale,),
+                name="tradestation-token-refresh",
+                daemon=True,
+            )
+            self._background.start()
+
+    def _refresh_quietly(self, stale: TokenInfo) -> None:
+        try:
+            self._refresh(stale)
+        except Exception:
+            # The current token is still valid; requests retry the refresh in
+            # the foreground once it is about to expire.
+            pass
 
     def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
-        if (
-            self._token_info is None
-            or int(time()) >= self._token_info.expires_at + self.buffer_seconds
-        ):
-            self._token_info = self.oauth_client.get_token_info()
-        request.headers["Authorization"] = f"Bearer {self._token_info.access_token}"
+        token_info = self._token_info
+        if token_info is None or self._is_expiring(token_info):
+            token_info = self._refresh(token_info)
+        elif self._is_stale(token_info):
+            self._refresh_in_background(token_info)
+        request.headers["Authorization"] = f"Bearer {token_info.access_token}"
+        yield request
+
+    async def async_auth_flow(
+        self, request: Request
+    ) -> AsyncGenerator[Request, Response]:
+        token_info = self._token_info
+        if token_info is None or self._is_expiring(token_info):
+            # The token endpoint (and the interactive code flow) is blocking, so
+            # run it in a worker thread to keep the event loop responsive.
+            token_info = await anyio.to_thread.run_sync(self._refresh, token_info)
+        elif self._is_stale(token_info):
+            self._refresh_in_background(token_info)
+        request.headers["Authorization"] = f"Bearer {token_info.access_token}"
         yield request
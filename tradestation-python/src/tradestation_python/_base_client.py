@@ -1,14 +1,40 @@
+import threading
 from abc import ABC
+from contextlib import asynccontextmanager, contextmanager
+from time import perf_counter
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import httpx
 from pydantic import BaseModel
 
+from ._cache import ResponseCache
+from ._decoding import JSONDecoder, PydanticDecoder
+from ._instrumentation import Instrumentation
+from ._rate_limit import RateLimiter
+from ._retry import (
+    RetryPolicy,
+    RetryStats,
+    asend_with_retries,
+    send_with_retries,
+)
 from .types.enums import Scope
 
 ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
 
+# Parsed endpoint URLs kept per client before the cache is cleared.
+MAX_CACHED_URLS = 1024
+
 
 class BaseAuthClient(ABC):
     """Abstract base class for Auth clients."""
@@ -36,6 +62,8 @@ class BaseAuthClient(ABC):
         self.scopes = scopes
         self.timeout = timeout
         self.retries = retries
+        self.retry_policy = RetryPolicy(retries=retries)
+        self.retry_stats = RetryStats()
 
 
 class SyncAuthClient(BaseAuthClient):
@@ -43,7 +71,19 @@ class SyncAuthClient(BaseAuthClient):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
         super().__init__(*args, **kwargs)
-        self.client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled HTTP client, created on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url, timeout=self.timeout
+                    )
+        return self._client
 
     def _make_request(
         self,
@@ -54,6 +94,7 @@ class SyncAuthClient(BaseAuthClient):
         json: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
     ) -> ResponseModel:
         """Make HTTP request with automatic Pydantic validation."""
         request_kwargs = {}
@@ -66,10 +107,13 @@ class SyncAuthClient(BaseAuthClient):
         if headers:
             request_kwargs["headers"] = headers
 
-        response = self.client.request(
-            method, url, follow_redirects=True, **request_kwargs
+        response = send_with_retries(
+            lambda: self.client.request(
+                method, url, follow_redirects=True, **request_kwargs
+            ),
+            self.retry_policy.begin(method, idempotent),
+            self.retry_stats,
         )
-        response.raise_for_status()
 
         return response_model.model_validate(response.json())
 
@@ -82,7 +126,8 @@ class SyncAuthClient(BaseAuthClient):
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        self.client.close()
+        if self._client is not None:
+            self._client.close()
 
 
 class BaseAPIClient(ABC):
@@ -93,12 +138,31 @@ class BaseAPIClient(ABC):
         base_url: str,
         api_key: Optional[str] = None,
         auth: Optional[httpx.Auth] = None,
-        timeout: float = 30.0,
+        timeout: Union[float, httpx.Timeout] = 30.0,
         retries: int = 3,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        decoder: Optional[JSONDecoder] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.retries = retries
+        self.limits = limits if limits is not None else httpx.Limits()
+        self.http2 = http2
+        if retry_policy is None:
+            retry_policy = RetryPolicy(retries=retries)
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.instrumentation = instrumentation
+        self.decoder = decoder if decoder is not None else PydanticDecoder()
+
+        self._urls: Dict[str, httpx.URL] = {}
 
         self.headers = {"Content-Type": "application/json"}
         if api_key:
@@ -106,18 +170,107 @@ class BaseAPIClient(ABC):
 
         self.auth = auth
 
+    def _url(self, endpoint: str) -> httpx.URL:
+        """
+        Return the absolute URL of an endpoint, parsed once and reused.
+
+        httpx re-parses string URLs on every request, which is a noticeable
+        share of the per-request overhead on hot paths like order placement.
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            if len(self._urls) >= MAX_CACHED_URLS:
+                self._urls.clear()
+            url = httpx.URL(f"{self.base_url}/{endpoint.lstrip('/')}")
+            self._urls[endpoint] = url
+        return url
+
+    def _validate(
+        self, endpoint: str, response_model: Type[ResponseModel], content: bytes
+    ) -> ResponseModel:
+        """
+        Decode and validate a raw JSON body with `decoder`.
+
+        When instrumented, one-pass decoders report their combined time as
+        the `validate` phase; others report `decode` and `validate` apart.
+        """
+        decoder = self.decoder
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return decoder.validate(content, response_model)
+        started = perf_counter()
+        if decoder.one_pass:
+            model = decoder.validate(content, response_model)
+        else:
+            payload = decoder.loads(content)
+            decoded = perf_counter()
+            model = response_model.model_validate(payload)
+            instrumentation.observe(endpoint, "decode", decoded - started)
+            started = decoded
+        instrumentation.observe(endpoint, "validate", perf_counter() - started)
+        return model
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """An injected transport, left open for its owner when the client closes."""
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class _AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of `_SharedTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
 
 class SyncAPIClient(BaseAPIClient):
     """Synchronous HTTP API client."""
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        transport: Optional[httpx.BaseTransport] = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
         super().__init__(*args, **kwargs)
-        self.client = httpx.Client(
-            base_url=self.base_url,
-            headers=self.headers,
-            auth=self.auth,
-            timeout=self.timeout,
-        )
+        self._transport = transport
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled HTTP client, created on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        headers=self.headers,
+                        auth=self.auth,
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=self.http2,
+                        transport=(
+                            None
+                            if self._transport is None
+                            else _SharedTransport(self._transport)
+                        ),
+                    )
+        return self._client
 
     def _make_request(
         self,
@@ -127,25 +280,130 @@ class SyncAPIClient(BaseAPIClient):
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
     ) -> ResponseModel:
-        """Make HTTP request with automatic Pydantic validation."""
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        """
+        Make HTTP request with automatic Pydantic validation.
+
+        GET requests to endpoints with a TTL in `response_cache` are served
+        from the cache, with concurrent misses sharing one request.
+        """
+        ttl = None
+        if self.response_cache is not None and method.upper() == "GET":
+            ttl = self.response_cache.ttl_for(endpoint)
+        if self.response_cache is None or ttl is None:
+            response = self._request(
+                method,
+                endpoint,
+                params=params,
+                json=json,
+                data=data,
+                content=content,
+                headers=headers,
+                idempotent=idempotent,
+            )
+            return self._validate(endpoint, response_model, response.content)
+
+        def load() -> bytes:
+            response = self._request(
+                method, endpoint, params=params, headers=headers, idempotent=idempotent
+            )
+            return response.content
+
+        content = self.response_cache.fetch(
+            self.response_cache.key(endpoint, params), ttl, load
+        )
+        return self._validate(endpoint, response_model, content)
 
-        request_kwargs = {}
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+    ) -> httpx.Response:
+        """
+        Make HTTP request and return the raw, status-checked response.
+
+        Failed attempts are retried according to `retry_policy`. Pass
+        `idempotent` to override the method-based default for this request.
+        A pre-serialized JSON body can be passed as `content`.
+        """
+        url = self._url(endpoint)
+
+        request_kwargs: Dict[str, Any] = {}
         if params:
             request_kwargs["params"] = params
         if json:
             request_kwargs["json"] = json
         if data:
             request_kwargs["data"] = data
+        if content is not None:
+            request_kwargs["content"] = content
         if headers:
             request_kwargs["headers"] = headers
 
-        response = self.client.request(method, url, **request_kwargs)
-        response.raise_for_status()
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+
+            def send() -> httpx.Response:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(endpoint)
+                return self.client.request(method, url, **request_kwargs)
+
+            return send_with_retries(
+                send, self.retry_policy.begin(method, idempotent), self.retry_stats
+            )
+
+        record = instrumentation.start(method, endpoint)
+
+        def send_instrumented() -> httpx.Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            request = self.client.build_request(
+                method, url, extensions={"trace": record.trace}, **request_kwargs
+            )
+            response = self.client.send(instrumentation.attempt(record, request))
+            instrumentation.received(record, response)
+            return response
+
+        try:
+            response = send_with_retries(
+                send_instrumented,
+                self.retry_policy.begin(method, idempotent),
+                self.retry_stats,
+            )
+        except BaseException as exc:
+            instrumentation.finish(record, exc)
+            raise
+        instrumentation.finish(record)
+        return response
+
+    @contextmanager
+    def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Open a streaming request and yield the status-checked response.
 
-        return response_model.model_validate(response.json())
+        The body is not read up front, so callers can consume it
+        incrementally. Reconnecting is left to the caller.
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+        with self.client.stream(method, url, params=params) as response:
+            response.raise_for_status()
+            yield response
 
     def __enter__(self) -> "SyncAPIClient":
         return self
@@ -156,45 +414,186 @@ class SyncAPIClient(BaseAPIClient):
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        self.client.close()
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connection pool.
+
+        An injected transport may be shared with other clients, so it is left
+        for its owner to close.
+        """
+        if self._client is not None:
+            self._client.close()
 
 
 class AsyncAPIClient(BaseAPIClient):
     """Asynchronous HTTP API client."""
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
         super().__init__(*args, **kwargs)
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=self.timeout
-        )
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client, created on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.base_url,
+                        headers=self.headers,
+                        auth=self.auth,
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=self.http2,
+                        transport=(
+                            None
+                            if self._transport is None
+                            else _AsyncSharedTransport(self._transport)
+                        ),
+                    )
+        return self._client
 
     async def _make_request(
         self,
         method: str,
         endpoint: str,
-        response_model: type[BaseModel],
+        response_model: Type[ResponseModel],
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> BaseModel:
-        """Make async HTTP request with automatic Pydantic validation."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        idempotent: Optional[bool] = None,
+    ) -> ResponseModel:
+        """
+        Make async HTTP request with automatic Pydantic validation.
+
+        GET requests to endpoints with a TTL in `response_cache` are served
+        from the cache, with concurrent misses sharing one request.
+        """
+        ttl = None
+        if self.response_cache is not None and method.upper() == "GET":
+            ttl = self.response_cache.ttl_for(endpoint)
+        if self.response_cache is None or ttl is None:
+            response = await self._request(
+                method,
+                endpoint,
+                params=params,
+                json=json,
+                data=data,
+                content=content,
+                headers=headers,
+                idempotent=idempotent,
+            )
+            return self._validate(endpoint, response_model, response.content)
+
+        async def load() -> bytes:
+            response = await self._request(
+                method, endpoint, params=params, headers=headers, idempotent=idempotent
+            )
+            return response.content
+
+        content = await self.response_cache.afetch(
+            self.response_cache.key(endpoint, params), ttl, load
+        )
+        return self._validate(endpoint, response_model, content)
 
-        request_kwargs = {}
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+    ) -> httpx.Response:
+        """
+        Make async HTTP request and return the raw, status-checked response.
+
+        Failed attempts are retried according to `retry_policy`. Pass
+        `idempotent` to override the method-based default for this request.
+        A pre-serialized JSON body can be passed as `content`.
+        """
+        url = self._url(endpoint)
+
+        request_kwargs: Dict[str, Any] = {}
         if params:
             request_kwargs["params"] = params
         if json:
             request_kwargs["json"] = json
         if data:
             request_kwargs["data"] = data
+        if content is not None:
+            request_kwargs["content"] = content
         if headers:
             request_kwargs["headers"] = headers
 
-        response = await self.client.request(method, url, **request_kwargs)
-        response.raise_for_status()
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+
+            async def send() -> httpx.Response:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire(endpoint)
+                return await self.client.request(method, url, **request_kwargs)
+
+            return await asend_with_retries(
+                send, self.retry_policy.begin(method, idempotent), self.retry_stats
+            )
+
+        record = instrumentation.start(method, endpoint)
+
+        async def send_instrumented() -> httpx.Response:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire(endpoint)
+            request = self.client.build_request(
+                method, url, extensions={"trace": record.atrace}, **request_kwargs
+            )
+            response = await self.client.send(instrumentation.attempt(record, request))
+            instrumentation.received(record, response)
+            return response
+
+        try:
+            response = await asend_with_retries(
+                send_instrumented,
+                self.retry_policy.begin(method, idempotent),
+                self.retry_stats,
+            )
+        except BaseException as exc:
+            instrumentation.finish(record, exc)
+            raise
+        instrumentation.finish(record)
+        return response
+
+    @asynccontextmanager
+    async def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Open an async streaming request and yield the status-checked response.
 
-        return response_model.model_validate(response.json())
+        The body is not read up front, so callers can consume it
+        incrementally. Reconnecting is left to the caller.
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(endpoint)
+        async with self.client.stream(method, url, params=params) as response:
+            response.raise_for_status()
+            yield response
 
     async def __aenter__(self) -> "AsyncAPIClient":
         return self
@@ -205,4 +604,14 @@ class AsyncAPIClient(BaseAPIClient):
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        await self.client.aclose()
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the connection pool.
+
+        An injected transport may be shared with other clients, so it is left
+        for its owner to close.
+        """
+        if self._client is not None:
+            await self._client.aclose()
@@ -0,0 +1,247 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from time import monotonic
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+import anyio
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _Entry(NamedTuple):
+    content: bytes
+    expires: float
+
+
+class _Flight:
+    """One in-progress async load that other tasks can wait on."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.content: Optional[bytes] = None
+        self.error: Optional[BaseException] = None
+
+
+class CacheStats:
+    """Hit/miss counters for a ResponseCache."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(hits={self.hits}, misses={self.misses}, "
+            f"coalesced={self.coalesced}, evictions={self.evictions}, "
+            f"expirations={self.expirations})"
+        )
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of raw response bodies with per-endpoint TTLs.
+
+    Only endpoints with a configured TTL are cached; the longest matching
+    prefix wins. Concurrent misses for the same key are coalesced so a single
+    HTTP request is in flight and every caller shares its result. Entries are
+    evicted least recently used first once either `maxsize` or `max_bytes` is
+    exceeded.
+
+    Args:
+        ttls: Mapping of endpoint prefix (e.g. `brokerage/accounts`) to the
+            number of seconds a response stays fresh
+        maxsize: Maximum number of cached responses
+        max_bytes: Maximum total size of the cached response bodies
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float],
+        maxsize: int = 256,
+        max_bytes: int = 8 * 1024 * 1024,
+    ) -> None:
+        # Longest prefixes first so the most specific TTL wins.
+        self.ttls = dict(
+            sorted(
+                ((prefix.strip("/"), ttl) for prefix, ttl in ttls.items()),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[CacheKey, "Future[bytes]"] = {}
+        self._ainflight: Dict[CacheKey, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """Return the TTL configured for `endpoint`, or None if not cached."""
+        path = endpoint.strip("/")
+        for prefix, ttl in self.ttls.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                return ttl
+        return None
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Mapping[str, Any]] = None) -> CacheKey:
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return endpoint.strip("/"), items
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        """Return the fresh cached body for `key`, counting a hit or miss."""
+        with self._lock:
+            content = self._lookup(key)
+            if content is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+            return content
+
+    def set(self, key: CacheKey, content: bytes, ttl: float) -> None:
+        with self._lock:
+            self._store(key, content, ttl)
+
+    def invalidate(self, endpoint: Optional[str] = None) -> int:
+        """
+        Drop cached responses for `endpoint` and everything below it.
+
+        Clears the whole cache when `endpoint` is None. Returns the number of
+        entries removed.
+        """
+        with self._lock:
+            if endpoint is None:
+                keys = list(self._entries)
+            else:
+                prefix = endpoint.strip("/")
+                keys = [
+                    key
+                    for key in self._entries
+                    if key[0] == prefix or key[0].startswith(prefix + "/")
+                ]
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def fetch(self, key: CacheKey, ttl: float, load: Callable[[], bytes]) -> bytes:
+        """Return the cached body for `key`, calling `load` once on a miss."""
+        with self._lock:
+            content = self._lookup(key)
+            if content is not None:
+                self.stats.hits += 1
+                return content
+            flight = self._inflight.get(key)
+            if flight is None:
+                self.stats.misses += 1
+                flight = self._inflight[key] = Future()
+                leader = True
+            else:
+                self.stats.coalesced += 1
+                leader = False
+
+        if not leader:
+            return flight.result()
+
+        try:
+            content = load()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            flight.set_exception(exc)
+            raise
+        with self._lock:
+            self._store(key, content, ttl)
+            del self._inflight[key]
+        flight.set_result(content)
+        return content
+
+    async def afetch(
+        self, key: CacheKey, ttl: float, load: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """Async counterpart of `fetch`."""
+        with self._lock:
+            content = self._lookup(key)
+            if content is not None:
+                self.stats.hits += 1
+                return content
+            flight = self._ainflight.get(key)
+            if flight is None:
+                self.stats.misses += 1
+                flight = self._ainflight[key] = _Flight()
+                leader = True
+            else:
+                self.stats.coalesced += 1
+                leader = False
+
+        if not leader:
+            await flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            if flight.content is None:
+                # The leading task was cancelled; take over the load.
+                return await self.afetch(key, ttl, load)
+            return flight.content
+
+        try:
+            content = await load()
+        except Exception as exc:
+            flight.error = exc
+            raise
+        else:
+            flight.content = content
+            with self._lock:
+                self._store(key, content, ttl)
+        finally:
+            with self._lock:
+                del self._ainflight[key]
+            flight.done.set()
+        return content
+
+    def _lookup(self, key: CacheKey) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= monotonic():
+            self._discard(key)
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry.content
+
+    def _store(self, key: CacheKey, content: bytes, ttl: float) -> None:
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = _Entry(content, monotonic() + ttl)
+        self._size += len(content)
+        while len(self._entries) > self.maxsize or self._size > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def _discard(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.content)
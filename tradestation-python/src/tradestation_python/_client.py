@@ -1,23 +1,46 @@
 from functools import cached_property
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-from httpx import Auth
+from httpx import AsyncBaseTransport, Auth, BaseTransport, Limits, Timeout
 
 from ._auth import TradeStationAuth
 from ._base_client import AsyncAPIClient, SyncAPIClient
+from ._cache import ResponseCache
 from ._config import APISettings
-from .resources import Brokerage, MarketData, OrderExecution
+from ._decoding import JSONDecoder, get_decoder
+from ._instrumentation import Instrumentation
+from ._rate_limit import RateLimiter
+from ._retry import RetryPolicy
 
+if TYPE_CHECKING:
+    # Resources are imported when first used, so a client only loads the
+    # endpoint modules it actually calls.
+    from .resources.brokerage import AsyncBrokerage, Brokerage
+    from .resources.market_data import AsyncMarketData, MarketData
+    from .resources.order_execution import AsyncOrderExecution, OrderExecution
 
-class TradeStation(SyncAPIClient):
-    def __init__(
-        self,
-        base_url: Optional[str] = None,
-        api_key: Optional[str] = None,
-        auth: Optional[Auth] = None,
-        timeout: Optional[float] = None,
-        retries: Optional[int] = None,
-    ) -> None:
+
+class _TradeStationClient:
+    """Settings and auth wiring shared by the sync and async clients."""
+
+    _tradestation_auth: Auth
+
+    @staticmethod
+    def _options(
+        base_url: Optional[str],
+        api_key: Optional[str],
+        auth: Optional[Auth],
+        timeout: Optional[Union[float, Timeout]],
+        retries: Optional[int],
+        retry_policy: Optional[RetryPolicy],
+        rate_limiter: Optional[RateLimiter],
+        response_cache: Optional[ResponseCache],
+        limits: Optional[Limits],
+        http2: Optional[bool],
+        instrumentation: Optional[Instrumentation],
+        decoder: Optional[JSONDecoder],
+    ) -> Dict[str, Any]:
+        """Fill unset options from `APISettings`, as base client arguments."""
         settings = APISettings()
         if base_url is None:
             base_url = settings.base_url
@@ -26,39 +49,157 @@ class TradeStation(SyncAPIClient):
         if auth is None:
             auth = TradeStationAuth()
         if timeout is None:
-            timeout = settings.timeout
+            timeout = settings.http_timeout()
         if retries is None:
             retries = settings.retries
+        if limits is None:
+            limits = settings.http_limits()
+        if http2 is None:
+            http2 = settings.http2
+        if retry_policy is None:
+            retry_policy = RetryPolicy(
+                retries=retries,
+                backoff_factor=settings.backoff_factor,
+                max_backoff=settings.max_backoff,
+                deadline=settings.retry_deadline,
+            )
+        if decoder is None:
+            decoder = get_decoder(settings.json_decoder)
+        if rate_limiter is None and settings.rate_limits:
+            rate_limiter = RateLimiter(settings.rate_limits)
+        if response_cache is None and settings.cache_ttls:
+            response_cache = ResponseCache(
+                settings.cache_ttls,
+                maxsize=settings.cache_maxsize,
+                max_bytes=settings.cache_max_bytes,
+            )
+
+        if instrumentation is not None and isinstance(auth, TradeStationAuth):
+            auth.instrumentation = instrumentation
+        return {
+            "base_url": base_url,
+            "api_key": api_key,
+            "auth": auth,
+            "timeout": timeout,
+            "retries": retries,
+            "limits": limits,
+            "http2": http2,
+            "retry_policy": retry_policy,
+            "rate_limiter": rate_limiter,
+            "response_cache": response_cache,
+            "instrumentation": instrumentation,
+            "decoder": decoder,
+        }
+
+    @property
+    def tradestation_auth(self) -> TradeStationAuth:
+        """Return the TradeStationAuth instance."""
+        if not isinstance(self._tradestation_auth, TradeStationAuth):
+            raise TypeError("Auth must be an instance of TradeStationAuth")
+        return self._tradestation_auth
 
-        super().__init__(
+
+class TradeStation(_TradeStationClient, SyncAPIClient):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        auth: Optional[Auth] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        retries: Optional[int] = None,
+        transport: Optional[BaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        limits: Optional[Limits] = None,
+        http2: Optional[bool] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        decoder: Optional[JSONDecoder] = None,
+    ) -> None:
+        options = self._options(
             base_url=base_url,
             api_key=api_key,
             auth=auth,
             timeout=timeout,
             retries=retries,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            limits=limits,
+            http2=http2,
+            instrumentation=instrumentation,
+            decoder=decoder,
         )
-        self._tradestation_auth = auth
+        super().__init__(transport=transport, **options)
+        self._tradestation_auth = options["auth"]
 
     @cached_property
-    def brokerage(self) -> Brokerage:
+    def brokerage(self) -> "Brokerage":
+        from .resources.brokerage import Brokerage
+
         return Brokerage(self)
 
     @cached_property
-    def market_data(self) -> MarketData:
+    def market_data(self) -> "MarketData":
+        from .resources.market_data import MarketData
+
         return MarketData(self)
 
     @cached_property
-    def order_execution(self) -> OrderExecution:
+    def order_execution(self) -> "OrderExecution":
+        from .resources.order_execution import OrderExecution
+
         return OrderExecution(self)
 
-    @property
-    def tradestation_auth(self) -> TradeStationAuth:
-        """Return the TradeStationAuth instance."""
-        if not isinstance(self._tradestation_auth, TradeStationAuth):
-            raise TypeError("Auth must be an instance of TradeStationAuth")
-        return self._tradestation_auth
 
+class AsyncTradeStation(_TradeStationClient, AsyncAPIClient):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        auth: Optional[Auth] = None,
+        timeout: Optional[Union[float, Timeout]] = None,
+        retries: Optional[int] = None,
+        transport: Optional[AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        limits: Optional[Limits] = None,
+        http2: Optional[bool] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        decoder: Optional[JSONDecoder] = None,
+    ) -> None:
+        options = self._options(
+            base_url=base_url,
+            api_key=api_key,
+            auth=auth,
+            timeout=timeout,
+            retries=retries,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            limits=limits,
+            http2=http2,
+            instrumentation=instrumentation,
+            decoder=decoder,
+        )
+        super().__init__(transport=transport, **options)
+        self._tradestation_auth = options["auth"]
+
+    @cached_property
+    def brokerage(self) -> "AsyncBrokerage":
+        from .resources.brokerage import AsyncBrokerage
+
+        return AsyncBrokerage(self)
+
+    @cached_property
+    def market_data(self) -> "AsyncMarketData":
+        from .resources.market_data import AsyncMarketData
+
+        return AsyncMarketData(self)
+
+    @cached_property
+    def order_execution(self) -> "AsyncOrderExecution":
+        from .resources.order_execution import AsyncOrderExecution
 
-class AsyncTradeStation(AsyncAPIClient):
-    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
-        super().__init__(*args, **kwargs)
+        return AsyncOrderExecution(self)
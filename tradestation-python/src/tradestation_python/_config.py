@@ -1,11 +1,12 @@
 from functools import cached_property
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from uuid import uuid4
 
-from httpx import Client
+import httpx
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from ._discovery import DEFAULT_TTL, discover_openid
 from .types.responses import OpenID
 
 
@@ -18,6 +19,52 @@ class APISettings(BaseSettings):
     api_key: Optional[str] = None
     timeout: float = 30.0
     retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    retry_deadline: Optional[float] = None
+    # Client-side (requests, period_seconds) budgets per endpoint group. Off by
+    # default; opt in with e.g. TS_API_RATE_LIMITS='{"bars": [500, 300]}'.
+    rate_limits: Dict[str, Tuple[int, float]] = {}
+    # Seconds to cache GET responses per endpoint prefix; a prefix also covers
+    # every endpoint below it. Off by default, since cached account data can
+    # be stale: opt in with e.g. TS_API_CACHE_TTLS='{"brokerage/accounts": 60}'.
+    cache_ttls: Dict[str, float] = {}
+    cache_maxsize: int = 256
+    cache_max_bytes: int = 8 * 1024 * 1024
+    # JSON decode backend: "pydantic" (one pass over the raw bytes), "json",
+    # or "orjson"/"msgspec" when their extras are installed.
+    json_decoder: str = "pydantic"
+    # Connection pool. HTTP/2 needs the `http2` extra (TS_API_HTTP2=true).
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+    # Per-phase timeouts; phases left unset fall back to `timeout`.
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    write_timeout: Optional[float] = None
+    pool_timeout: Optional[float] = None
+
+    def http_timeout(self) -> httpx.Timeout:
+        """Build the httpx timeout configuration."""
+
+        def phase(value: Optional[float]) -> float:
+            return self.timeout if value is None else value
+
+        return httpx.Timeout(
+            connect=phase(self.connect_timeout),
+            read=phase(self.read_timeout),
+            write=phase(self.write_timeout),
+            pool=phase(self.pool_timeout),
+        )
+
+    def http_limits(self) -> httpx.Limits:
+        """Build the httpx connection pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
 
 
 class AuthSettings(BaseSettings):
@@ -34,11 +81,17 @@ class AuthSettings(BaseSettings):
     retries: int = 3
     state: str = Field(default=str(uuid4()))
     refresh_token: Optional[str] = None
+    # JSON file where tokens are persisted and shared between processes.
+    token_store_path: Optional[str] = None
+    # Optional JSON file caching OpenID discovery across processes.
+    openid_cache_path: Optional[str] = None
+    openid_cache_ttl: float = DEFAULT_TTL
 
     @computed_field
     @cached_property
     def openid(self) -> OpenID:
-        with Client() as client:
-            response = client.get(f"{self.base_url}/.well-known/openid-configuration")
-            config = OpenID(**response.json())
-            return config
+        return discover_openid(
+            self.base_url,
+            cache_path=self.openid_cache_path,
+            ttl=self.openid_cache_ttl,
+        )
@@ -0,0 +1,113 @@
+import json
+from typing import Any, Callable, Dict, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+try:
+    from pydantic_core import from_json as _pydantic_loads
+except ImportError:  # pragma: no cover - pydantic-core < 2.14
+    _pydantic_loads = json.loads  # type: ignore[assignment]
+
+Model = TypeVar("Model", bound=BaseModel)
+
+
+class JSONDecoder:
+    """
+    Decode response bodies with the standard library `json` module.
+
+    Subclasses swap in a faster parser by overriding `loads`, or, when
+    `one_pass` is set, parse and validate in a single step in `validate`.
+    """
+
+    name = "json"
+    # Whether `validate` parses and validates together, without a separate
+    # Python object tree that could be timed on its own.
+    one_pass = False
+
+    def loads(self, content: Union[str, bytes]) -> Any:  # noqa: ANN401
+        """Parse a JSON document into Python objects."""
+        return json.loads(content)
+
+    def validate(
+        self, content: Union[str, bytes], response_model: Type[Model]
+    ) -> Model:
+        """Parse a JSON document into `response_model`."""
+        return response_model.model_validate(self.loads(content))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class PydanticDecoder(JSONDecoder):
+    """Validate raw bytes with `model_validate_json`, skipping the dict tree."""
+
+    name = "pydantic"
+    one_pass = True
+
+    def loads(self, content: Union[str, bytes]) -> Any:  # noqa: ANN401
+        return _pydantic_loads(content)
+
+    def validate(
+        self, content: Union[str, bytes], response_model: Type[Model]
+    ) -> Model:
+        return response_model.model_validate_json(content)
+
+
+class OrjsonDecoder(JSONDecoder):
+    """Parse with orjson (`pip install tradestation-python[orjson]`)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as exc:
+            raise ImportError(
+                "The orjson decoder needs orjson: "
+                "pip install 'tradestation-python[orjson]'"
+            ) from exc
+        self._loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+
+    def loads(self, content: Union[str, bytes]) -> Any:  # noqa: ANN401
+        return self._loads(content)
+
+
+class MsgspecDecoder(JSONDecoder):
+    """Parse with msgspec (`pip install tradestation-python[msgspec]`)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        try:
+            import msgspec  # type: ignore[import-not-found]
+        except ImportError as exc:
+            raise ImportError(
+                "The msgspec decoder needs msgspec: "
+                "pip install 'tradestation-python[msgspec]'"
+            ) from exc
+        self._loads: Callable[[Union[str, bytes]], Any] = msgspec.json.Decoder().decode
+
+    def loads(self, content: Union[str, bytes]) -> Any:  # noqa: ANN401
+        return self._loads(content)
+
+
+DECODERS: Dict[str, Type[JSONDecoder]] = {
+    decoder.name: decoder
+    for decoder in (PydanticDecoder, JSONDecoder, OrjsonDecoder, MsgspecDecoder)
+}
+
+
+def get_decoder(name: str) -> JSONDecoder:
+    """
+    Return a decoder by backend name.
+
+    Args:
+        name: One of "pydantic", "json", "orjson" or "msgspec"
+    """
+    try:
+        decoder = DECODERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON decoder {name!r}, expected one of {sorted(DECODERS)}"
+        ) from None
+    return decoder()
@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from time import time
+from typing import Dict, Optional, Tuple, Union
+
+import httpx
+
+from .types.responses import OpenID
+
+OPENID_CONFIGURATION = ".well-known/openid-configuration"
+DEFAULT_TTL = 24 * 60 * 60.0
+
+# Discovery documents fetched by this process, keyed by issuer base URL.
+_cache: Dict[str, Tuple[OpenID, float]] = {}
+_lock = threading.Lock()
+
+
+def discover_openid(
+    base_url: str,
+    client: Optional[httpx.Client] = None,
+    cache_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ttl: float = DEFAULT_TTL,
+) -> OpenID:
+    """
+    Return the OpenID configuration of an issuer, fetching it at most once.
+
+    Results are cached for the whole process and, when `cache_path` is set,
+    in a JSON file that later processes read instead of the network.
+    Concurrent callers wait for a single fetch.
+
+    Args:
+        base_url: The issuer base URL
+        client: HTTP client to fetch with, reusing its connection pool
+            (default: a short-lived client)
+        cache_path: Optional file used to share the document across processes
+        ttl: Seconds a cached document stays valid (default: one day)
+    """
+    base_url = base_url.rstrip("/")
+    with _lock:
+        cached = _cache.get(base_url)
+        if cached is not None and time() - cached[1] < ttl:
+            return cached[0]
+
+        if cache_path is not None:
+            cached = _read(Path(cache_path), base_url)
+            if cached is not None and time() - cached[1] < ttl:
+                _cache[base_url] = cached
+                return cached[0]
+
+        config = _fetch(base_url, client)
+        fetched_at = time()
+        _cache[base_url] = (config, fetched_at)
+        if cache_path is not None:
+            _write(Path(cache_path), base_url, config, fetched_at)
+        return config
+
+
+def clear_openid_cache() -> None:
+    """Forget every discovery document cached in this process."""
+    with _lock:
+        _cache.clear()
+
+
+def _fetch(base_url: str, client: Optional[httpx.Client]) -> OpenID:
+    url = f"{base_url}/{OPENID_CONFIGURATION}"
+    if client is None:
+        with httpx.Client() as client:
+            response = client.get(url)
+    else:
+        response = client.get(url)
+    response.raise_for_status()
+    return OpenID.model_validate(response.json())
+
+
+def _read(path: Path, base_url: str) -> Optional[Tuple[OpenID, float]]:
+    try:
+        data = json.loads(path.read_text())
+        if data["base_url"] != base_url:
+            return None
+        return OpenID.model_validate(data["config"]), float(data["fetched_at"])
+    except (FileNotFoundError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _write(path: Path, base_url: str, config: OpenID, fetched_at: float) -> None:
+    data = {
+        "base_url": base_url,
+        "fetched_at": fetched_at,
+        "config": config.model_dump(),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
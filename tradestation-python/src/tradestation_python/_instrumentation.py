@@ -0,0 +1,313 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from ._rate_limit import endpoint_group
+
+# Latency buckets in seconds, upper bounds of the cumulative histogram.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Endpoint templates used as metric labels, so symbols and account IDs do not
+# create a new time series each. `{}` matches any single path segment.
+ROUTES: Tuple[str, ...] = (
+    "marketdata/barcharts/{}",
+    "marketdata/stream/barcharts/{}",
+    "marketdata/quotes/{}",
+    "marketdata/stream/quotes/{}",
+    "marketdata/symbols/{}",
+    "brokerage/accounts",
+    "brokerage/accounts/{}/balances",
+    "brokerage/accounts/{}/bodbalances",
+    "brokerage/accounts/{}/positions",
+    "brokerage/accounts/{}/orders",
+    "brokerage/accounts/{}/orders/{}",
+    "brokerage/accounts/{}/historicalorders",
+    "orderexecution/orders",
+    "orderexecution/orders/{}",
+    "orderexecution/orderconfirm",
+    "orderexecution/ordergroups",
+    "orderexecution/ordergroupconfirm",
+)
+_ROUTE_SEGMENTS = [(route, route.split("/")) for route in ROUTES]
+
+
+def endpoint_route(endpoint: str) -> str:
+    """Return the low-cardinality template an API endpoint is reported under."""
+    segments = endpoint.strip("/").split("/")
+    for route, pattern in _ROUTE_SEGMENTS:
+        if len(pattern) == len(segments) and all(
+            p == "{}" or p == s for p, s in zip(pattern, segments)
+        ):
+            return route
+    return endpoint_group(endpoint)
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket upper bounds."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        # One slot per bucket plus the implicit +Inf bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return `(upper bound, observations <= bound)` pairs, ending at +Inf."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class EndpointMetrics:
+    """Counters and latency histograms for one endpoint route."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = buckets
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.histograms: Dict[str, Histogram] = {}
+
+    def observe(self, phase: str, seconds: float) -> None:
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(requests={self.requests}, errors={self.errors}, "
+            f"retries={self.retries}, bytes_in={self.bytes_in}, "
+            f"bytes_out={self.bytes_out})"
+        )
+
+
+class RequestRecord:
+    """
+    Timings and sizes of one API call, across all of its attempts.
+
+    `timings` holds seconds per phase: `connect` (DNS resolution, TCP and TLS
+    handshakes of a new connection; absent when a pooled connection was
+    reused), `ttfb` (last attempt start to response headers) and `total`.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "route",
+        "status",
+        "error",
+        "attempts",
+        "bytes_in",
+        "bytes_out",
+        "timings",
+        "_started",
+        "_attempt_started",
+        "_connect_started",
+    )
+
+    def __init__(self, method: str, endpoint: str) -> None:
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.route = endpoint_route(endpoint)
+        self.status: Optional[int] = None
+        self.error: Optional[str] = None
+        self.attempts = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.timings: Dict[str, float] = {}
+        self._started = perf_counter()
+        self._attempt_started = self._started
+        self._connect_started: Optional[float] = None
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        """httpcore `trace` extension callback for the synchronous client."""
+        now = perf_counter()
+        if name.endswith("connect_tcp.started"):
+            self._connect_started = now
+        elif name.endswith(("connect_tcp.complete", "start_tls.complete")):
+            if self._connect_started is not None:
+                self.timings["connect"] = now - self._connect_started
+        elif name.endswith("receive_response_headers.complete"):
+            self.timings["ttfb"] = now - self._attempt_started
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        """httpcore `trace` extension callback for the async client."""
+        self.trace(name, info)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(method={self.method!r}, "
+            f"endpoint={self.endpoint!r}, status={self.status}, "
+            f"attempts={self.attempts}, timings={self.timings})"
+        )
+
+
+RequestHook = Callable[[httpx.Request], None]
+ResponseHook = Callable[[RequestRecord], None]
+
+
+class Instrumentation:
+    """
+    Opt-in request hooks and per-endpoint latency metrics for API clients.
+
+    Request hooks run before every attempt with the outgoing request. Response
+    hooks run once per API call with its RequestRecord, after retries. Metrics
+    are aggregated per endpoint route and exported with `prometheus()`. Clients
+    without instrumentation skip all of this.
+
+    Args:
+        buckets: Latency histogram bucket upper bounds in seconds
+        request_hooks: Callables receiving each outgoing `httpx.Request`
+        response_hooks: Callables receiving each finished RequestRecord
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        request_hooks: Optional[List[RequestHook]] = None,
+        response_hooks: Optional[List[ResponseHook]] = None,
+    ) -> None:
+        self.buckets = tuple(buckets)
+        self.request_hooks: List[RequestHook] = list(request_hooks or [])
+        self.response_hooks: List[ResponseHook] = list(response_hooks or [])
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        self.auth_refreshes = 0
+        self._lock = threading.Lock()
+
+    def start(self, method: str, endpoint: str) -> RequestRecord:
+        """Begin recording an API call."""
+        return RequestRecord(method, endpoint)
+
+    def attempt(self, record: RequestRecord, request: httpx.Request) -> httpx.Request:
+        """Account for one attempt of `record` and run the request hooks."""
+        record.attempts += 1
+        record._attempt_started = perf_counter()
+        record.bytes_out += len(request.content)
+        for hook in self.request_hooks:
+            hook(request)
+        return request
+
+    def received(self, record: RequestRecord, response: httpx.Response) -> None:
+        """Account for the response to one attempt of `record`."""
+        record.status = response.status_code
+        record.bytes_in += response.num_bytes_downloaded
+
+    def finish(
+        self, record: RequestRecord, error: Optional[BaseException] = None
+    ) -> None:
+        """Complete `record`, aggregate it and run the response hooks."""
+        record.timings["total"] = perf_counter() - record._started
+        if isinstance(error, httpx.HTTPStatusError):
+            record.status = error.response.status_code
+        if error is not None:
+            record.error = type(error).__name__
+
+        with self._lock:
+            metrics = self._metrics(record.route)
+            metrics.requests += 1
+            metrics.retries += record.retries
+            metrics.bytes_in += record.bytes_in
+            metrics.bytes_out += record.bytes_out
+            if error is not None or (record.status or 0) >= 400:
+                metrics.errors += 1
+            for phase, seconds in record.timings.items():
+                metrics.observe(phase, seconds)
+
+        for hook in self.response_hooks:
+            hook(record)
+
+    def observe(self, endpoint: str, phase: str, seconds: float) -> None:
+        """Record a client-side phase, such as decode or validation time."""
+        with self._lock:
+            self._metrics(endpoint_route(endpoint)).observe(phase, seconds)
+
+    def record_auth_refresh(self) -> None:
+        with self._lock:
+            self.auth_refreshes += 1
+
+    def _metrics(self, route: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(route)
+        if metrics is None:
+            metrics = self.endpoints[route] = EndpointMetrics(self.buckets)
+        return metrics
+
+    def prometheus(self, namespace: str = "tradestation") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help: str) -> str:
+            full = f"{namespace}_{name}"
+            lines.append(f"# HELP {full} {help}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+
+            counters = (
+                ("requests_total", "API calls made.", "requests"),
+                ("request_errors_total", "API calls that failed.", "errors"),
+                ("retries_total", "Retried attempts.", "retries"),
+                ("response_bytes_total", "Bytes received.", "bytes_in"),
+                ("request_bytes_total", "Request body bytes sent.", "bytes_out"),
+            )
+            for name, help, attr in counters:
+                full = family(name, "counter", help)
+                for route, metrics in endpoints:
+                    lines.append(
+                        f'{full}{{endpoint="{route}"}} {getattr(metrics, attr)}'
+                    )
+
+            full = family(
+                "request_phase_seconds",
+                "histogram",
+                "Time spent per request phase.",
+            )
+            for route, metrics in endpoints:
+                for phase, histogram in sorted(metrics.histograms.items()):
+                    labels = f'endpoint="{route}",phase="{phase}"'
+                    for bound, count in histogram.cumulative():
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f'{full}_bucket{{{labels},le="{le}"}} {count}')
+                    lines.append(f"{full}_sum{{{labels}}} {histogram.sum!r}")
+                    lines.append(f"{full}_count{{{labels}}} {histogram.count}")
+
+            full = family("auth_refreshes_total", "counter", "Access token refreshes.")
+            lines.append(f"{full} {self.auth_refreshes}")
+
+        return "\n".join(lines) + "\n"
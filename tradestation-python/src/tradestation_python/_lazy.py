@@ -0,0 +1,37 @@
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, Sequence[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Build `__getattr__`, `__dir__` and `__all__` for a lazily loaded package.
+
+    Each exported name is imported from its submodule on first access and
+    then stored on the package, so later lookups cost nothing and importing
+    the package alone imports none of the submodules.
+
+    Args:
+        package: The package's `__name__`
+        exports: Exported names, keyed by the relative submodule defining them
+    """
+    origins = {
+        name: package + module for module, names in exports.items() for name in names
+    }
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # `__import__` rather than importlib, so `-X importtime` reports it.
+        __import__(module)
+        value = getattr(sys.modules[module], name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(origins))
+
+    return __getattr__, __dir__, sorted(origins)
@@ -0,0 +1,123 @@
+import threading
+from time import monotonic, sleep
+from typing import Dict, Mapping, Tuple
+
+import anyio
+
+# Endpoint prefixes mapped to the quota group they count against. The first
+# matching prefix wins, so more specific prefixes come first.
+ENDPOINT_GROUPS: Tuple[Tuple[str, str], ...] = (
+    ("marketdata/stream", "streams"),
+    ("marketdata/barcharts", "bars"),
+    ("marketdata", "market_data"),
+    ("brokerage", "brokerage"),
+    ("orderexecution", "order_execution"),
+)
+
+
+def endpoint_group(endpoint: str) -> str:
+    """Return the quota group an API endpoint belongs to."""
+    path = endpoint.lstrip("/")
+    for prefix, group in ENDPOINT_GROUPS:
+        if path.startswith(prefix):
+            return group
+    return "default"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing `capacity` requests per `period` seconds.
+
+    Callers reserve a token up front and are told how long to wait for it, so
+    the lock is never held while sleeping and waiters are served in order.
+    """
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimitStats:
+    """Wait-time metrics for one quota group."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.requests += 1
+        if wait > 0:
+            self.waits += 1
+            self.wait_time += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(requests={self.requests}, waits={self.waits}, "
+            f"wait_time={self.wait_time:.3f}, max_wait={self.max_wait:.3f})"
+        )
+
+
+class RateLimiter:
+    """
+    Client-side request budgets per endpoint group.
+
+    One limiter may be shared by several sync and async clients. Groups
+    without a configured limit are not throttled.
+
+    Args:
+        limits: Mapping of group name (see `ENDPOINT_GROUPS`) to a
+            `(requests, period_seconds)` budget
+    """
+
+    def __init__(self, limits: Mapping[str, Tuple[int, float]]) -> None:
+        self.buckets = {
+            group: TokenBucket(capacity, period)
+            for group, (capacity, period) in limits.items()
+        }
+        self.stats: Dict[str, RateLimitStats] = {
+            group: RateLimitStats() for group in self.buckets
+        }
+        self._lock = threading.Lock()
+
+    def _reserve(self, endpoint: str) -> float:
+        group = endpoint_group(endpoint)
+        bucket = self.buckets.get(group)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve()
+        with self._lock:
+            self.stats[group].record(wait)
+        return wait
+
+    def acquire(self, endpoint: str) -> float:
+        """Block until a request to `endpoint` fits its budget; return the wait."""
+        wait = self._reserve(endpoint)
+        if wait > 0:
+            sleep(wait)
+        return wait
+
+    async def aacquire(self, endpoint: str) -> float:
+        """Async counterpart of `acquire` that yields to the event loop."""
+        wait = self._reserve(endpoint)
+        if wait > 0:
+            await anyio.sleep(wait)
+        return wait
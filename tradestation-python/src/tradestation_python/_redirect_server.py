@@ -0,0 +1,61 @@
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict
+
+
+class AuthHTTPServer(HTTPServer):
+    received_params: Dict[str, str]
+
+    def __init__(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        super().__init__(*args, **kwargs)
+        self.received_params = {}
+
+
+class ParamsHandler(BaseHTTPRequestHandler):
+    sever: AuthHTTPServer
+
+    def do_GET(self) -> None:
+        # Enusre proper type with parameter handling.
+        if not isinstance(self.server, AuthHTTPServer):
+            raise TypeError("Server must be of type `AuthHTTPServer`.")
+
+        # Parse query parameters.
+        parsed_path = urllib.parse.urlparse(self.path)
+        params = urllib.parse.parse_qs(parsed_path.query)
+        self.server.received_params = {k: v[0] for k, v in params.items()}  # flatten
+
+        # Respond to client.
+        self.send_response(200)
+        self.send_header("Content-type", "text/html")
+        self.end_headers()
+        html_response = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Authorization Complete</title>
+        </head>
+        <body>
+            <h2>Authorization successful!</h2>
+            <p>Parameters received. This window will close automatically...</p>
+            <script>
+                // Close the window after a short delay
+                setTimeout(function() {
+                    window.close();
+                }, 2000);
+                
+                // Fallback: try to close immediately for popup windows
+                if (window.opener) {
+                    window.close();
+                }
+            </script>
+        </body>
+        </html>
+        """
+        self.wfile.write(html_response.encode("utf-8"))
+
+        # Shut down the server in a background thread to avoid blocking.
+        threading.Thread(target=self.server.shutdown).start()
+
+    def log_message(self, format: str, *args) -> None:  # noqa: ANN002
+        pass
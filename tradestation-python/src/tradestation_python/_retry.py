@@ -0,0 +1,212 @@
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep, time
+from typing import Awaitable, Callable, Dict, FrozenSet, Optional
+
+import anyio
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Failures where the server never saw (or explicitly refused) the request, so
+# even non-idempotent requests such as order placement are safe to resend.
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a `Retry-After` header given as delay seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryStats:
+    """Thread-safe counters for the requests and retries made by a client."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.reasons: Dict[str, int] = {}
+
+    def record_attempt(self) -> None:
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, reason: str) -> None:
+        with self._lock:
+            self.retries += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(attempts={self.attempts}, "
+            f"retries={self.retries}, reasons={self.reasons})"
+        )
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter and `Retry-After` support.
+
+    Idempotent requests are retried on transport errors and on any of
+    `retry_statuses`. Other requests are only retried when the server cannot
+    have acted on them (connection failures and 429s) unless the caller marks
+    them idempotent.
+
+    Args:
+        retries: Maximum number of retries after the first attempt
+        backoff_factor: Base delay in seconds, doubled after every attempt
+        max_backoff: Upper bound on a computed (non Retry-After) delay
+        deadline: Total time budget in seconds across all attempts
+        retry_statuses: Response status codes that are worth retrying
+        jitter: Randomize delays between zero and the computed backoff
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        deadline: Optional[float] = None,
+        retry_statuses: FrozenSet[int] = RETRY_STATUSES,
+        jitter: bool = True,
+    ) -> None:
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+        self.jitter = jitter
+
+    def begin(self, method: str, idempotent: Optional[bool] = None) -> "RetryState":
+        """Start tracking the attempts of a single request."""
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        return RetryState(self, idempotent)
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class RetryState:
+    """Attempt bookkeeping for one request under a RetryPolicy."""
+
+    def __init__(self, policy: RetryPolicy, idempotent: bool) -> None:
+        self.policy = policy
+        self.idempotent = idempotent
+        self.attempt = 0
+        self.started = monotonic()
+
+    def next_delay(
+        self,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Return how long to wait before retrying, or None to stop.
+
+        Call after every attempt with either the response or the transport
+        error it raised.
+        """
+        self.attempt += 1
+        if self.attempt > self.policy.retries or not self._retryable(response, error):
+            return None
+
+        retry_after = None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        delay = (
+            self.policy.backoff(self.attempt) if retry_after is None else retry_after
+        )
+
+        deadline = self.policy.deadline
+        if deadline is not None and monotonic() - self.started + delay > deadline:
+            return None
+        return delay
+
+    def reason(
+        self,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> str:
+        """Short label describing why an attempt is being retried."""
+        if response is not None:
+            return str(response.status_code)
+        return type(error).__name__
+
+    def _retryable(
+        self, response: Optional[httpx.Response], error: Optional[Exception]
+    ) -> bool:
+        if response is not None:
+            if response.status_code == 429:
+                return True
+            return (
+                self.idempotent and response.status_code in self.policy.retry_statuses
+            )
+        if isinstance(error, _UNSENT_ERRORS):
+            return True
+        return self.idempotent and isinstance(error, httpx.TransportError)
+
+
+def _check_status(response: httpx.Response) -> httpx.Response:
+    """Raise for error statuses; 304 answers a conditional request."""
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+def send_with_retries(
+    send: Callable[[], httpx.Response], state: RetryState, stats: RetryStats
+) -> httpx.Response:
+    """Call `send` until it succeeds or `state` gives up, then check the status."""
+    while True:
+        stats.record_attempt()
+        try:
+            response = send()
+        except httpx.TransportError as exc:
+            delay = state.next_delay(error=exc)
+            if delay is None:
+                raise
+            stats.record_retry(state.reason(error=exc))
+        else:
+            delay = state.next_delay(response=response)
+            if delay is None:
+                return _check_status(response)
+            response.close()
+            stats.record_retry(state.reason(response=response))
+        sleep(delay)
+
+
+async def asend_with_retries(
+    send: Callable[[], Awaitable[httpx.Response]],
+    state: RetryState,
+    stats: RetryStats,
+) -> httpx.Response:
+    """Async counterpart of `send_with_retries`."""
+    while True:
+        stats.record_attempt()
+        try:
+            response = await send()
+        except httpx.TransportError as exc:
+            delay = state.next_delay(error=exc)
+            if delay is None:
+                raise
+            stats.record_retry(state.reason(error=exc))
+        else:
+            delay = state.next_delay(response=response)
+            if delay is None:
+                return _check_status(response)
+            await response.aclose()
+            stats.record_retry(state.reason(response=response))
+        await anyio.sleep(delay)
@@ -0,0 +1,91 @@
+import json
+from typing import Any, Dict, Optional, Union
+
+import httpx
+
+from ._retry import RetryPolicy
+from .types.responses import Heartbeat, StreamErrorResponse, StreamStatus
+
+# Sent by the server before it closes a stream it wants clients to reopen.
+GO_AWAY = "GoAway"
+
+
+class StreamError(Exception):
+    """Error message received in-band on a stream."""
+
+    def __init__(self, response: StreamErrorResponse) -> None:
+        super().__init__(
+            f"{response.error}: {response.message}"
+            if response.message
+            else response.error
+        )
+        self.response = response
+
+
+class StreamSession:
+    """
+    Line decoding and reconnect bookkeeping shared by resumable streams.
+
+    Reconnects follow the client's RetryPolicy. The attempt count resets as
+    soon as a reconnected stream delivers a message, so only consecutive
+    failures count against `retries`.
+
+    Args:
+        retry_policy: Policy deciding whether and when to reconnect
+    """
+
+    def __init__(self, retry_policy: RetryPolicy) -> None:
+        self.retry_policy = retry_policy
+        self.retry = retry_policy.begin("GET")
+        self.reconnects = 0
+        self.go_away = False
+
+    def decode(
+        self, line: str
+    ) -> Optional[Union[Dict[str, Any], Heartbeat, StreamStatus]]:
+        """
+        Parse one line of a stream.
+
+        Returns heartbeats and status messages as models, data messages as
+        plain dicts and None for blank keep-alive lines. Raises StreamError
+        for in-band errors.
+        """
+        if not line.strip():
+            return None
+        data = json.loads(line)
+        if self.retry.attempt:
+            self.retry = self.retry_policy.begin("GET")
+
+        if "Error" in data:
+            raise StreamError(StreamErrorResponse.model_validate(data))
+        if "Heartbeat" in data:
+            return Heartbeat.model_validate(data)
+        if "StreamStatus" in data:
+            status = StreamStatus.model_validate(data)
+            if status.stream_status == GO_AWAY:
+                self.go_away = True
+            return status
+        return data
+
+    def reconnect_delay(self, error: Optional[Exception] = None) -> float:
+        """
+        Return how long to wait before reopening the stream.
+
+        Call with the error that ended the stream, or None when the server
+        closed it. Re-raises the error once the retry policy gives up.
+        """
+        if error is None:
+            if self.go_away:
+                self.go_away = False
+                self.reconnects += 1
+                return 0.0
+            error = httpx.RemoteProtocolError("Stream closed by server")
+
+        if isinstance(error, httpx.HTTPStatusError):
+            delay = self.retry.next_delay(response=error.response)
+        else:
+            delay = self.retry.next_delay(error=error)
+        if delay is None:
+            raise error
+        self.reconnects += 1
+        return delay
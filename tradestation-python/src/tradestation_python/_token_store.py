@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Iterator, NamedTuple, Optional, Union
+
+from .types.responses import TokenInfo
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class StoredToken(NamedTuple):
+    """Access token details together with the refresh token that produced them."""
+
+    token_info: TokenInfo
+    refresh_token: Optional[str] = None
+
+
+class TokenStore(ABC):
+    """Persistence for OAuth tokens shared by clients and processes."""
+
+    @abstractmethod
+    def load(self) -> Optional[StoredToken]:
+        """Return the stored token, or None if there is none."""
+
+    @abstractmethod
+    def save(self, token: StoredToken) -> None:
+        """Replace the stored token."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget the stored token."""
+
+    def lock(self) -> ContextManager[None]:
+        """Hold exclusive access for a load-refresh-save sequence."""
+        return nullcontext()
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store that lives as long as the process."""
+
+    def __init__(self) -> None:
+        self._token: Optional[StoredToken] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[StoredToken]:
+        return self._token
+
+    def save(self, token: StoredToken) -> None:
+        self._token = token
+
+    def clear(self) -> None:
+        self._token = None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """
+    JSON file token store shared by every process on the host.
+
+    Writes go to a temporary file that atomically replaces the store, so
+    readers never see a partial token. The file is only readable by its
+    owner. Where `fcntl` is available, `lock` also excludes other
+    processes, so a fleet of workers refreshes an expiring token once.
+
+    Args:
+        path: Location of the token file
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[StoredToken]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        refresh_token = data.pop("refresh_token", None)
+        return StoredToken(TokenInfo.model_validate(data), refresh_token)
+
+    def save(self, token: StoredToken) -> None:
+        data = token.token_info.model_dump(exclude={"expires_at", "refresh_token"})
+        data["refresh_token"] = token.refresh_token
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_name(self.path.name + ".lock"), "a") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,9 @@
+from .bar_cache import BarCache, BarCacheKey  # noqa: F401
+from .export import (  # noqa: F401
+    ArrowBarWriter,
+    BarDatasetWriter,
+    CSVBarWriter,
+    export_bars,
+)
+from .indicators import ATR, EMA, RSI, SMA, VWAP, atr, ema, rsi, sma, vwap  # noqa: F401
+from .resample import SESSION_HOURS, resample  # noqa: F401
@@ -0,0 +1,192 @@
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+from urllib.parse import quote
+
+from ..types.enums import SessionTemplate, Unit
+from ..types.responses.bars import BAR_COLUMNS, BarsFrame
+
+CLOSED = "Closed"
+
+
+class BarCacheKey(NamedTuple):
+    """Identifies one cached bar series."""
+
+    symbol: str
+    interval: int
+    unit: Unit
+    sessiontemplate: Optional[SessionTemplate] = None
+
+    @property
+    def path(self) -> str:
+        session = self.sessiontemplate.value if self.sessiontemplate else "Default"
+        return os.path.join(
+            quote(self.symbol, safe=""), f"{self.interval}{self.unit.value}-{session}"
+        )
+
+
+class BarCache:
+    """
+    Persistent columnar store of closed bars.
+
+    Each series lives in its own directory with one raw file per numeric
+    column (native-endian, see `BAR_COLUMNS` for typecodes) and a
+    `meta.json` holding the committed row count and the generation of the
+    column files. Column files are memory-mapped for the duration of each
+    read and unmapped before it returns, so no handle outlives a call
+    (Windows cannot delete or truncate a mapped file). Appends only ever add
+    bars newer than the last cached epoch, and the row count is published
+    atomically after the column data is written, so an interrupted append
+    never exposes partial rows. Rewrites go to a new generation of column
+    files that `meta.json` switches to last, so they never lose the old
+    series either.
+
+    Args:
+        directory: Root directory of the cache
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]) -> None:
+        self.directory = Path(directory)
+
+    def _series_dir(self, key: BarCacheKey) -> Path:
+        return self.directory / key.path
+
+    def _meta(self, key: BarCacheKey) -> Tuple[int, int]:
+        """Committed row count and column file generation of `key`."""
+        try:
+            meta = json.loads((self._series_dir(key) / "meta.json").read_text())
+        except FileNotFoundError:
+            return 0, 0
+        return int(meta["rows"]), int(meta.get("generation", 0))
+
+    def rows(self, key: BarCacheKey) -> int:
+        """Number of bars committed for `key`."""
+        return self._meta(key)[0]
+
+    @staticmethod
+    def _column_path(series: Path, name: str, generation: int) -> Path:
+        # Generation 0 keeps the plain file names of older caches.
+        return series / (f"{name}.{generation}.bin" if generation else f"{name}.bin")
+
+    @contextmanager
+    def _map(
+        self, key: BarCacheKey, name: str, typecode: str, meta: Tuple[int, int]
+    ) -> Iterator["memoryview[Any]"]:
+        """Memory-map the committed rows of one column file until exit."""
+        rows, generation = meta
+        itemsize = array(typecode).itemsize
+        path = self._column_path(self._series_dir(key), name, generation)
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # Every view must be released before the map can close.
+                with memoryview(mapped) as view, view[: rows * itemsize] as data:
+                    with data.cast(typecode) as column:  # type: ignore[call-overload]
+                        yield column
+
+    def _epoch_at(self, key: BarCacheKey, index: int) -> Optional[int]:
+        meta = self._meta(key)
+        if meta[0] == 0:
+            return None
+        with self._map(key, "epoch", "q", meta) as epochs:
+            return int(epochs[index])
+
+    def first_epoch(self, key: BarCacheKey) -> Optional[int]:
+        return self._epoch_at(key, 0)
+
+    def last_epoch(self, key: BarCacheKey) -> Optional[int]:
+        return self._epoch_at(key, -1)
+
+    def read(
+        self,
+        key: BarCacheKey,
+        start_epoch: Optional[int] = None,
+        end_epoch: Optional[int] = None,
+    ) -> BarsFrame:
+        """Read cached bars with `start_epoch <= epoch <= end_epoch`."""
+        meta = self._meta(key)
+        rows = meta[0]
+        if rows == 0:
+            return BarsFrame()
+        with self._map(key, "epoch", "q", meta) as epochs:
+            lo = 0 if start_epoch is None else bisect_left(epochs, start_epoch)
+            hi = rows if end_epoch is None else bisect_right(epochs, end_epoch)
+        hi = max(lo, hi)
+
+        columns: Dict[str, "array[Any]"] = {}
+        for name, _, typecode in BAR_COLUMNS:
+            column = array(typecode)
+            with self._map(key, name, typecode, meta) as mapped:
+                column.frombytes(mapped[lo:hi].tobytes())
+            columns[name] = column
+        return BarsFrame(columns, [CLOSED] * (hi - lo))
+
+    def append(self, key: BarCacheKey, frame: BarsFrame) -> int:
+        """
+        Append the closed bars of `frame` newer than the last cached epoch.
+
+        Appending stops at the first bar that is not closed, since it and
+        anything after it may still change. Returns the number of bars added.
+        """
+        last = self.last_epoch(key)
+        start = 0 if last is None else bisect_right(frame.epoch, last)
+        stop = _closed_until(frame, start)
+        if stop == start:
+            return 0
+
+        series = self._series_dir(key)
+        series.mkdir(parents=True, exist_ok=True)
+        rows, generation = self._meta(key)
+        for name, column in frame[start:stop].columns.items():
+            path = self._column_path(series, name, generation)
+            with open(path, "r+b" if rows else "wb") as f:
+                # Drop bytes left behind by an append that never committed.
+                f.truncate(rows * column.itemsize)
+                f.seek(0, os.SEEK_END)
+                column.tofile(f)
+        self._write_meta(series, rows + stop - start, generation)
+        return stop - start
+
+    def write(self, key: BarCacheKey, frame: BarsFrame) -> int:
+        """
+        Replace the cached series for `key` with the closed bars of `frame`.
+
+        The bars go to a new generation of column files that `meta.json` is
+        switched to last, so an interrupted write leaves the old series.
+        """
+        stop = _closed_until(frame, 0)
+        series = self._series_dir(key)
+        series.mkdir(parents=True, exist_ok=True)
+        old = self._meta(key)[1]
+        new = old + 1
+        for name, column in frame[:stop].columns.items():
+            with open(self._column_path(series, name, new), "wb") as f:
+                column.tofile(f)
+        self._write_meta(series, stop, new)
+        for name, _, _ in BAR_COLUMNS:
+            self._column_path(series, name, old).unlink(missing_ok=True)
+        return stop
+
+    def clear(self, key: BarCacheKey) -> None:
+        shutil.rmtree(self._series_dir(key), ignore_errors=True)
+
+    @staticmethod
+    def _write_meta(series: Path, rows: int, generation: int) -> None:
+        fd, tmp = tempfile.mkstemp(dir=series, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"rows": rows, "generation": generation}, f)
+        os.replace(tmp, series / "meta.json")
+
+
+def _closed_until(frame: BarsFrame, start: int) -> int:
+    """Index of the first bar from `start` on that is not closed."""
+    stop = start
+    while stop < len(frame) and frame.bar_status[stop] == CLOSED:
+        stop += 1
+    return stop
@@ -0,0 +1,405 @@
+"""
+Stream bar data to Parquet, Arrow IPC or CSV files.
+
+Writers consume :class:`~tradestation_python.types.responses.BarsFrame`
+chunks, such as those yielded by ``MarketData.iter_bars(as_columns=True)``,
+and flush them in bounded row groups, so a history of any size is exported
+without holding it in memory. Parquet and Arrow need the `arrow` extra
+(pyarrow); CSV works everywhere.
+"""
+
+import csv
+import importlib.util
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from urllib.parse import quote
+
+from ..types.responses.bars import BAR_COLUMNS, BarsFrame
+from .resample import DAY_MS, EXCHANGE_TIMEZONE, HOUR_MS, ExchangeClock
+
+FORMATS = ("parquet", "arrow", "csv")
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+PARTITIONS = ("symbol", "date")
+_EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+_FLAGS = ("is_realtime", "is_end_of_history")
+
+
+def default_format() -> str:
+    """Return "parquet" when pyarrow is installed, otherwise "csv"."""
+    return "parquet" if importlib.util.find_spec("pyarrow") else "csv"
+
+
+def _pyarrow() -> Any:  # noqa: ANN401
+    try:
+        import pyarrow  # type: ignore[import-not-found]
+        import pyarrow.ipc  # type: ignore[import-not-found]
+        import pyarrow.parquet  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet and Arrow export need pyarrow: "
+            "pip install 'tradestation-python[arrow]'"
+        ) from exc
+    return pyarrow
+
+
+class BarFileWriter(ABC):
+    """
+    Writes BarsFrame chunks to a single file.
+
+    Args:
+        path: Destination file
+        symbol: Written as a leading `symbol` column when given
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], symbol: Optional[str] = None
+    ) -> None:
+        self.path = Path(path)
+        self.symbol = symbol
+        self.rows = 0
+
+    @abstractmethod
+    def write(self, frame: BarsFrame, symbol: Optional[str] = None) -> None:
+        """Append the bars of `frame`, under `symbol` instead of the default."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush buffered bars and close the file."""
+
+    def __enter__(self) -> "BarFileWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class CSVBarWriter(BarFileWriter):
+    """
+    Streams bars to a CSV file, one chunk at a time.
+
+    Args:
+        path: Destination file
+        symbol: Written as a leading `symbol` column when given
+        append: Add to an existing file instead of replacing it; the header
+            is only written to an empty file
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        symbol: Optional[str] = None,
+        append: bool = False,
+    ) -> None:
+        super().__init__(path, symbol)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if append else "w", newline="")
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            header = ["timestamp"] + [name for name, _, _ in BAR_COLUMNS]
+            header.append("bar_status")
+            self._writer.writerow((["symbol"] if symbol is not None else []) + header)
+
+    def write(self, frame: BarsFrame, symbol: Optional[str] = None) -> None:
+        columns: List[Sequence[Any]] = [[_isoformat(epoch) for epoch in frame.epoch]]
+        columns.extend(frame.columns.values())
+        columns.append(frame.bar_status)
+        if self.symbol is not None:
+            columns.insert(0, [symbol or self.symbol] * len(frame))
+        self._writer.writerows(zip(*columns))
+        self.rows += len(frame)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ArrowBarWriter(BarFileWriter):
+    """
+    Streams bars to a Parquet or Arrow IPC file in bounded row groups.
+
+    Numeric columns are handed to pyarrow as zero-copy buffers. Bars are
+    buffered until `row_group_size` rows are pending, then written as one
+    row group (Parquet) or record batch (Arrow).
+
+    Args:
+        path: Destination file
+        symbol: Written as a leading dictionary-encoded `symbol` column
+        format: "parquet" or "arrow"
+        row_group_size: Maximum rows buffered before a flush
+        compression: Parquet compression codec
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        symbol: Optional[str] = None,
+        format: str = "parquet",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: str = "snappy",
+    ) -> None:
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"Unsupported Arrow format {format!r}")
+        super().__init__(path, symbol)
+        self._pa = _pyarrow()
+        self.format = format
+        self.row_group_size = row_group_size
+        self.schema = _schema(self._pa, symbol is not None)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if format == "parquet":
+            self._writer = self._pa.parquet.ParquetWriter(
+                str(self.path), self.schema, compression=compression
+            )
+        else:
+            self._writer = self._pa.ipc.new_file(str(self.path), self.schema)
+        self._pending: List[BarsFrame] = []
+        self._pending_rows = 0
+        # Symbol of every pending row, when the file has a symbol column.
+        self._symbols: List[Optional[str]] = []
+
+    def write(self, frame: BarsFrame, symbol: Optional[str] = None) -> None:
+        self._pending.append(frame)
+        self._pending_rows += len(frame)
+        if self.symbol is not None:
+            self._symbols.extend(repeat(symbol or self.symbol, len(frame)))
+        if self._pending_rows >= self.row_group_size:
+            self._flush()
+
+    def _flush(self, final: bool = False) -> None:
+        """Write full row groups, and with `final` also the remainder."""
+        if not self._pending_rows:
+            return
+        frames, symbols = self._pending, self._symbols
+        frame = frames[0] if len(frames) == 1 else BarsFrame.concat(frames)
+        size = self.row_group_size
+        stop = len(frame) if final else len(frame) - len(frame) % size
+        for start in range(0, stop, size):
+            chunk = frame[start : min(start + size, stop)]
+            table = self._table(chunk, symbols[start : start + len(chunk)])
+            if self.format == "parquet":
+                self._writer.write_table(table, row_group_size=len(chunk))
+            else:
+                self._writer.write_table(table, max_chunksize=len(chunk))
+            self.rows += len(chunk)
+        # Keep the tail buffered until it fills a row group.
+        self._pending = [frame[stop:]] if stop < len(frame) else []
+        self._pending_rows = len(frame) - stop
+        self._symbols = symbols[stop:]
+
+    def _table(self, frame: BarsFrame, symbols: List[Optional[str]]) -> Any:  # noqa: ANN401
+        pa = self._pa
+        n = len(frame)
+
+        def wrap(column: Any, type: Any) -> Any:  # noqa: ANN401
+            return pa.Array.from_buffers(type, n, [None, pa.py_buffer(column)])
+
+        arrays = [wrap(frame.epoch, pa.timestamp("ms", tz="UTC"))]
+        for name, _, typecode in BAR_COLUMNS:
+            column = getattr(frame, name)
+            if name in _FLAGS:
+                arrays.append(wrap(column, pa.int8()).cast(pa.bool_()))
+            else:
+                arrays.append(
+                    wrap(column, pa.float64() if typecode == "d" else pa.int64())
+                )
+        arrays.append(pa.array(frame.bar_status, pa.string()).dictionary_encode())
+        if self.symbol is not None:
+            arrays.insert(0, pa.array(symbols, pa.string()).dictionary_encode())
+        return pa.Table.from_arrays(arrays, schema=self.schema)
+
+    def close(self) -> None:
+        self._flush(final=True)
+        self._writer.close()
+
+
+def _schema(pa: Any, with_symbol: bool) -> Any:  # noqa: ANN401
+    text = pa.dictionary(pa.int32(), pa.string())
+    fields = [pa.field("timestamp", pa.timestamp("ms", tz="UTC"))]
+    for name, _, typecode in BAR_COLUMNS:
+        if name in _FLAGS:
+            fields.append(pa.field(name, pa.bool_()))
+        else:
+            fields.append(
+                pa.field(name, pa.float64() if typecode == "d" else pa.int64())
+            )
+    fields.append(pa.field("bar_status", text))
+    if with_symbol:
+        fields.insert(0, pa.field("symbol", text))
+    return pa.schema(fields)
+
+
+def _isoformat(epoch: int) -> str:
+    moment = datetime.fromtimestamp(epoch / 1000, tz=timezone.utc)
+    return moment.strftime(r"%Y-%m-%dT%H:%M:%SZ")
+
+
+class BarDatasetWriter:
+    """
+    Writes bars for many symbols to a Hive-style partitioned directory.
+
+    Files are laid out as ``root/symbol=AAPL/date=2024-01-02/part-00000.parquet``
+    for the default partitioning. Dates are exchange session dates.
+    Partition columns are encoded in the path, not repeated in the files.
+    Input must be in time order per symbol. A symbol's date partition is
+    closed once no symbol's bars are still going to it, so only one file per
+    symbol is open at a time.
+
+    With `append`, Parquet and Arrow partitions get a new part file next to
+    the existing ones and CSV partitions are appended to in place. Without
+    it, existing part files of every partition written to are replaced.
+
+    Args:
+        root: Dataset directory
+        format: "parquet", "arrow" or "csv" (default: parquet if pyarrow is
+            installed, otherwise csv)
+        partition_by: Any of "symbol" and "date", in path order
+        append: Keep existing data in the partitions written to
+        row_group_size: Maximum rows per Parquet row group or Arrow batch
+        tz: Time zone of the session dates
+    """
+
+    def __init__(
+        self,
+        root: Union[str, "os.PathLike[str]"],
+        format: Optional[str] = None,
+        partition_by: Sequence[str] = PARTITIONS,
+        append: bool = True,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        tz: str = EXCHANGE_TIMEZONE,
+    ) -> None:
+        format = format or default_format()
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}, expected one of {FORMATS}")
+        unknown = set(partition_by) - set(PARTITIONS)
+        if unknown:
+            raise ValueError(f"Cannot partition by {sorted(unknown)}")
+        if format != "csv":
+            _pyarrow()
+        self.root = Path(root)
+        self.format = format
+        self.partition_by = tuple(partition_by)
+        self.append = append
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._clock = ExchangeClock(tz)
+        self._writers: Dict[Path, BarFileWriter] = {}
+        # The partition each symbol is currently writing to.
+        self._current: Dict[str, Path] = {}
+        self._prepared: Set[Path] = set()
+
+    def write(self, symbol: str, frame: BarsFrame) -> None:
+        """Add bars of `symbol`, routing each to its partition."""
+        for partition, chunk in self._split(symbol, frame):
+            previous = self._current.get(symbol)
+            self._current[symbol] = partition
+            if previous not in (None, partition) and previous not in (
+                self._current.values()
+            ):
+                self._writers.pop(previous).close()
+            writer = self._writers.get(partition)
+            if writer is None:
+                writer = self._writers[partition] = self._open(symbol, partition)
+            writer.write(chunk, symbol)
+            self.rows += len(chunk)
+
+    def _split(self, symbol: str, frame: BarsFrame) -> Iterable[Tuple[Path, BarsFrame]]:
+        base = self.root
+        for key in self.partition_by:
+            if key == "symbol":
+                base = base / f"symbol={quote(symbol, safe='')}"
+        if "date" not in self.partition_by:
+            yield base, frame
+            return
+
+        offsets = self._clock.offsets
+        start = 0
+        day = None
+        for row, epoch in enumerate(frame.epoch):
+            offset = offsets.get(epoch // HOUR_MS)
+            if offset is None:
+                offset = self._clock.offset(epoch)
+            # Bars are stamped at their end; midnight belongs to the day before.
+            bar_day = (epoch - 1 + offset) // DAY_MS
+            if bar_day != day:
+                if day is not None:
+                    yield self._date_path(base, symbol, day), frame[start:row]
+                start, day = row, bar_day
+        if day is not None:
+            yield self._date_path(base, symbol, day), frame[start:]
+
+    def _date_path(self, base: Path, symbol: str, day: int) -> Path:
+        date = (datetime(1970, 1, 1) + timedelta(days=day)).date().isoformat()
+        if self.partition_by.index("date") == 0:
+            return self.root / f"date={date}" / base.relative_to(self.root)
+        return base / f"date={date}"
+
+    def _open(self, symbol: str, partition: Path) -> BarFileWriter:
+        extension = _EXTENSIONS[self.format]
+        existing = list(partition.glob(f"part-*{extension}"))
+        if partition not in self._prepared:
+            self._prepared.add(partition)
+            if not self.append:
+                for path in existing:
+                    path.unlink()
+                existing = []
+        with_symbol = None if "symbol" in self.partition_by else symbol
+        if self.format == "csv":
+            return CSVBarWriter(
+                partition / f"part-00000{extension}", with_symbol, append=True
+            )
+        return ArrowBarWriter(
+            partition / f"part-{len(existing):05d}{extension}",
+            with_symbol,
+            format=self.format,
+            row_group_size=self.row_group_size,
+        )
+
+    def close(self) -> None:
+        """Flush and close every open file."""
+        writers, self._writers = self._writers, {}
+        self._current.clear()
+        for writer in writers.values():
+            writer.close()
+
+    def __enter__(self) -> "BarDatasetWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def export_bars(
+    frames: Iterable[BarsFrame],
+    root: Union[str, "os.PathLike[str]"],
+    symbol: str,
+    **kwargs: Any,  # noqa: ANN401
+) -> int:
+    """
+    Write a stream of frames for one symbol to a partitioned dataset.
+
+    Takes the BarDatasetWriter arguments as keywords. Returns the number of
+    bars written.
+
+    Example:
+        frames = ts.market_data.iter_bars(
+            "AAPL", firstdate, interval=1, unit=Unit.MINUTE, as_columns=True
+        )
+        export_bars(frames, "lake/bars", "AAPL")
+    """
+    with BarDatasetWriter(root, **kwargs) as writer:
+        for frame in frames:
+            writer.write(symbol, frame)
+    return writer.rows
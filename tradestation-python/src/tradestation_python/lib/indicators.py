@@ -0,0 +1,324 @@
+"""
+Technical indicators over columnar bar data.
+
+The functions take whole columns, such as the arrays of a
+:class:`~tradestation_python.types.responses.BarsFrame`, and return a
+float64 :class:`array.array` of the same length, with NaN where the
+indicator is still warming up. Every function makes a constant number of
+passes over the packed columns (running sums for the SMA, a single fused
+loop for the recursive averages), so it runs in O(n) without building
+per-bar objects. numpy is not required.
+
+The classes compute the same values one bar at a time. Feed them bars as
+they arrive to keep an indicator current without recomputing the history.
+"""
+
+import math
+from array import array
+from collections import deque
+from itertools import accumulate, islice, repeat
+from operator import sub, truediv
+from typing import Deque, List, Optional, Sequence
+
+NAN = math.nan
+
+
+def _nans(n: int) -> "array[float]":
+    return array("d", repeat(NAN, n))
+
+
+def _check_period(period: int) -> None:
+    if period < 1:
+        raise ValueError("period must be at least 1")
+
+
+def _smooth(values: Sequence[float], period: int, alpha: float) -> "array[float]":
+    """
+    Exponential smoothing seeded with the mean of the first `period` values.
+
+    The first `period - 1` outputs are NaN.
+    """
+    n = len(values)
+    if n < period:
+        return _nans(n)
+    value = math.fsum(islice(values, period)) / period
+    beta = 1.0 - alpha
+    result = _nans(period - 1)
+    append = result.append
+    append(value)
+    for x in islice(values, period, None):
+        value = value * beta + alpha * x
+        append(value)
+    return result
+
+
+def sma(values: Sequence[float], period: int) -> "array[float]":
+    """
+    Simple moving average, as differences of a running sum.
+
+    Args:
+        values: Input column, such as closing prices
+        period: Number of bars averaged
+    """
+    _check_period(period)
+    n = len(values)
+    if n < period:
+        return _nans(n)
+    sums = array("d", accumulate(values, initial=0.0))
+    result = _nans(period - 1)
+    result.extend(
+        map(truediv, map(sub, islice(sums, period, None), sums), repeat(period))
+    )
+    return result
+
+
+def ema(values: Sequence[float], period: int) -> "array[float]":
+    """
+    Exponential moving average with smoothing factor `2 / (period + 1)`.
+
+    Seeded with the simple average of the first `period` values.
+
+    Args:
+        values: Input column, such as closing prices
+        period: Span of the average in bars
+    """
+    _check_period(period)
+    return _smooth(values, period, 2 / (period + 1))
+
+
+def rsi(close: Sequence[float], period: int = 14) -> "array[float]":
+    """
+    Relative strength index with Wilder smoothing, from 0 to 100.
+
+    The first `period` values are NaN.
+
+    Args:
+        close: Closing prices
+        period: Number of price changes averaged
+    """
+    _check_period(period)
+    n = len(close)
+    if n <= period:
+        return _nans(n)
+    changes = list(map(sub, islice(close, 1, None), close))
+    gain = math.fsum(c for c in changes[:period] if c > 0) / period
+    loss = -math.fsum(c for c in changes[:period] if c < 0) / period
+    result = _nans(period)
+    append = result.append
+    append(_rsi(gain, loss))
+    beta = (period - 1) / period
+    for change in islice(changes, period, None):
+        if change > 0:
+            gain = gain * beta + change / period
+            loss = loss * beta
+        else:
+            gain = gain * beta
+            loss = loss * beta - change / period
+        append(_rsi(gain, loss))
+    return result
+
+
+def _rsi(gain: float, loss: float) -> float:
+    if loss == 0:
+        return NAN if math.isnan(gain) else 100.0
+    return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+def true_range(
+    high: Sequence[float], low: Sequence[float], close: Sequence[float]
+) -> "array[float]":
+    """True range, the bar range extended to the previous close."""
+    result = array("d", map(sub, islice(high, 1), islice(low, 1)))
+    result.extend(
+        [
+            (hi if hi > prev else prev) - (lo if lo < prev else prev)
+            for hi, lo, prev in zip(islice(high, 1, None), islice(low, 1, None), close)
+        ]
+    )
+    return result
+
+
+def _true_range(high: float, low: float, previous_close: float) -> float:
+    return max(high, previous_close) - min(low, previous_close)
+
+
+def atr(
+    high: Sequence[float],
+    low: Sequence[float],
+    close: Sequence[float],
+    period: int = 14,
+) -> "array[float]":
+    """
+    Average true range with Wilder smoothing.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Closing prices
+        period: Number of bars averaged
+    """
+    _check_period(period)
+    return _smooth(true_range(high, low, close), period, 1 / period)
+
+
+def vwap(
+    high: Sequence[float],
+    low: Sequence[float],
+    close: Sequence[float],
+    volume: Sequence[float],
+) -> "array[float]":
+    """
+    Volume-weighted average of the typical price `(high + low + close) / 3`.
+
+    Accumulates from the first bar given, so pass one session's bars (for
+    example a slice of a frame) for a session VWAP. NaN until volume trades.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Closing prices
+        volume: Bar volumes, such as `total_volume`
+    """
+    result = array("d")
+    append = result.append
+    weighted = total = 0.0
+    for hi, lo, last, traded in zip(high, low, close, volume):
+        weighted += (hi + lo + last) * traded
+        total += traded
+        append(weighted / (3 * total) if total else NAN)
+    return result
+
+
+def _typical(high: float, low: float, close: float) -> float:
+    return (high + low + close) / 3
+
+
+class SMA:
+    """
+    Incremental simple moving average.
+
+    Args:
+        period: Number of bars averaged
+    """
+
+    def __init__(self, period: int) -> None:
+        _check_period(period)
+        self.period = period
+        self._window: Deque[float] = deque()
+        self._sum = 0.0
+        self.value = NAN
+
+    def update(self, value: float) -> float:
+        """Add the next value and return the average (NaN while warming up)."""
+        self._window.append(value)
+        self._sum += value
+        if len(self._window) > self.period:
+            self._sum -= self._window.popleft()
+        if len(self._window) == self.period:
+            self.value = self._sum / self.period
+        return self.value
+
+
+class _Smoothed:
+    """Exponential smoothing seeded with a simple average, one value at a time."""
+
+    def __init__(self, period: int, alpha: float) -> None:
+        _check_period(period)
+        self.period = period
+        self.alpha = alpha
+        self._seed: List[float] = []
+        self.value = NAN
+
+    def update(self, value: float) -> float:
+        if len(self._seed) < self.period:
+            self._seed.append(value)
+            if len(self._seed) == self.period:
+                self.value = math.fsum(self._seed) / self.period
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+class EMA(_Smoothed):
+    """
+    Incremental exponential moving average.
+
+    Args:
+        period: Span of the average in bars
+    """
+
+    def __init__(self, period: int) -> None:
+        super().__init__(period, 2 / (period + 1))
+
+
+class RSI:
+    """
+    Incremental Wilder relative strength index.
+
+    Args:
+        period: Number of price changes averaged
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = period
+        self._gains = _Smoothed(period, 1 / period)
+        self._losses = _Smoothed(period, 1 / period)
+        self._previous: Optional[float] = None
+        self.value = NAN
+
+    def update(self, close: float) -> float:
+        """Add the next close and return the RSI (NaN while warming up)."""
+        if self._previous is not None:
+            change = close - self._previous
+            self.value = _rsi(
+                self._gains.update(max(change, 0.0)),
+                self._losses.update(max(-change, 0.0)),
+            )
+        self._previous = close
+        return self.value
+
+
+class ATR:
+    """
+    Incremental Wilder average true range.
+
+    Args:
+        period: Number of bars averaged
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        self._ranges = _Smoothed(period, 1 / period)
+        self.period = period
+        self._previous: Optional[float] = None
+        self.value = NAN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """Add the next bar and return the ATR (NaN while warming up)."""
+        if self._previous is None:
+            true_range = high - low
+        else:
+            true_range = _true_range(high, low, self._previous)
+        self._previous = close
+        self.value = self._ranges.update(true_range)
+        return self.value
+
+
+class VWAP:
+    """Incremental volume-weighted average price, reset with `reset()`."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new accumulation period, such as a new session."""
+        self._weighted = 0.0
+        self._volume = 0.0
+        self.value = NAN
+
+    def update(self, high: float, low: float, close: float, volume: float) -> float:
+        """Add the next bar and return the VWAP (NaN until volume trades)."""
+        self._weighted += _typical(high, low, close) * volume
+        self._volume += volume
+        if self._volume:
+            self.value = self._weighted / self._volume
+        return self.value
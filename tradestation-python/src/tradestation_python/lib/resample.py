@@ -0,0 +1,183 @@
+"""
+Build higher timeframes locally from already-fetched bars.
+
+Fetch minute bars once and resample them to any multiple of the fetch
+interval, or to daily, weekly and monthly bars, instead of calling the API
+once per timeframe.
+"""
+
+from array import array
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from ..types.enums import SessionTemplate, Unit
+from ..types.responses.bars import BAR_COLUMNS, BarsFrame
+
+MINUTE_MS = 60_000
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+EXCHANGE_TIMEZONE = "America/New_York"
+
+# Session hours of each template in exchange time, as [open, close).
+SESSION_HOURS: Dict[SessionTemplate, Tuple[time, time]] = {
+    SessionTemplate.DEFAULT: (time(9, 30), time(16, 0)),
+    SessionTemplate.USEQ_PRE: (time(4, 0), time(16, 0)),
+    SessionTemplate.USEQ_POST: (time(9, 30), time(20, 0)),
+    SessionTemplate.USEQ_PRE_AND_POST: (time(4, 0), time(20, 0)),
+    SessionTemplate.USEQ_24_HOUR: (time(0, 0), time(0, 0)),
+}
+
+# Columns summed across the bars of a bucket; the rest take the last value.
+SUMMED = frozenset(
+    {
+        "total_volume",
+        "up_volume",
+        "down_volume",
+        "unchanged_volume",
+        "total_ticks",
+        "up_ticks",
+        "down_ticks",
+        "unchanged_ticks",
+    }
+)
+_EPOCH = date(1970, 1, 1)
+
+
+def _milliseconds(value: time) -> int:
+    return (value.hour * 60 + value.minute) * MINUTE_MS
+
+
+class ExchangeClock:
+    """Exchange-time offsets of UTC epochs, cached per hour."""
+
+    def __init__(self, tz: str) -> None:
+        self.tz = ZoneInfo(tz)
+        # UTC offset in milliseconds keyed by hours since the epoch.
+        self.offsets: Dict[int, int] = {}
+
+    def offset(self, epoch: int) -> int:
+        """Milliseconds to add to a UTC epoch to get exchange wall time."""
+        hour = epoch // HOUR_MS
+        offset = self.offsets.get(hour)
+        if offset is None:
+            moment = datetime.fromtimestamp(hour * 3600, tz=timezone.utc)
+            utcoffset = moment.astimezone(self.tz).utcoffset() or timedelta()
+            offset = self.offsets[hour] = int(utcoffset.total_seconds() * 1000)
+        return offset
+
+
+def resample(
+    frame: BarsFrame,
+    interval: int,
+    unit: Unit = Unit.MINUTE,
+    sessiontemplate: Optional[SessionTemplate] = None,
+    tz: str = EXCHANGE_TIMEZONE,
+) -> BarsFrame:
+    """
+    Aggregate bars into a coarser timeframe.
+
+    Minute buckets are aligned to the session open and never span sessions;
+    the last bucket of a session ends at the close, like the API's own
+    bars. Bars outside the session hours of `sessiontemplate` are dropped,
+    so pass the template the bars were fetched with. Prices take the first
+    open, highest high, lowest low and last close; volumes and tick counts
+    are summed. Intraday bars are stamped with their bucket end; daily,
+    weekly and monthly bars with their last source bar. A trailing bucket
+    that the source bars do not reach the end of is marked "Open".
+
+    Args:
+        frame: Source bars in time order, such as 1-minute bars
+        interval: Bars per bucket in `unit`, a multiple of the source interval
+        unit: Unit of the target timeframe
+        sessiontemplate: Session hours to respect (default: regular hours)
+        tz: Exchange time zone the session hours are in
+    """
+    if interval < 1:
+        raise ValueError("interval must be at least 1")
+    session_open, session_close = SESSION_HOURS[
+        sessiontemplate or SessionTemplate.DEFAULT
+    ]
+    open_ms = _milliseconds(session_open)
+    close_ms = _milliseconds(session_close) or DAY_MS
+    bucket_ms = interval * MINUTE_MS
+    clock = ExchangeClock(tz)
+    month_of: Dict[int, int] = {}
+
+    # Group key, stamped epoch and source row of every bar inside a session.
+    keys: List[int] = []
+    ends: List[int] = []
+    rows: List[int] = []
+    offsets = clock.offsets
+    for row, epoch in enumerate(frame.epoch):
+        offset = offsets.get(epoch // HOUR_MS)
+        if offset is None:
+            offset = clock.offset(epoch)
+        # Bars are stamped at their end, so place them by their last instant.
+        local = epoch - 1 + offset
+        day, time_of_day = divmod(local, DAY_MS)
+        if not open_ms <= time_of_day < close_ms:
+            continue
+        if unit is Unit.MINUTE:
+            index = (time_of_day - open_ms) // bucket_ms
+            key = day * DAY_MS + index
+            end = open_ms + (index + 1) * bucket_ms
+            if end > close_ms:
+                end = close_ms
+            ends.append(day * DAY_MS + end - offset)
+        else:
+            if unit is Unit.DAILY:
+                period = day
+            elif unit is Unit.WEEKLY:
+                # 1970-01-01 was a Thursday; shift so weeks start on Monday.
+                period = (day + 3) // 7
+            else:
+                period = month_of.get(day, -1)
+                if period < 0:
+                    moment = _EPOCH + timedelta(days=day)
+                    period = month_of[day] = moment.year * 12 + moment.month - 1
+            key = period // interval
+            ends.append(epoch)
+        keys.append(key)
+        rows.append(row)
+
+    return _aggregate(frame, keys, ends, rows, unit is Unit.MINUTE)
+
+
+def _aggregate(
+    frame: BarsFrame,
+    keys: List[int],
+    ends: List[int],
+    rows: List[int],
+    mark_partial: bool,
+) -> BarsFrame:
+    """Collapse runs of equal keys into one bar each, one column at a time."""
+    if not keys:
+        return BarsFrame()
+    bounds = [i for i in range(1, len(keys)) if keys[i] != keys[i - 1]]
+    starts = [0] + bounds
+    stops = bounds + [len(keys)]
+    firsts = [rows[start] for start in starts]
+    lasts = [rows[stop - 1] for stop in stops]
+
+    columns: Dict[str, "array[Any]"] = {}
+    for name, _, typecode in BAR_COLUMNS:
+        get = getattr(frame, name).__getitem__
+        if name == "epoch":
+            values: Iterable[Any] = (ends[stop - 1] for stop in stops)
+        elif name == "open":
+            values = map(get, firsts)
+        elif name == "high":
+            values = (max(map(get, rows[a:b])) for a, b in zip(starts, stops))
+        elif name == "low":
+            values = (min(map(get, rows[a:b])) for a, b in zip(starts, stops))
+        elif name in SUMMED:
+            values = (sum(map(get, rows[a:b])) for a, b in zip(starts, stops))
+        else:
+            values = map(get, lasts)
+        columns[name] = array(typecode, values)
+
+    statuses = [frame.bar_status[row] for row in lasts]
+    if mark_partial and frame.epoch[lasts[-1]] < columns["epoch"][-1]:
+        statuses[-1] = "Open"
+    return BarsFrame(columns, statuses)
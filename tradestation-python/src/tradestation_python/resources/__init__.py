@@ -1,3 +1,17 @@
-from .brokerage import Brokerage  # noqa: F401
-from .market_data import MarketData  # noqa: F401
-from .order_execution import OrderExecution  # noqa: F401
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".brokerage": ["AsyncBrokerage", "Brokerage"],
+        ".market_data": ["AsyncMarketData", "MarketData"],
+        ".order_execution": ["AsyncOrderExecution", "OrderExecution"],
+    },
+)
+
+if TYPE_CHECKING:
+    from .brokerage import AsyncBrokerage, Brokerage  # noqa: F401
+    from .market_data import AsyncMarketData, MarketData  # noqa: F401
+    from .order_execution import AsyncOrderExecution, OrderExecution  # noqa: F401
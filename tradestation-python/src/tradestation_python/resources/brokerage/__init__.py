@@ -1 +1,8 @@
-from .brokerage import Brokerage  # noqa: F401
+from .brokerage import AsyncBrokerage, Brokerage  # noqa: F401
+from .poller import (  # noqa: F401
+    AsyncBrokeragePoller,
+    BrokerageChanges,
+    BrokeragePoller,
+    PollStats,
+    SnapshotDiff,
+)
@@ -1,10 +1,63 @@
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from ..._resource import SyncAPIResource
-from ...types.responses import AccountsResponse
+import anyio
+
+from ..._resource import AsyncAPIResource, SyncAPIResource
+from ...types.responses import (
+    AccountOrdersResponse,
+    AccountsResponse,
+    BalancesResponse,
+    PositionsResponse,
+)
+from ...types.responses.base import BaseResponse
 
 if TYPE_CHECKING:
-    from tradestation._client import TradeStation
+    from ..._client import AsyncTradeStation, TradeStation
+    from .poller import AsyncBrokeragePoller, BrokeragePoller
+
+# Maximum number of account IDs the brokerage endpoints accept per request.
+MAX_ACCOUNTS_PER_REQUEST = 25
+
+AccountsResponseT = TypeVar("AccountsResponseT", bound=BaseResponse)
+
+
+def _account_batches(account_ids: Union[str, Iterable[str]]) -> List[str]:
+    """Comma-join unique account IDs into request-sized batches."""
+    if isinstance(account_ids, str):
+        account_ids = account_ids.split(",")
+    ids = list(dict.fromkeys(filter(None, (i.strip() for i in account_ids))))
+    if not ids:
+        raise ValueError("At least one account ID is required")
+    return [
+        ",".join(ids[i : i + MAX_ACCOUNTS_PER_REQUEST])
+        for i in range(0, len(ids), MAX_ACCOUNTS_PER_REQUEST)
+    ]
+
+
+def _merge(responses: Sequence[AccountsResponseT]) -> AccountsResponseT:
+    """Concatenate the list fields of per-batch responses, in batch order."""
+    first = responses[0]
+    if len(responses) == 1:
+        return first
+    merged = {
+        name: [item for response in responses for item in getattr(response, name)]
+        for name in type(first).model_fields
+        if isinstance(getattr(first, name), list)
+    }
+    return first.model_copy(update=merged)
 
 
 class Brokerage(SyncAPIResource):
@@ -15,3 +68,268 @@ class Brokerage(SyncAPIResource):
         return self._client._make_request(
             "GET", "brokerage/accounts", response_model=AccountsResponse
         )
+
+    def balances(
+        self, account_ids: Union[str, Iterable[str]], max_in_flight: int = 8
+    ) -> BalancesResponse:
+        """
+        Get the current balances of any number of accounts.
+
+        Account IDs are sent in batches of up to 25 per request, with
+        batches fetched concurrently and merged in order.
+
+        Args:
+            account_ids: Account IDs, or a comma-separated string of them
+            max_in_flight: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            BalancesResponse: Every balance, plus an error per account the
+                API could not query
+        """
+
+        def fetch(batch: str) -> BalancesResponse:
+            return self._get(f"brokerage/accounts/{batch}/balances", BalancesResponse)
+
+        return self._fetch_batches(fetch, account_ids, max_in_flight)
+
+    def positions(
+        self,
+        account_ids: Union[str, Iterable[str]],
+        symbol: Optional[str] = None,
+        max_in_flight: int = 8,
+    ) -> PositionsResponse:
+        """
+        Get the open positions of any number of accounts.
+
+        Args:
+            account_ids: Account IDs, or a comma-separated string of them
+            symbol: Only return positions in these comma-separated symbols;
+                `*` matches any suffix, as in `MSFT *` for MSFT options
+            max_in_flight: Maximum number of concurrent requests (default: 8)
+        """
+        params = {"symbol": symbol} if symbol else None
+
+        def fetch(batch: str) -> PositionsResponse:
+            return self._get(
+                f"brokerage/accounts/{batch}/positions", PositionsResponse, params
+            )
+
+        return self._fetch_batches(fetch, account_ids, max_in_flight)
+
+    def orders(
+        self,
+        account_ids: Union[str, Iterable[str]],
+        page_size: Optional[int] = None,
+        max_in_flight: int = 8,
+    ) -> AccountOrdersResponse:
+        """
+        Get today's and open orders of any number of accounts.
+
+        Each batch follows `NextToken` until its last page; batches are
+        fetched concurrently.
+
+        Args:
+            account_ids: Account IDs, or a comma-separated string of them
+            page_size: Orders per page (API default: 600, also the maximum)
+            max_in_flight: Maximum number of concurrent requests (default: 8)
+        """
+
+        def fetch(batch: str) -> AccountOrdersResponse:
+            endpoint = f"brokerage/accounts/{batch}/orders"
+            params: Dict[str, str] = {}
+            if page_size is not None:
+                params["pageSize"] = str(page_size)
+            pages = [self._get(endpoint, AccountOrdersResponse, params)]
+            while pages[-1].next_token:
+                params["nextToken"] = pages[-1].next_token
+                pages.append(self._get(endpoint, AccountOrdersResponse, params))
+            return _merge(pages).model_copy(update={"next_token": None})
+
+        return self._fetch_batches(fetch, account_ids, max_in_flight)
+
+    def poller(
+        self,
+        account_ids: Union[str, Iterable[str]],
+        balances: bool = True,
+        positions: bool = True,
+        max_in_flight: int = 8,
+    ) -> "BrokeragePoller":
+        """
+        Track balances and positions, reporting only what changed per poll.
+
+        Args:
+            account_ids: Account IDs, or a comma-separated string of them
+            balances: Track balances (default: True)
+            positions: Track positions (default: True)
+            max_in_flight: Maximum number of concurrent requests (default: 8)
+        """
+        from .poller import BrokeragePoller
+
+        return BrokeragePoller(
+            self, account_ids, balances, positions, max_in_flight=max_in_flight
+        )
+
+    def _get(
+        self,
+        endpoint: str,
+        response_model: Type[AccountsResponseT],
+        params: Optional[Dict[str, str]] = None,
+    ) -> AccountsResponseT:
+        return self._client._make_request(
+            "GET", endpoint, params=params, response_model=response_model
+        )
+
+    def _fetch_batches(
+        self,
+        fetch: Callable[[str], AccountsResponseT],
+        account_ids: Union[str, Iterable[str]],
+        max_in_flight: int,
+    ) -> AccountsResponseT:
+        batches = _account_batches(account_ids)
+        if len(batches) == 1:
+            return fetch(batches[0])
+        with ThreadPoolExecutor(max_workers=min(max_in_flight, len(batches))) as pool:
+            return _merge(list(pool.map(fetch, batches)))
+
+
+class AsyncBrokerage(AsyncAPIResource):
+    def __init__(self, client: "AsyncTradeStation") -> None:
+        super().__init__(client)
+
+    async def accounts(self) -> AccountsResponse:
+        return await self._client._make_request(
+            "GET", "brokerage/accounts", response_model=AccountsResponse
+        )
+
+    async def balances(
+        self, account_ids: Union[str, Iterable[str]], max_in_flight: int = 8
+    ) -> BalancesResponse:
+        """
+        Get the current balances of any number of accounts.
+
+        Account IDs are sent in batches of up to 25 per request, with
+        batches fetched concurrently and merged in order.
+
+        Args:
+            account_ids: Account IDs, or a comma-separated string of them
+            max_in_flight: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            BalancesResponse: Every balance, plus an error per account the
+                API could not query
+        """
+
+        async def fetch(batch: str) -> BalancesResponse:
+            return await self._get(
+                f"brokerage/accounts/{batch}/balances", BalancesResponse
+            )
+
+        return await self._fetch_batches(fetch, account_ids, max_in_flight)
+
+    async def positions(
+        self,
+        account_ids: Union[str, Iterable[str]],
+        symbol: Optional[str] = None,
+        max_in_flight: int = 8,
+    ) -> PositionsResponse:
+        """
+        Get the open positions of any number of accounts.
+
+        Args:
+            account_ids: Account IDs, or a comma-separated string of them
+            symbol: Only return positions in these comma-separated symbols;
+                `*` matches any suffix, as in `MSFT *` for MSFT options
+            max_in_flight: Maximum number of concurrent requests (default: 8)
+        """
+        params = {"symbol": symbol} if symbol else None
+
+        async def fetch(batch: str) -> PositionsResponse:
+            return await self._get(
+                f"brokerage/accounts/{batch}/positions", PositionsResponse, params
+            )
+
+        return await self._fetch_batches(fetch, account_ids, max_in_flight)
+
+    async def orders(
+        self,
+        account_ids: Union[str, Iterable[str]],
+        page_size: Optional[int] = None,
+        max_in_flight: int = 8,
+    ) -> AccountOrdersResponse:
+        """
+        Get today's and open orders of any number of accounts.
+
+        Each batch follows `NextToken` until its last page; batches are
+        fetched concurrently.
+
+        Args:
+            account_ids: Account IDs, or a comma-separated string of them
+            page_size: Orders per page (API default: 600, also the maximum)
+            max_in_flight: Maximum number of concurrent requests (default: 8)
+        """
+
+        async def fetch(batch: str) -> AccountOrdersResponse:
+            endpoint = f"brokerage/accounts/{batch}/orders"
+            params: Dict[str, str] = {}
+            if page_size is not None:
+                params["pageSize"] = str(page_size)
+            pages = [await self._get(endpoint, AccountOrdersResponse, params)]
+            while pages[-1].next_token:
+                params["nextToken"] = pages[-1].next_token
+                pages.append(await self._get(endpoint, AccountOrdersResponse, params))
+            return _merge(pages).model_copy(update={"next_token": None})
+
+        return await self._fetch_batches(fetch, account_ids, max_in_flight)
+
+    def poller(
+        self,
+        account_ids: Union[str, Iterable[str]],
+        balances: bool = True,
+        positions: bool = True,
+        max_in_flight: int = 8,
+    ) -> "AsyncBrokeragePoller":
+        """
+        Track balances and positions, reporting only what changed per poll.
+
+        Args:
+            account_ids: Account IDs, or a comma-separated string of them
+            balances: Track balances (default: True)
+            positions: Track positions (default: True)
+            max_in_flight: Maximum number of concurrent requests (default: 8)
+        """
+        from .poller import AsyncBrokeragePoller
+
+        return AsyncBrokeragePoller(
+            self, account_ids, balances, positions, max_in_flight=max_in_flight
+        )
+
+    async def _get(
+        self,
+        endpoint: str,
+        response_model: Type[AccountsResponseT],
+        params: Optional[Dict[str, str]] = None,
+    ) -> AccountsResponseT:
+        return await self._client._make_request(
+            "GET", endpoint, params=params, response_model=response_model
+        )
+
+    async def _fetch_batches(
+        self,
+        fetch: Callable[[str], Awaitable[AccountsResponseT]],
+        account_ids: Union[str, Iterable[str]],
+        max_in_flight: int,
+    ) -> AccountsResponseT:
+        batches = _account_batches(account_ids)
+        if len(batches) == 1:
+            return await fetch(batches[0])
+        limiter = anyio.CapacityLimiter(max_in_flight)
+        results: List[Optional[AccountsResponseT]] = [None] * len(batches)
+
+        async def run(index: int) -> None:
+            async with limiter:
+                results[index] = await fetch(batches[index])
+
+        async with anyio.create_task_group() as tg:
+            for index in range(len(batches)):
+                tg.start_soon(run, index)
+        return _merge([result for result in results if result is not None])
@@ -0,0 +1,387 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import anyio
+import httpx
+
+from ...types.responses import AccountError, Balance, Position
+from ...types.responses.base import BaseResponse
+from .brokerage import _account_batches
+
+if TYPE_CHECKING:
+    from .brokerage import AsyncBrokerage, Brokerage
+
+RecordT = TypeVar("RecordT", bound=BaseResponse)
+
+
+class SnapshotDiff(Generic[RecordT]):
+    """Records added, removed and changed since the previous poll, by key."""
+
+    def __init__(self) -> None:
+        self.added: Dict[Hashable, RecordT] = {}
+        self.removed: Dict[Hashable, RecordT] = {}
+        # Previous and current version of every changed record.
+        self.changed: Dict[Hashable, Tuple[RecordT, RecordT]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(added={len(self.added)}, "
+            f"removed={len(self.removed)}, changed={len(self.changed)})"
+        )
+
+
+class BrokerageChanges:
+    """Outcome of one poll: a diff per endpoint plus per-account errors."""
+
+    def __init__(self) -> None:
+        self.balances: SnapshotDiff[Balance] = SnapshotDiff()
+        self.positions: SnapshotDiff[Position] = SnapshotDiff()
+        self.errors: List[AccountError] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.balances or self.positions)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(balances={self.balances!r}, "
+            f"positions={self.positions!r}, errors={len(self.errors)})"
+        )
+
+
+class PollStats:
+    """How much work polling skipped."""
+
+    def __init__(self) -> None:
+        self.polls = 0
+        self.requests = 0
+        # Batches answered 304 Not Modified, or with a byte-identical body.
+        self.not_modified = 0
+        self.unchanged = 0
+        self.validated = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(polls={self.polls}, requests={self.requests}, "
+            f"not_modified={self.not_modified}, unchanged={self.unchanged}, "
+            f"validated={self.validated})"
+        )
+
+
+class _Batch:
+    """What was last received for one batch of accounts."""
+
+    __slots__ = ("etag", "digest", "raw", "errors")
+
+    def __init__(self) -> None:
+        self.etag: Optional[str] = None
+        self.digest: Optional[bytes] = None
+        # Decoded record of every key, for comparing before validating.
+        self.raw: Dict[Hashable, Any] = {}
+        # Per-account errors of the last body, repeated while it is unchanged.
+        self.errors: List[Dict[str, Any]] = []
+
+
+class Snapshot(Generic[RecordT]):
+    """
+    The last known records of one endpoint, indexed by key.
+
+    Args:
+        endpoint: Endpoint template, formatted with comma-joined account IDs
+        model: Record model
+        field: Top-level JSON field holding the records
+        key: JSON fields identifying a record
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        model: Type[RecordT],
+        field: str,
+        key: Tuple[str, ...],
+    ) -> None:
+        self.endpoint = endpoint
+        self.model = model
+        self.field = field
+        self.key = key
+        self.records: Dict[Hashable, RecordT] = {}
+        self._batches: Dict[str, _Batch] = {}
+
+    def _key(self, record: Dict[str, Any]) -> Hashable:
+        if len(self.key) == 1:
+            return record[self.key[0]]
+        return tuple(record[name] for name in self.key)
+
+    @staticmethod
+    def _account(key: Hashable) -> Hashable:
+        return key[0] if isinstance(key, tuple) else key
+
+    def headers(self, batch: str) -> Optional[Dict[str, str]]:
+        """Conditional request headers for `batch`."""
+        state = self._batches.get(batch)
+        if state is None or state.etag is None:
+            return None
+        return {"If-None-Match": state.etag}
+
+    def apply(
+        self,
+        batch: str,
+        response: httpx.Response,
+        loads: Callable[[bytes], Any],
+        diff: SnapshotDiff[RecordT],
+        stats: PollStats,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fold one batch response into the snapshot, recording changes in `diff`.
+
+        Accounts reported in the batch's errors are left as they were: their
+        records are missing from the body because the query failed, not
+        because they went away. Returns the batch's per-account errors,
+        including on polls that find the body unchanged.
+        """
+        state = self._batches.setdefault(batch, _Batch())
+        if response.status_code == 304:
+            stats.not_modified += 1
+            return state.errors
+        content = response.content
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if digest == state.digest:
+            stats.unchanged += 1
+            return state.errors
+
+        # Nothing is saved until the whole batch has decoded and validated,
+        # so a body that fails is applied again on the next poll.
+        payload = loads(content)
+        errors = payload.get("Errors") or []
+        failed = {error.get("AccountID") for error in errors}
+        previous = state.raw
+        raw = {
+            key: record
+            for key, record in previous.items()
+            if self._account(key) in failed
+        }
+        updated: Dict[Hashable, RecordT] = {}
+        for record in payload.get(self.field) or ():
+            key = self._key(record)
+            raw[key] = record
+            if previous.get(key) != record:
+                updated[key] = self.model.model_validate(record)
+        stats.validated += len(updated)
+
+        records = self.records
+        for key, model in updated.items():
+            old = records.get(key)
+            records[key] = model
+            if old is None:
+                diff.added[key] = model
+            else:
+                diff.changed[key] = (old, model)
+        for key in previous.keys() - raw.keys():
+            diff.removed[key] = records.pop(key)
+        state.etag = response.headers.get("ETag")
+        state.digest = digest
+        state.raw = raw
+        state.errors = errors
+        return errors
+
+
+def _snapshots(balances: bool, positions: bool) -> Dict[str, Snapshot[Any]]:
+    snapshots: Dict[str, Snapshot[Any]] = {}
+    if balances:
+        snapshots["balances"] = Snapshot(
+            "brokerage/accounts/{}/balances", Balance, "Balances", ("AccountID",)
+        )
+    if positions:
+        snapshots["positions"] = Snapshot(
+            "brokerage/accounts/{}/positions",
+            Position,
+            "Positions",
+            ("AccountID", "PositionID"),
+        )
+    return snapshots
+
+
+class BrokeragePoller:
+    """
+    Poll balances and positions, delivering only what changed.
+
+    Each batch of accounts is requested with the ETag of its last response,
+    and a body identical to the last one is detected by hash, so an
+    unchanged batch is neither decoded nor validated. In a changed batch
+    only the records that differ are validated. Work downstream of `poll`
+    therefore scales with the rate of change rather than with book size.
+
+    Args:
+        brokerage: The brokerage resource to poll through
+        account_ids: Account IDs, or a comma-separated string of them
+        balances: Track balances, keyed by account ID
+        positions: Track positions, keyed by (account ID, position ID)
+        max_in_flight: Maximum number of concurrent requests
+    """
+
+    def __init__(
+        self,
+        brokerage: "Brokerage",
+        account_ids: Union[str, Iterable[str]],
+        balances: bool = True,
+        positions: bool = True,
+        max_in_flight: int = 8,
+    ) -> None:
+        self._client = brokerage._client
+        self.batches = _account_batches(account_ids)
+        self.snapshots = _snapshots(balances, positions)
+        self.max_in_flight = max_in_flight
+        self.stats = PollStats()
+
+    @property
+    def balances(self) -> Dict[Hashable, Balance]:
+        """Current balances by account ID."""
+        return self.snapshots["balances"].records
+
+    @property
+    def positions(self) -> Dict[Hashable, Position]:
+        """Current positions by (account ID, position ID)."""
+        return self.snapshots["positions"].records
+
+    def poll(self) -> BrokerageChanges:
+        """Fetch every tracked endpoint once and return the changes."""
+        requests = [(name, batch) for name in self.snapshots for batch in self.batches]
+
+        def fetch(request: Tuple[str, str]) -> httpx.Response:
+            name, batch = request
+            snapshot = self.snapshots[name]
+            return self._client._request(
+                "GET",
+                snapshot.endpoint.format(batch),
+                headers=snapshot.headers(batch),
+            )
+
+        if len(requests) == 1:
+            responses = [fetch(requests[0])]
+        else:
+            workers = min(self.max_in_flight, len(requests))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                responses = list(pool.map(fetch, requests))
+        return _apply(self, requests, responses)
+
+    def watch(self, interval: float) -> Iterator[BrokerageChanges]:
+        """
+        Poll every `interval` seconds, yielding only polls that changed something.
+
+        The first poll reports everything as added.
+        """
+        while True:
+            started = monotonic()
+            changes = self.poll()
+            if changes:
+                yield changes
+            sleep(max(0.0, interval - (monotonic() - started)))
+
+
+class AsyncBrokeragePoller:
+    """
+    Async counterpart of :class:`BrokeragePoller`.
+
+    Args:
+        brokerage: The brokerage resource to poll through
+        account_ids: Account IDs, or a comma-separated string of them
+        balances: Track balances, keyed by account ID
+        positions: Track positions, keyed by (account ID, position ID)
+        max_in_flight: Maximum number of concurrent requests
+    """
+
+    def __init__(
+        self,
+        brokerage: "AsyncBrokerage",
+        account_ids: Union[str, Iterable[str]],
+        balances: bool = True,
+        positions: bool = True,
+        max_in_flight: int = 8,
+    ) -> None:
+        self._client = brokerage._client
+        self.batches = _account_batches(account_ids)
+        self.snapshots = _snapshots(balances, positions)
+        self.max_in_flight = max_in_flight
+        self.stats = PollStats()
+
+    @property
+    def balances(self) -> Dict[Hashable, Balance]:
+        """Current balances by account ID."""
+        return self.snapshots["balances"].records
+
+    @property
+    def positions(self) -> Dict[Hashable, Position]:
+        """Current positions by (account ID, position ID)."""
+        return self.snapshots["positions"].records
+
+    async def poll(self) -> BrokerageChanges:
+        """Fetch every tracked endpoint once and return the changes."""
+        requests = [(name, batch) for name in self.snapshots for batch in self.batches]
+        responses: List[Optional[httpx.Response]] = [None] * len(requests)
+        limiter = anyio.CapacityLimiter(self.max_in_flight)
+
+        async def fetch(index: int) -> None:
+            name, batch = requests[index]
+            snapshot = self.snapshots[name]
+            async with limiter:
+                responses[index] = await self._client._request(
+                    "GET",
+                    snapshot.endpoint.format(batch),
+                    headers=snapshot.headers(batch),
+                )
+
+        async with anyio.create_task_group() as tg:
+            for index in range(len(requests)):
+                tg.start_soon(fetch, index)
+        return _apply(self, requests, [r for r in responses if r is not None])
+
+    async def watch(self, interval: float) -> AsyncIterator[BrokerageChanges]:
+        """
+        Poll every `interval` seconds, yielding only polls that changed something.
+
+        The first poll reports everything as added.
+        """
+        while True:
+            started = monotonic()
+            changes = await self.poll()
+            if changes:
+                yield changes
+            await anyio.sleep(max(0.0, interval - (monotonic() - started)))
+
+
+def _apply(
+    poller: Union[BrokeragePoller, AsyncBrokeragePoller],
+    requests: List[Tuple[str, str]],
+    responses: List[httpx.Response],
+) -> BrokerageChanges:
+    """Fold a round of responses into the poller's snapshots."""
+    changes = BrokerageChanges()
+    loads = poller._client.decoder.loads
+    stats = poller.stats
+    stats.polls += 1
+    stats.requests += len(responses)
+    for (name, batch), response in zip(requests, responses):
+        diff = getattr(changes, name)
+        for error in poller.snapshots[name].apply(batch, response, loads, diff, stats):
+            changes.errors.append(AccountError.model_validate(error))
+    return changes
@@ -1 +1,7 @@
-from .market_data import MarketData  # noqa: F401
+from .market_data import AsyncMarketData, BarsResult, MarketData  # noqa: F401
+from .streams import (  # noqa: F401
+    QuoteStream,
+    QuoteStreamManager,
+    QuoteStreamStats,
+    QuoteSubscription,
+)
@@ -1,20 +1,285 @@
-from typing import TYPE_CHECKING, Optional
+import math
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
-from ..._resource import SyncAPIResource
+import anyio
+import httpx
+
+from ..._resource import AsyncAPIResource, SyncAPIResource
+from ..._retry import RetryPolicy
+from ..._streaming import StreamSession
+from ...lib.bar_cache import BarCache, BarCacheKey
+from ...types.enums import SessionTemplate, Unit
+from ...types.responses import (
+    Bar,
+    BarsFrame,
+    BarsResponse,
+    Heartbeat,
+    StreamStatus,
+)
+from .streams import MAX_SYMBOLS_PER_STREAM, QuoteStreamManager
 
 if TYPE_CHECKING:
-    from tradestation._client import TradeStation
+    from anyio.abc import TaskGroup
+    from anyio.streams.memory import (
+        MemoryObjectReceiveStream,
+        MemoryObjectSendStream,
+    )
 
-from datetime import datetime
+    from ..._client import AsyncTradeStation, TradeStation
 
-from ...types.enums import SessionTemplate, Unit
-from ...types.responses import BarsResponse
+# A (firstdate, lastdate) pair; a None lastdate runs to the present.
+DateRange = Tuple[datetime, Optional[datetime]]
+
+# Maximum number of bars the barcharts endpoint returns for a single request.
+MAX_BARS_PER_REQUEST = 57600
+
+
+class BarsResult(NamedTuple):
+    """Outcome of fetching bars for one symbol in a batch."""
+
+    symbol: str
+    bars: Optional[Union[BarsResponse, BarsFrame]] = None
+    error: Optional[Exception] = None
+
+
+_UNIT_SPANS = {
+    Unit.MINUTE: timedelta(minutes=1),
+    Unit.DAILY: timedelta(days=1),
+    Unit.WEEKLY: timedelta(weeks=1),
+    Unit.MONTHLY: timedelta(days=31),
+}
+
+
+def _bars_params(
+    interval: int,
+    unit: Unit,
+    barsback: Optional[int] = None,
+    firstdate: Optional[datetime] = None,
+    lastdate: Optional[datetime] = None,
+    sessiontemplate: Optional[SessionTemplate] = None,
+) -> Dict[str, str]:
+    """Build barcharts query parameters."""
+    params = {
+        "interval": str(interval),
+        "unit": unit.value,
+    }
+    dt_format = r"%Y-%m-%dT%H:%M:%SZ"
+
+    # Add optional parameters if provided
+    if barsback is not None:
+        params["barsback"] = str(barsback)
+    if firstdate is not None:
+        params["firstdate"] = firstdate.strftime(dt_format)
+    if lastdate is not None:
+        params["lastdate"] = lastdate.strftime(dt_format)
+    if sessiontemplate is not None:
+        params["sessiontemplate"] = sessiontemplate.value
+
+    return params
+
+
+def _bar_windows(
+    firstdate: datetime,
+    lastdate: Optional[datetime],
+    interval: int,
+    unit: Unit,
+    window_size: int,
+) -> List[Tuple[datetime, datetime]]:
+    """
+    Split a date range into windows that each hold at most `window_size` bars.
+
+    Window spans are measured in calendar time, which never holds fewer bars
+    than the same span of trading time, so no window can exceed the server cap.
+    Consecutive windows share their boundary; callers de-duplicate on epoch.
+    """
+    if lastdate is None:
+        lastdate = datetime.now(timezone.utc)
+        if firstdate.tzinfo is None:
+            lastdate = lastdate.replace(tzinfo=None)
+    if lastdate < firstdate:
+        raise ValueError("lastdate must not be earlier than firstdate.")
+
+    span = _UNIT_SPANS[unit] * interval * window_size
+    windows = []
+    start = firstdate
+    while True:
+        end = min(start + span, lastdate)
+        windows.append((start, end))
+        if end >= lastdate:
+            return windows
+        start = end
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, matching how request dates are formatted."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _epoch_ms(value: datetime) -> int:
+    return int(_as_utc(value).timestamp() * 1000)
+
+
+def _cache_fetch_ranges(
+    cache: BarCache,
+    key: BarCacheKey,
+    firstdate: datetime,
+    lastdate: Optional[datetime],
+) -> Tuple[Optional[DateRange], Optional[DateRange]]:
+    """
+    Decide what a cached request still needs from the API.
+
+    Returns the (start, end) dates of the head missing before the cached
+    series and of the tail missing after it, or None where nothing is
+    missing. Both reach the cached series, even when the request itself
+    stops short of it, so the series stays contiguous.
+    """
+    first = cache.first_epoch(key)
+    last = cache.last_epoch(key)
+    if first is None or last is None:
+        return None, (firstdate, lastdate)
+    head: Optional[DateRange] = None
+    tail: Optional[DateRange] = None
+    if _epoch_ms(firstdate) < first:
+        head = (firstdate, datetime.fromtimestamp(first / 1000, tz=timezone.utc))
+    if lastdate is None or _epoch_ms(lastdate) > last:
+        tail = (datetime.fromtimestamp(last / 1000, tz=timezone.utc), lastdate)
+    return head, tail
+
+
+def _cache_update(
+    cache: BarCache,
+    key: BarCacheKey,
+    head: BarsFrame,
+    tail: BarsFrame,
+    firstdate: datetime,
+    lastdate: Optional[datetime],
+) -> BarsFrame:
+    """Splice fetched bars around the cached series and return the request."""
+    first = cache.first_epoch(key)
+    if first is not None:
+        head = head[: bisect_left(head.epoch, first)]
+    if len(head):
+        cache.write(key, BarsFrame.concat([head, cache.read(key)]))
+    cache.append(key, tail)
+
+    cached = cache.read(
+        key,
+        start_epoch=_epoch_ms(firstdate),
+        end_epoch=None if lastdate is None else _epoch_ms(lastdate),
+    )
+    # Bars that are still open are returned but never cached as final.
+    last = cache.last_epoch(key)
+    pending = tail if last is None else tail[bisect_right(tail.epoch, last) :]
+    return BarsFrame.concat([cached, pending])
+
+
+class _BarStream(StreamSession):
+    """Resumable barcharts stream that picks up from the last bar seen."""
+
+    def __init__(
+        self,
+        retry_policy: RetryPolicy,
+        interval: int,
+        unit: Unit,
+        barsback: Optional[int],
+        sessiontemplate: Optional[SessionTemplate],
+        include_status: bool,
+    ) -> None:
+        super().__init__(retry_policy)
+        self.interval = interval
+        self.unit = unit
+        self.barsback = barsback
+        self.sessiontemplate = sessiontemplate
+        self.include_status = include_status
+        self.last: Optional[Bar] = None
+
+    def params(self) -> Dict[str, str]:
+        """Query parameters for (re)opening the stream."""
+        barsback = self.barsback
+        if self.last is not None:
+            # The stream endpoint only accepts barsback, so ask for every bar
+            # that can have elapsed since the last one (calendar time over-
+            # counts trading bars) and drop the overlap in `handle`.
+            elapsed = _epoch_ms(datetime.now(timezone.utc)) - self.last.epoch
+            span = _UNIT_SPANS[self.unit] * self.interval // timedelta(milliseconds=1)
+            barsback = min(MAX_BARS_PER_REQUEST, max(0, elapsed) // span + 2)
+        return _bars_params(
+            self.interval, self.unit, barsback, sessiontemplate=self.sessiontemplate
+        )
+
+    def handle(self, line: str) -> Optional[Union[Bar, Heartbeat, StreamStatus]]:
+        """Decode one line, returning the message to yield if any."""
+        message = self.decode(line)
+        if message is None or isinstance(message, (Heartbeat, StreamStatus)):
+            return message if self.include_status else None
+
+        bar = Bar.model_validate(message)
+        last = self.last
+        if last is not None and (
+            bar.epoch < last.epoch
+            or (bar.epoch == last.epoch and last.bar_status == "Closed")
+        ):
+            return None
+        self.last = bar
+        return bar
 
 
 class MarketData(SyncAPIResource):
     def __init__(self, client: "TradeStation") -> None:
         super().__init__(client)
 
+    @overload
+    def bars(
+        self,
+        symbol: str,
+        interval: int = ...,
+        unit: Unit = ...,
+        barsback: Optional[int] = ...,
+        firstdate: Optional[datetime] = ...,
+        lastdate: Optional[datetime] = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        as_columns: Literal[False] = ...,
+    ) -> BarsResponse: ...
+
+    @overload
+    def bars(
+        self,
+        symbol: str,
+        interval: int = ...,
+        unit: Unit = ...,
+        barsback: Optional[int] = ...,
+        firstdate: Optional[datetime] = ...,
+        lastdate: Optional[datetime] = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        *,
+        as_columns: Literal[True],
+    ) -> BarsFrame: ...
+
     def bars(
         self,
         symbol: str,
@@ -24,7 +289,8 @@ class MarketData(SyncAPIResource):
         firstdate: Optional[datetime] = None,
         lastdate: Optional[datetime] = None,
         sessiontemplate: Optional[SessionTemplate] = None,
-    ) -> BarsResponse:
+        as_columns: bool = False,
+    ) -> Union[BarsResponse, BarsFrame]:
         """
         Get bar data for a symbol.
 
@@ -37,29 +303,31 @@ class MarketData(SyncAPIResource):
             lastdate: The last date as datetime object (defaults to current timestamp)
             sessiontemplate: US stock market session template.
                 Valid values: USEQPre, USEQPost, USEQPreAndPost, USEQ24Hour, Default
+            as_columns: Decode the payload straight into a columnar BarsFrame instead
+                of validating one Bar model per bar (default: False)
 
         Returns:
-            BarsResponse: The bars response containing bar data
+            BarsResponse: The bars response containing bar data, or a BarsFrame
+                when as_columns is set
 
         Note:
             Datetime parameters are automatically formatted as ISO 8601 strings (YYYY-MM-DDTHH:MM:SSZ)
             when sent to the API.
         """
-        params = {
-            "interval": str(interval),
-            "unit": unit.value,
-        }
-        dt_format = r"%Y-%m-%dT%H:%M:%SZ"
-
-        # Add optional parameters if provided
-        if barsback is not None:
-            params["barsback"] = str(barsback)
-        if firstdate is not None:
-            params["firstdate"] = firstdate.strftime(dt_format)
-        if lastdate is not None:
-            params["lastdate"] = lastdate.strftime(dt_format)
-        if sessiontemplate is not None:
-            params["sessiontemplate"] = sessiontemplate.value
+        params = _bars_params(
+            interval, unit, barsback, firstdate, lastdate, sessiontemplate
+        )
+
+        return self._get_bars(symbol, params, as_columns)
+
+    def _get_bars(
+        self, symbol: str, params: Dict[str, str], as_columns: bool
+    ) -> Union[BarsResponse, BarsFrame]:
+        if as_columns:
+            response = self._client._request(
+                "GET", f"marketdata/barcharts/{symbol}", params=params
+            )
+            return BarsFrame.from_json(response.content, self._client.decoder.loads)
 
         return self._client._make_request(
             "GET",
@@ -67,3 +335,930 @@ class MarketData(SyncAPIResource):
             params=params,
             response_model=BarsResponse,
         )
+
+    @overload
+    def iter_bars(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = ...,
+        interval: int = ...,
+        unit: Unit = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        max_workers: int = ...,
+        window_size: int = ...,
+        as_columns: Literal[False] = ...,
+    ) -> Iterator[Bar]: ...
+
+    @overload
+    def iter_bars(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = ...,
+        interval: int = ...,
+        unit: Unit = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        max_workers: int = ...,
+        window_size: int = ...,
+        *,
+        as_columns: Literal[True],
+    ) -> Iterator[BarsFrame]: ...
+
+    def iter_bars(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = None,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_workers: int = 4,
+        window_size: int = MAX_BARS_PER_REQUEST,
+        as_columns: bool = False,
+    ) -> Union[Iterator[Bar], Iterator[BarsFrame]]:
+        """
+        Iterate over a long bar history fetched in server-sized windows.
+
+        Args:
+            symbol: The symbol to get bars for
+            firstdate: The first date as datetime object
+            lastdate: The last date as datetime object (defaults to current timestamp)
+            interval: Interval that each bar will consist of (default: 1, max: 1440 for minutes)
+            unit: The unit of time for each bar interval (default: Daily)
+            sessiontemplate: US stock market session template
+            max_workers: Maximum number of windows fetched concurrently (default: 4)
+            window_size: Maximum number of bars per request (default: 57600)
+            as_columns: Yield one BarsFrame per window instead of individual Bar models
+
+        Yields:
+            Bar: Bars in chronological order, or one BarsFrame per window when
+                as_columns is set. Bars repeated at window boundaries are dropped.
+        """
+        windows = _bar_windows(firstdate, lastdate, interval, unit, window_size)
+
+        def fetch(window: Tuple[datetime, datetime]) -> BarsFrame:
+            return self.bars(
+                symbol,
+                interval=interval,
+                unit=unit,
+                firstdate=window[0],
+                lastdate=window[1],
+                sessiontemplate=sessiontemplate,
+                as_columns=True,
+            )
+
+        last_epoch: Optional[int] = None
+        for frame in self._fetch_windows(fetch, windows, max_workers):
+            if last_epoch is not None:
+                frame = frame[bisect_right(frame.epoch, last_epoch) :]
+            if len(frame) == 0:
+                continue
+            last_epoch = frame.epoch[-1]
+            if as_columns:
+                yield frame
+            else:
+                yield from frame.to_response().bars
+
+    @overload
+    def bars_range(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = ...,
+        interval: int = ...,
+        unit: Unit = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        max_workers: int = ...,
+        window_size: int = ...,
+        as_columns: Literal[False] = ...,
+    ) -> BarsResponse: ...
+
+    @overload
+    def bars_range(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = ...,
+        interval: int = ...,
+        unit: Unit = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        max_workers: int = ...,
+        window_size: int = ...,
+        *,
+        as_columns: Literal[True],
+    ) -> BarsFrame: ...
+
+    def bars_range(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = None,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_workers: int = 4,
+        window_size: int = MAX_BARS_PER_REQUEST,
+        as_columns: bool = False,
+    ) -> Union[BarsResponse, BarsFrame]:
+        """
+        Get a full bar history, fetching server-sized windows concurrently.
+
+        Takes the same arguments as `iter_bars` and returns the stitched
+        result as a single BarsResponse, or a BarsFrame when as_columns is set.
+        """
+        frames = self.iter_bars(
+            symbol,
+            firstdate,
+            lastdate,
+            interval=interval,
+            unit=unit,
+            sessiontemplate=sessiontemplate,
+            max_workers=max_workers,
+            window_size=window_size,
+            as_columns=True,
+        )
+        frame = BarsFrame.concat(frames)
+        return frame if as_columns else frame.to_response()
+
+    def cached_bars(
+        self,
+        symbol: str,
+        cache: BarCache,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = None,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_workers: int = 4,
+        window_size: int = MAX_BARS_PER_REQUEST,
+    ) -> BarsFrame:
+        """
+        Get a bar history through a persistent local BarCache.
+
+        Cached ranges are served from disk and only bars missing from the
+        cache (normally the tail newer than the last cached epoch) are
+        fetched, with `bars_range`. Closed bars are written back to the cache;
+        open bars are returned but never cached.
+
+        Args:
+            symbol: The symbol to get bars for
+            cache: The BarCache to read from and top up
+            firstdate: The first date as datetime object (naive values are UTC)
+            lastdate: The last date as datetime object (defaults to current timestamp)
+            interval: Interval that each bar will consist of (default: 1)
+            unit: The unit of time for each bar interval (default: Daily)
+            sessiontemplate: US stock market session template
+            max_workers: Maximum number of windows fetched concurrently (default: 4)
+            window_size: Maximum number of bars per request (default: 57600)
+
+        Returns:
+            BarsFrame: The bars between firstdate and lastdate
+        """
+        key = BarCacheKey(symbol, interval, unit, sessiontemplate)
+        firstdate = _as_utc(firstdate)
+        lastdate = None if lastdate is None else _as_utc(lastdate)
+        head, tail = _cache_fetch_ranges(cache, key, firstdate, lastdate)
+
+        def fetch(dates: Optional[DateRange]) -> BarsFrame:
+            if dates is None:
+                return BarsFrame()
+            return self.bars_range(
+                symbol,
+                *dates,
+                interval=interval,
+                unit=unit,
+                sessiontemplate=sessiontemplate,
+                max_workers=max_workers,
+                window_size=window_size,
+                as_columns=True,
+            )
+
+        return _cache_update(cache, key, fetch(head), fetch(tail), firstdate, lastdate)
+
+    def iter_bars_many(
+        self,
+        symbols: Iterable[str],
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        barsback: Optional[int] = None,
+        firstdate: Optional[datetime] = None,
+        lastdate: Optional[datetime] = None,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_in_flight: int = 8,
+        as_columns: bool = False,
+    ) -> Iterator[BarsResult]:
+        """
+        Fetch bars for many symbols on a thread pool, yielding as they complete.
+
+        Takes the same bar arguments as `bars`, plus `max_in_flight` to bound
+        the number of concurrent requests (default: 8). A failed symbol yields
+        a BarsResult carrying the exception instead of aborting the batch.
+        """
+        params = _bars_params(
+            interval, unit, barsback, firstdate, lastdate, sessiontemplate
+        )
+
+        def fetch(symbol: str) -> BarsResult:
+            try:
+                return BarsResult(symbol, self._get_bars(symbol, params, as_columns))
+            except Exception as exc:
+                return BarsResult(symbol, error=exc)
+
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            futures = [executor.submit(fetch, symbol) for symbol in symbols]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def bars_many(
+        self,
+        symbols: Iterable[str],
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        barsback: Optional[int] = None,
+        firstdate: Optional[datetime] = None,
+        lastdate: Optional[datetime] = None,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_in_flight: int = 8,
+        as_columns: bool = False,
+    ) -> Dict[str, BarsResult]:
+        """
+        Fetch bars for many symbols concurrently.
+
+        Takes the same arguments as `iter_bars_many` and returns every
+        BarsResult keyed by symbol, in input order.
+        """
+        symbols = list(symbols)
+        results = {
+            result.symbol: result
+            for result in self.iter_bars_many(
+                symbols,
+                interval=interval,
+                unit=unit,
+                barsback=barsback,
+                firstdate=firstdate,
+                lastdate=lastdate,
+                sessiontemplate=sessiontemplate,
+                max_in_flight=max_in_flight,
+                as_columns=as_columns,
+            )
+        }
+        return {symbol: results[symbol] for symbol in symbols}
+
+    @overload
+    def stream_bars(
+        self,
+        symbol: str,
+        interval: int = ...,
+        unit: Unit = ...,
+        barsback: Optional[int] = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        include_status: Literal[False] = ...,
+    ) -> Iterator[Bar]: ...
+
+    @overload
+    def stream_bars(
+        self,
+        symbol: str,
+        interval: int = ...,
+        unit: Unit = ...,
+        barsback: Optional[int] = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        *,
+        include_status: Literal[True],
+    ) -> Iterator[Union[Bar, Heartbeat, StreamStatus]]: ...
+
+    def stream_bars(
+        self,
+        symbol: str,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        barsback: Optional[int] = None,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        include_status: bool = False,
+    ) -> Union[Iterator[Bar], Iterator[Union[Bar, Heartbeat, StreamStatus]]]:
+        """
+        Stream live bar updates for a symbol.
+
+        Bars are decoded line by line as they arrive. The open bar is yielded
+        again every time it updates. After a disconnect the stream is reopened
+        according to the client's retry policy and resumes after the last bar
+        seen, so no closed bar is skipped or repeated.
+
+        Args:
+            symbol: The symbol to stream bars for
+            interval: Interval that each bar will consist of (default: 1, max: 1440 for minutes)
+            unit: The unit of time for each bar interval (default: Daily)
+            barsback: Number of historical bars to send first (default: 1)
+            sessiontemplate: US stock market session template
+            include_status: Also yield Heartbeat and StreamStatus messages
+
+        Yields:
+            Bar: Bar updates in chronological order
+
+        Raises:
+            StreamError: If the server reports an error on the stream
+        """
+        stream = _BarStream(
+            self._client.retry_policy,
+            interval,
+            unit,
+            barsback,
+            sessiontemplate,
+            include_status,
+        )
+        endpoint = f"marketdata/stream/barcharts/{symbol}"
+        while True:
+            error: Optional[Exception] = None
+            try:
+                with self._client._stream(
+                    "GET", endpoint, params=stream.params()
+                ) as response:
+                    for line in response.iter_lines():
+                        message = stream.handle(line)
+                        if message is not None:
+                            yield message
+                        if stream.go_away:
+                            break
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                error = exc
+            self._sleep(stream.reconnect_delay(error))
+
+    @staticmethod
+    def _fetch_windows(
+        fetch: Callable[[Tuple[datetime, datetime]], BarsFrame],
+        windows: List[Tuple[datetime, datetime]],
+        max_workers: int,
+    ) -> Iterator[BarsFrame]:
+        """Fetch windows with at most `max_workers` in flight, yielding in order."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Deque[Future[BarsFrame]] = deque()
+            remaining = iter(windows)
+            try:
+                for window in remaining:
+                    pending.append(executor.submit(fetch, window))
+                    if len(pending) >= max_workers:
+                        break
+                while pending:
+                    frame = pending.popleft().result()
+                    next_window = next(remaining, None)
+                    if next_window is not None:
+                        pending.append(executor.submit(fetch, next_window))
+                    yield frame
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+class AsyncMarketData(AsyncAPIResource):
+    def __init__(self, client: "AsyncTradeStation") -> None:
+        super().__init__(client)
+
+    @overload
+    async def bars(
+        self,
+        symbol: str,
+        interval: int = ...,
+        unit: Unit = ...,
+        barsback: Optional[int] = ...,
+        firstdate: Optional[datetime] = ...,
+        lastdate: Optional[datetime] = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        as_columns: Literal[False] = ...,
+    ) -> BarsResponse: ...
+
+    @overload
+    async def bars(
+        self,
+        symbol: str,
+        interval: int = ...,
+        unit: Unit = ...,
+        barsback: Optional[int] = ...,
+        firstdate: Optional[datetime] = ...,
+        lastdate: Optional[datetime] = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        *,
+        as_columns: Literal[True],
+    ) -> BarsFrame: ...
+
+    async def bars(
+        self,
+        symbol: str,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        barsback: Optional[int] = None,
+        firstdate: Optional[datetime] = None,
+        lastdate: Optional[datetime] = None,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        as_columns: bool = False,
+    ) -> Union[BarsResponse, BarsFrame]:
+        """
+        Get bar data for a symbol.
+
+        Args:
+            symbol: The symbol to get bars for
+            interval: Interval that each bar will consist of (default: 1, max: 1440 for minutes)
+            unit: The unit of time for each bar interval. Valid values: Minute, Daily, Weekly, Monthly (default: Daily)
+            barsback: Number of bars back to fetch (mutually exclusive with firstdate)
+            firstdate: The first date as datetime object (mutually exclusive with barsback)
+            lastdate: The last date as datetime object (defaults to current timestamp)
+            sessiontemplate: US stock market session template.
+                Valid values: USEQPre, USEQPost, USEQPreAndPost, USEQ24Hour, Default
+            as_columns: Decode the payload straight into a columnar BarsFrame instead
+                of validating one Bar model per bar (default: False)
+
+        Returns:
+            BarsResponse: The bars response containing bar data, or a BarsFrame
+                when as_columns is set
+
+        Note:
+            Datetime parameters are automatically formatted as ISO 8601 strings (YYYY-MM-DDTHH:MM:SSZ)
+            when sent to the API.
+        """
+        params = _bars_params(
+            interval, unit, barsback, firstdate, lastdate, sessiontemplate
+        )
+
+        return await self._get_bars(symbol, params, as_columns)
+
+    async def _get_bars(
+        self, symbol: str, params: Dict[str, str], as_columns: bool
+    ) -> Union[BarsResponse, BarsFrame]:
+        if as_columns:
+            response = await self._client._request(
+                "GET", f"marketdata/barcharts/{symbol}", params=params
+            )
+            return BarsFrame.from_json(response.content, self._client.decoder.loads)
+
+        return await self._client._make_request(
+            "GET",
+            f"marketdata/barcharts/{symbol}",
+            params=params,
+            response_model=BarsResponse,
+        )
+
+    @overload
+    def iter_bars(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = ...,
+        interval: int = ...,
+        unit: Unit = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        max_workers: int = ...,
+        window_size: int = ...,
+        as_columns: Literal[False] = ...,
+    ) -> AsyncContextManager[AsyncIterator[Bar]]: ...
+
+    @overload
+    def iter_bars(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = ...,
+        interval: int = ...,
+        unit: Unit = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        max_workers: int = ...,
+        window_size: int = ...,
+        *,
+        as_columns: Literal[True],
+    ) -> AsyncContextManager[AsyncIterator[BarsFrame]]: ...
+
+    @asynccontextmanager
+    async def iter_bars(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = None,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_workers: int = 4,
+        window_size: int = MAX_BARS_PER_REQUEST,
+        as_columns: bool = False,
+    ) -> AsyncIterator[AsyncIterator[Any]]:
+        """
+        Iterate over a long bar history fetched in server-sized windows.
+
+        The fetches run in a task group in the caller's scope, so use as an
+        async context manager and iterate what it returns. Leaving the block
+        cancels any windows still in flight::
+
+            async with ts.market_data.iter_bars(symbol, firstdate) as bars:
+                async for bar in bars:
+                    ...
+
+        Args:
+            symbol: The symbol to get bars for
+            firstdate: The first date as datetime object
+            lastdate: The last date as datetime object (defaults to current timestamp)
+            interval: Interval that each bar will consist of (default: 1, max: 1440 for minutes)
+            unit: The unit of time for each bar interval (default: Daily)
+            sessiontemplate: US stock market session template
+            max_workers: Maximum number of windows fetched concurrently (default: 4)
+            window_size: Maximum number of bars per request (default: 57600)
+            as_columns: Yield one BarsFrame per window instead of individual Bar models
+
+        Yields:
+            Bar: Bars in chronological order, or one BarsFrame per window when
+                as_columns is set. Bars repeated at window boundaries are dropped.
+        """
+        windows = _bar_windows(firstdate, lastdate, interval, unit, window_size)
+
+        async def fetch(window: Tuple[datetime, datetime]) -> BarsFrame:
+            return await self.bars(
+                symbol,
+                interval=interval,
+                unit=unit,
+                firstdate=window[0],
+                lastdate=window[1],
+                sessiontemplate=sessiontemplate,
+                as_columns=True,
+            )
+
+        async def deduplicated(
+            frames: AsyncIterator[BarsFrame],
+        ) -> AsyncIterator[BarsFrame]:
+            last_epoch: Optional[int] = None
+            async for frame in frames:
+                if last_epoch is not None:
+                    frame = frame[bisect_right(frame.epoch, last_epoch) :]
+                if len(frame) == 0:
+                    continue
+                last_epoch = frame.epoch[-1]
+                yield frame
+
+        async def bars(frames: AsyncIterator[BarsFrame]) -> AsyncIterator[Bar]:
+            async for frame in frames:
+                for bar in frame.to_response().bars:
+                    yield bar
+
+        async with self._fetch_windows(fetch, windows, max_workers) as frames:
+            unique = deduplicated(frames)
+            yield unique if as_columns else bars(unique)
+
+    @overload
+    async def bars_range(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = ...,
+        interval: int = ...,
+        unit: Unit = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        max_workers: int = ...,
+        window_size: int = ...,
+        as_columns: Literal[False] = ...,
+    ) -> BarsResponse: ...
+
+    @overload
+    async def bars_range(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = ...,
+        interval: int = ...,
+        unit: Unit = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        max_workers: int = ...,
+        window_size: int = ...,
+        *,
+        as_columns: Literal[True],
+    ) -> BarsFrame: ...
+
+    async def bars_range(
+        self,
+        symbol: str,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = None,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_workers: int = 4,
+        window_size: int = MAX_BARS_PER_REQUEST,
+        as_columns: bool = False,
+    ) -> Union[BarsResponse, BarsFrame]:
+        """
+        Get a full bar history, fetching server-sized windows concurrently.
+
+        Takes the same arguments as `iter_bars` and returns the stitched
+        result as a single BarsResponse, or a BarsFrame when as_columns is set.
+        """
+        async with self.iter_bars(
+            symbol,
+            firstdate,
+            lastdate,
+            interval=interval,
+            unit=unit,
+            sessiontemplate=sessiontemplate,
+            max_workers=max_workers,
+            window_size=window_size,
+            as_columns=True,
+        ) as windows:
+            frames = [frame async for frame in windows]
+        frame = BarsFrame.concat(frames)
+        return frame if as_columns else frame.to_response()
+
+    async def cached_bars(
+        self,
+        symbol: str,
+        cache: BarCache,
+        firstdate: datetime,
+        lastdate: Optional[datetime] = None,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_workers: int = 4,
+        window_size: int = MAX_BARS_PER_REQUEST,
+    ) -> BarsFrame:
+        """
+        Get a bar history through a persistent local BarCache.
+
+        Cached ranges are served from disk and only bars missing from the
+        cache (normally the tail newer than the last cached epoch) are
+        fetched, with `bars_range`. Closed bars are written back to the cache;
+        open bars are returned but never cached.
+
+        Args:
+            symbol: The symbol to get bars for
+            cache: The BarCache to read from and top up
+            firstdate: The first date as datetime object (naive values are UTC)
+            lastdate: The last date as datetime object (defaults to current timestamp)
+            interval: Interval that each bar will consist of (default: 1)
+            unit: The unit of time for each bar interval (default: Daily)
+            sessiontemplate: US stock market session template
+            max_workers: Maximum number of windows fetched concurrently (default: 4)
+            window_size: Maximum number of bars per request (default: 57600)
+
+        Returns:
+            BarsFrame: The bars between firstdate and lastdate
+        """
+        key = BarCacheKey(symbol, interval, unit, sessiontemplate)
+        firstdate = _as_utc(firstdate)
+        lastdate = None if lastdate is None else _as_utc(lastdate)
+        head, tail = _cache_fetch_ranges(cache, key, firstdate, lastdate)
+
+        async def fetch(dates: Optional[DateRange]) -> BarsFrame:
+            if dates is None:
+                return BarsFrame()
+            return await self.bars_range(
+                symbol,
+                *dates,
+                interval=interval,
+                unit=unit,
+                sessiontemplate=sessiontemplate,
+                max_workers=max_workers,
+                window_size=window_size,
+                as_columns=True,
+            )
+
+        return _cache_update(
+            cache, key, await fetch(head), await fetch(tail), firstdate, lastdate
+        )
+
+    @asynccontextmanager
+    async def iter_bars_many(
+        self,
+        symbols: Iterable[str],
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        barsback: Optional[int] = None,
+        firstdate: Optional[datetime] = None,
+        lastdate: Optional[datetime] = None,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_in_flight: int = 8,
+        as_columns: bool = False,
+    ) -> AsyncIterator["MemoryObjectReceiveStream[BarsResult]"]:
+        """
+        Fetch bars for many symbols in a task group, delivering as they complete.
+
+        Takes the same bar arguments as `bars`, plus `max_in_flight` to bound
+        the number of concurrent requests (default: 8). A failed symbol yields
+        a BarsResult carrying the exception instead of aborting the batch.
+
+        The task group runs in the caller's scope, so use as an async context
+        manager and iterate the stream it returns. Leaving the block cancels
+        any fetches still in flight::
+
+            async with ts.market_data.iter_bars_many(symbols) as results:
+                async for result in results:
+                    ...
+        """
+        params = _bars_params(
+            interval, unit, barsback, firstdate, lastdate, sessiontemplate
+        )
+        limiter = anyio.CapacityLimiter(max_in_flight)
+        send: "MemoryObjectSendStream[BarsResult]"
+        receive: "MemoryObjectReceiveStream[BarsResult]"
+        send, receive = anyio.create_memory_object_stream(math.inf)
+
+        async def fetch(
+            symbol: str, results: "MemoryObjectSendStream[BarsResult]"
+        ) -> None:
+            async with results:
+                async with limiter:
+                    try:
+                        bars = await self._get_bars(symbol, params, as_columns)
+                        result = BarsResult(symbol, bars)
+                    except Exception as exc:
+                        result = BarsResult(symbol, error=exc)
+                await results.send(result)
+
+        async with anyio.create_task_group() as tg:
+            async with send:
+                for symbol in symbols:
+                    tg.start_soon(fetch, symbol, send.clone())
+            async with receive:
+                try:
+                    yield receive
+                finally:
+                    tg.cancel_scope.cancel()
+
+    async def bars_many(
+        self,
+        symbols: Iterable[str],
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        barsback: Optional[int] = None,
+        firstdate: Optional[datetime] = None,
+        lastdate: Optional[datetime] = None,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        max_in_flight: int = 8,
+        as_columns: bool = False,
+    ) -> Dict[str, BarsResult]:
+        """
+        Fetch bars for many symbols concurrently.
+
+        Takes the same arguments as `iter_bars_many` and returns every
+        BarsResult keyed by symbol, in input order.
+        """
+        symbols = list(symbols)
+        async with self.iter_bars_many(
+            symbols,
+            interval=interval,
+            unit=unit,
+            barsback=barsback,
+            firstdate=firstdate,
+            lastdate=lastdate,
+            sessiontemplate=sessiontemplate,
+            max_in_flight=max_in_flight,
+            as_columns=as_columns,
+        ) as stream:
+            results = {result.symbol: result async for result in stream}
+        return {symbol: results[symbol] for symbol in symbols}
+
+    @overload
+    def stream_bars(
+        self,
+        symbol: str,
+        interval: int = ...,
+        unit: Unit = ...,
+        barsback: Optional[int] = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        include_status: Literal[False] = ...,
+    ) -> AsyncIterator[Bar]: ...
+
+    @overload
+    def stream_bars(
+        self,
+        symbol: str,
+        interval: int = ...,
+        unit: Unit = ...,
+        barsback: Optional[int] = ...,
+        sessiontemplate: Optional[SessionTemplate] = ...,
+        *,
+        include_status: Literal[True],
+    ) -> AsyncIterator[Union[Bar, Heartbeat, StreamStatus]]: ...
+
+    async def stream_bars(
+        self,
+        symbol: str,
+        interval: int = 1,
+        unit: Unit = Unit.DAILY,
+        barsback: Optional[int] = None,
+        sessiontemplate: Optional[SessionTemplate] = None,
+        include_status: bool = False,
+    ) -> Union[AsyncIterator[Bar], AsyncIterator[Union[Bar, Heartbeat, StreamStatus]]]:
+        """
+        Stream live bar updates for a symbol.
+
+        Bars are decoded line by line as they arrive. The open bar is yielded
+        again every time it updates. After a disconnect the stream is reopened
+        according to the client's retry policy and resumes after the last bar
+        seen, so no closed bar is skipped or repeated.
+
+        Args:
+            symbol: The symbol to stream bars for
+            interval: Interval that each bar will consist of (default: 1, max: 1440 for minutes)
+            unit: The unit of time for each bar interval (default: Daily)
+            barsback: Number of historical bars to send first (default: 1)
+            sessiontemplate: US stock market session template
+            include_status: Also yield Heartbeat and StreamStatus messages
+
+        Yields:
+            Bar: Bar updates in chronological order
+
+        Raises:
+            StreamError: If the server reports an error on the stream
+        """
+        stream = _BarStream(
+            self._client.retry_policy,
+            interval,
+            unit,
+            barsback,
+            sessiontemplate,
+            include_status,
+        )
+        endpoint = f"marketdata/stream/barcharts/{symbol}"
+        while True:
+            error: Optional[Exception] = None
+            try:
+                async with self._client._stream(
+                    "GET", endpoint, params=stream.params()
+                ) as response:
+                    async for line in response.aiter_lines():
+                        message = stream.handle(line)
+                        if message is not None:
+                            yield message
+                        if stream.go_away:
+                            break
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                error = exc
+            await self._sleep(stream.reconnect_delay(error))
+
+    def quote_streams(
+        self,
+        symbols_per_stream: int = MAX_SYMBOLS_PER_STREAM,
+        maxsize: int = 1000,
+    ) -> QuoteStreamManager:
+        """
+        Create a manager that multiplexes quote subscriptions over few streams.
+
+        Args:
+            symbols_per_stream: Maximum symbols per stream (default: 100)
+            maxsize: Default queue size of each subscription (default: 1000)
+
+        Returns:
+            QuoteStreamManager: Use as an async context manager and call
+                `subscribe` for each consumer
+        """
+        return QuoteStreamManager(self._client, symbols_per_stream, maxsize)
+
+    @staticmethod
+    @asynccontextmanager
+    async def _fetch_windows(
+        fetch: Callable[[Tuple[datetime, datetime]], Awaitable[BarsFrame]],
+        windows: List[Tuple[datetime, datetime]],
+        max_workers: int,
+    ) -> AsyncIterator[AsyncIterator[BarsFrame]]:
+        """
+        Fetch windows with at most `max_workers` in flight, yielding in order.
+
+        As in the sync version, the next window starts as soon as the oldest
+        one is consumed instead of once a whole batch is done. The task group
+        runs in the caller's scope, so iterate inside the `async with` block.
+        """
+        send: "MemoryObjectSendStream[Tuple[int, Union[BarsFrame, Exception]]]"
+        receive: "MemoryObjectReceiveStream[Tuple[int, Union[BarsFrame, Exception]]]"
+        send, receive = anyio.create_memory_object_stream(math.inf)
+        remaining = iter(enumerate(windows))
+
+        async def run(index: int, window: Tuple[datetime, datetime]) -> None:
+            # Failures travel with the result so they surface in window order,
+            # after every earlier frame has been delivered.
+            try:
+                result: Union[BarsFrame, Exception] = await fetch(window)
+            except Exception as exc:
+                result = exc
+            await send.send((index, result))
+
+        async def frames(tg: "TaskGroup") -> AsyncIterator[BarsFrame]:
+            done: Dict[int, Union[BarsFrame, Exception]] = {}
+            for index, window in remaining:
+                tg.start_soon(run, index, window)
+                if index + 1 >= max_workers:
+                    break
+            for index in range(len(windows)):
+                while index not in done:
+                    received, result = await receive.receive()
+                    done[received] = result
+                result = done.pop(index)
+                if isinstance(result, Exception):
+                    raise result
+                next_window = next(remaining, None)
+                if next_window is not None:
+                    tg.start_soon(run, *next_window)
+                yield result
+
+        async with anyio.create_task_group() as tg:
+            async with send, receive:
+                try:
+                    yield frames(tg)
+                finally:
+                    tg.cancel_scope.cancel()
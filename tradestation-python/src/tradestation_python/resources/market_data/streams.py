@@ -0,0 +1,349 @@
+from collections import deque
+from datetime import datetime, timezone
+from time import monotonic
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Type,
+)
+
+import anyio
+import httpx
+from pydantic import ValidationError
+
+from ..._streaming import StreamError, StreamSession
+from ...types.responses import Quote
+
+if TYPE_CHECKING:
+    from anyio.abc import TaskGroup
+
+    from ..._client import AsyncTradeStation
+
+# Maximum number of symbols the quotes stream endpoint accepts per request.
+MAX_SYMBOLS_PER_STREAM = 100
+
+
+class QuoteSubscription:
+    """
+    Bounded queue of quotes for a set of symbols.
+
+    When the consumer falls behind, the oldest queued quote is dropped to
+    make room for the newest one. Iterate with `async for` until the
+    subscription is closed.
+
+    Args:
+        symbols: Symbols delivered to this subscription
+        maxsize: Maximum number of quotes held before dropping the oldest
+    """
+
+    def __init__(self, symbols: Iterable[str], maxsize: int = 1000) -> None:
+        self.symbols: FrozenSet[str] = frozenset(symbols)
+        self.dropped = 0
+        self._queue: Deque[Quote] = deque(maxlen=maxsize)
+        self._ready = anyio.Event()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, quote: Quote) -> bool:
+        """Queue `quote`, returning True if an older quote was dropped."""
+        dropped = len(self._queue) == self._queue.maxlen
+        if dropped:
+            self.dropped += 1
+        self._queue.append(quote)
+        self._ready.set()
+        return dropped
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """Stop the subscription once the queued quotes are consumed."""
+        self._closed = True
+        self._error = error
+        self._ready.set()
+
+    def __aiter__(self) -> "QuoteSubscription":
+        return self
+
+    async def __anext__(self) -> Quote:
+        while not self._queue:
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            self._ready = anyio.Event()
+            await self._ready.wait()
+        return self._queue.popleft()
+
+
+class QuoteStreamStats:
+    """Throughput and freshness metrics for one multiplexed quote stream."""
+
+    def __init__(self) -> None:
+        self.messages = 0
+        self.reconnects = 0
+        self.dropped = 0
+        # Messages skipped because they could not be decoded or validated.
+        self.malformed = 0
+        # Seconds from the last quote's trade time to its arrival. This is
+        # the age of the trade, not network lag: it grows while nothing trades.
+        self.trade_age: Optional[float] = None
+        self.last_message: Optional[float] = None
+        self.errors: Dict[str, str] = {}
+
+    @property
+    def idle(self) -> Optional[float]:
+        """Seconds since the last message, or None before the first one."""
+        if self.last_message is None:
+            return None
+        return monotonic() - self.last_message
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(messages={self.messages}, "
+            f"reconnects={self.reconnects}, dropped={self.dropped}, "
+            f"malformed={self.malformed}, trade_age={self.trade_age})"
+        )
+
+
+class QuoteStream:
+    """One quotes stream connection carrying up to `capacity` symbols."""
+
+    def __init__(self, manager: "QuoteStreamManager", capacity: int) -> None:
+        self.manager = manager
+        self.capacity = capacity
+        self.symbols: List[str] = []
+        self.stats = QuoteStreamStats()
+        self._scope: Optional[anyio.CancelScope] = None
+
+    @property
+    def spare(self) -> int:
+        return self.capacity - len(self.symbols)
+
+    def start(self, tg: "TaskGroup") -> None:
+        """(Re)connect with the current symbol list."""
+        self.stop()
+        self._scope = anyio.CancelScope()
+        tg.start_soon(self._run, self._scope, ",".join(self.symbols))
+
+    def stop(self) -> None:
+        if self._scope is not None:
+            self._scope.cancel()
+            self._scope = None
+
+    async def _run(self, scope: anyio.CancelScope, symbols: str) -> None:
+        client = self.manager.client
+        session = StreamSession(client.retry_policy)
+        with scope:
+            while True:
+                error: Optional[Exception] = None
+                try:
+                    async with client._stream(
+                        "GET", f"marketdata/stream/quotes/{symbols}"
+                    ) as response:
+                        async for line in response.aiter_lines():
+                            self._handle(session, line)
+                            if session.go_away:
+                                break
+                except (
+                    httpx.TransportError,
+                    httpx.HTTPStatusError,
+                    StreamError,
+                ) as exc:
+                    error = exc
+                except Exception as exc:
+                    # Anything else only takes down this stream, not the
+                    # manager's task group and every other stream with it.
+                    self.manager._fail(self, exc)
+                    return
+                try:
+                    delay = session.reconnect_delay(error)
+                except Exception as exc:
+                    self.manager._fail(self, exc)
+                    return
+                self.stats.reconnects += 1
+                await anyio.sleep(delay)
+
+    def _handle(self, session: StreamSession, line: str) -> None:
+        try:
+            message = session.decode(line)
+        except StreamError as exc:
+            # Errors tied to one symbol leave the rest of the stream running.
+            symbol = exc.response.symbol
+            if symbol is None:
+                raise
+            self.stats.errors[symbol] = str(exc)
+            return
+        except ValueError:
+            # A line that is not valid JSON, or a malformed error message.
+            self.stats.malformed += 1
+            return
+        if not isinstance(message, dict):
+            return
+
+        try:
+            quote = Quote.model_validate(message)
+        except ValidationError as exc:
+            self.stats.malformed += 1
+            symbol = message.get("Symbol")
+            if isinstance(symbol, str):
+                self.stats.errors[symbol] = f"Malformed quote: {exc}"
+            return
+        stats = self.stats
+        stats.messages += 1
+        stats.last_message = monotonic()
+        if quote.trade_time is not None:
+            stats.trade_age = (
+                datetime.now(timezone.utc) - quote.trade_time
+            ).total_seconds()
+        for subscription in self.manager._subscribers.get(quote.symbol, ()):
+            if subscription.put(quote):
+                stats.dropped += 1
+
+
+class QuoteStreamManager:
+    """
+    Multiplex quote subscriptions for many symbols over few streams.
+
+    Symbols are packed into as few quotes streams as the API allows.
+    Subscribing or unsubscribing only reconnects the streams whose symbol
+    lists change; every other stream keeps running. Use as an async
+    context manager, which owns the stream tasks.
+
+    Args:
+        client: The async TradeStation client
+        symbols_per_stream: Maximum symbols per stream (default: 100)
+        maxsize: Default queue size of new subscriptions (default: 1000)
+    """
+
+    def __init__(
+        self,
+        client: "AsyncTradeStation",
+        symbols_per_stream: int = MAX_SYMBOLS_PER_STREAM,
+        maxsize: int = 1000,
+    ) -> None:
+        self.client = client
+        self.symbols_per_stream = symbols_per_stream
+        self.maxsize = maxsize
+        self.streams: List[QuoteStream] = []
+        self._assigned: Dict[str, QuoteStream] = {}
+        self._subscribers: Dict[str, Set[QuoteSubscription]] = {}
+        self._tg: Optional["TaskGroup"] = None
+
+    async def __aenter__(self) -> "QuoteStreamManager":
+        self._tg = anyio.create_task_group()
+        await self._tg.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Optional[bool]:
+        assert self._tg is not None
+        self._tg.cancel_scope.cancel()
+        for subscriptions in self._subscribers.values():
+            for subscription in subscriptions:
+                subscription.close()
+        try:
+            return await self._tg.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._tg = None
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._assigned)
+
+    def stats(self) -> List[QuoteStreamStats]:
+        """Per-stream metrics, in stream order."""
+        return [stream.stats for stream in self.streams]
+
+    def subscribe(
+        self, symbols: Iterable[str], maxsize: Optional[int] = None
+    ) -> QuoteSubscription:
+        """Subscribe to quotes for `symbols`, opening streams as needed."""
+        if self._tg is None:
+            raise RuntimeError("QuoteStreamManager must be entered before use.")
+        subscription = QuoteSubscription(
+            symbols, self.maxsize if maxsize is None else maxsize
+        )
+        new = []
+        for symbol in sorted(subscription.symbols):
+            if symbol not in self._subscribers:
+                self._subscribers[symbol] = set()
+                new.append(symbol)
+            self._subscribers[symbol].add(subscription)
+
+        changed = []
+        for stream in self.streams:
+            if not new:
+                break
+            if stream.spare > 0:
+                taken, new = new[: stream.spare], new[stream.spare :]
+                self._assign(stream, taken)
+                changed.append(stream)
+        while new:
+            stream = QuoteStream(self, self.symbols_per_stream)
+            taken, new = new[: stream.capacity], new[stream.capacity :]
+            self._assign(stream, taken)
+            self.streams.append(stream)
+            changed.append(stream)
+
+        for stream in changed:
+            stream.start(self._tg)
+        return subscription
+
+    def unsubscribe(self, subscription: QuoteSubscription) -> None:
+        """Close `subscription` and drop symbols nobody else subscribes to."""
+        subscription.close()
+        changed = set()
+        for symbol in subscription.symbols:
+            subscribers = self._subscribers.get(symbol)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[symbol]
+                stream = self._assigned.pop(symbol)
+                stream.symbols.remove(symbol)
+                changed.add(stream)
+
+        for stream in changed:
+            if stream.symbols:
+                assert self._tg is not None
+                stream.start(self._tg)
+            else:
+                stream.stop()
+                self.streams.remove(stream)
+
+    def _assign(self, stream: QuoteStream, symbols: List[str]) -> None:
+        stream.symbols.extend(symbols)
+        for symbol in symbols:
+            self._assigned[symbol] = stream
+
+    def _fail(self, stream: QuoteStream, error: Exception) -> None:
+        """Drop a stream that cannot recover and close every subscription it fed."""
+        stream.stop()
+        self.streams.remove(stream)
+        failed: Set[QuoteSubscription] = set()
+        for symbol in stream.symbols:
+            del self._assigned[symbol]
+            failed.update(self._subscribers.pop(symbol, ()))
+        stream.symbols.clear()
+        # Symbols of these subscriptions carried by other streams are dropped
+        # too when nobody else subscribes to them.
+        for subscription in failed:
+            self.unsubscribe(subscription)
+            subscription.close(error)
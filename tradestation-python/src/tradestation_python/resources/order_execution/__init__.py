@@ -1 +1,6 @@
-from .order_execution import OrderExecution  # noqa: F401
+from .order_execution import (  # noqa: F401
+    AsyncOrderExecution,
+    OrderExecution,
+    WarmupStats,
+)
+from .templates import OrderTemplate  # noqa: F401
@@ -1,11 +1,385 @@
-from typing import TYPE_CHECKING
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Optional,
+    Union,
+)
 
-from ..._resource import SyncAPIResource
+import anyio
+import httpx
+
+from ..._resource import AsyncAPIResource, SyncAPIResource
+from ...types.enums import OrderType
+from ...types.requests import OrderGroupRequest, OrderRequest
+from ...types.responses import (
+    OrderConfirmResponse,
+    OrderResponse,
+    OrdersResponse,
+    RoutesResponse,
+)
+from .templates import format_price, format_quantity
 
 if TYPE_CHECKING:
-    from tradestation._client import TradeStation
+    from ..._client import AsyncTradeStation, TradeStation
+
+# Seconds between keep-warm requests when the pool has no keep-alive expiry.
+DEFAULT_WARM_INTERVAL = 30.0
+
+OrderBody = Union[OrderRequest, bytes]
+OrderGroupBody = Union[OrderGroupRequest, bytes]
+
+
+def _content(order: Union[OrderRequest, OrderGroupRequest, bytes]) -> bytes:
+    """Serialize an order model, or pass a rendered template body through."""
+    if isinstance(order, bytes):
+        return order
+    return order.to_json()
+
+
+def _replace_payload(
+    quantity: Optional[int],
+    limit_price: Optional[Any],  # noqa: ANN401
+    stop_price: Optional[Any],  # noqa: ANN401
+    order_type: Optional[OrderType],
+) -> Dict[str, str]:
+    payload = {}
+    if quantity is not None:
+        payload["Quantity"] = format_quantity(quantity)
+    if limit_price is not None:
+        payload["LimitPrice"] = format_price(limit_price)
+    if stop_price is not None:
+        payload["StopPrice"] = format_price(stop_price)
+    if order_type is not None:
+        payload["OrderType"] = order_type.value
+    if not payload:
+        raise ValueError("Nothing to replace")
+    return payload
+
+
+def _warm_interval(limits: httpx.Limits) -> float:
+    """Half the keep-alive expiry, so pooled connections never go idle."""
+    if limits.keepalive_expiry is None:
+        return DEFAULT_WARM_INTERVAL
+    return limits.keepalive_expiry / 2
+
+
+class WarmupStats:
+    """Outcome of the keep-warm requests made so far."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.requests = 0
+        self.failures = 0
+        self.last_error: Optional[Exception] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(interval={self.interval}, "
+            f"requests={self.requests}, failures={self.failures})"
+        )
 
 
 class OrderExecution(SyncAPIResource):
     def __init__(self, client: "TradeStation") -> None:
         super().__init__(client)
+
+    def place(self, order: OrderBody) -> OrdersResponse:
+        """
+        Place an order.
+
+        Args:
+            order: The order, or a body rendered from an OrderTemplate
+
+        Returns:
+            OrdersResponse: The placed order, or the reason it was rejected
+        """
+        return self._client._make_request(
+            "POST",
+            "orderexecution/orders",
+            response_model=OrdersResponse,
+            content=_content(order),
+        )
+
+    def confirm(self, order: OrderBody) -> OrderConfirmResponse:
+        """
+        Estimate the cost of an order without placing it.
+
+        Args:
+            order: The order, or a body rendered from an OrderTemplate
+        """
+        return self._client._make_request(
+            "POST",
+            "orderexecution/orderconfirm",
+            response_model=OrderConfirmResponse,
+            content=_content(order),
+        )
+
+    def place_group(self, group: OrderGroupBody) -> OrdersResponse:
+        """
+        Place an OCO or bracket order group.
+
+        Args:
+            group: The group, or a body rendered from an OrderTemplate
+        """
+        return self._client._make_request(
+            "POST",
+            "orderexecution/ordergroups",
+            response_model=OrdersResponse,
+            content=_content(group),
+        )
+
+    def confirm_group(self, group: OrderGroupBody) -> OrderConfirmResponse:
+        """
+        Estimate the cost of an order group without placing it.
+
+        Args:
+            group: The group, or a body rendered from an OrderTemplate
+        """
+        return self._client._make_request(
+            "POST",
+            "orderexecution/ordergroupconfirm",
+            response_model=OrderConfirmResponse,
+            content=_content(group),
+        )
+
+    def replace(
+        self,
+        order_id: str,
+        quantity: Optional[int] = None,
+        limit_price: Optional[Any] = None,  # noqa: ANN401
+        stop_price: Optional[Any] = None,  # noqa: ANN401
+        order_type: Optional[OrderType] = None,
+    ) -> OrderResponse:
+        """
+        Change a working order; fields left as None are kept.
+
+        Args:
+            order_id: The order to replace
+            quantity: New quantity
+            limit_price: New limit price
+            stop_price: New stop price
+            order_type: New order type, such as Market to take a limit order
+        """
+        payload = _replace_payload(quantity, limit_price, stop_price, order_type)
+        return self._client._make_request(
+            "PUT",
+            f"orderexecution/orders/{order_id}",
+            response_model=OrderResponse,
+            json=payload,
+        )
+
+    def cancel(self, order_id: str) -> OrderResponse:
+        """Cancel a working order."""
+        return self._client._make_request(
+            "DELETE",
+            f"orderexecution/orders/{order_id}",
+            response_model=OrderResponse,
+        )
+
+    def routes(self) -> RoutesResponse:
+        """List the routes orders can be sent to."""
+        return self._client._make_request(
+            "GET", "orderexecution/routes", response_model=RoutesResponse
+        )
+
+    def warm(self) -> None:
+        """
+        Open a pooled connection to the order endpoints ahead of time.
+
+        Makes a cheap routes request, which also refreshes an expiring access
+        token, so the next order skips the TCP and TLS handshakes.
+        """
+        self._client._request("GET", "orderexecution/routes")
+
+    @contextmanager
+    def keep_warm(self, interval: Optional[float] = None) -> Iterator[WarmupStats]:
+        """
+        Keep the order connection warm from a background thread.
+
+        Warms the connection before entering, then repeats every `interval`
+        seconds. Failed background requests, token refresh failures included,
+        are counted in the stats, never raised.
+
+        Args:
+            interval: Seconds between requests (default: half the pool's
+                keep-alive expiry)
+        """
+        stats = WarmupStats(
+            interval if interval is not None else _warm_interval(self._client.limits)
+        )
+        self.warm()
+        stats.requests += 1
+        stopped = threading.Event()
+
+        def run() -> None:
+            while not stopped.wait(stats.interval):
+                try:
+                    self.warm()
+                except Exception as exc:
+                    stats.failures += 1
+                    stats.last_error = exc
+                stats.requests += 1
+
+        thread = threading.Thread(target=run, name="order-keep-warm", daemon=True)
+        thread.start()
+        try:
+            yield stats
+        finally:
+            stopped.set()
+            thread.join()
+
+
+class AsyncOrderExecution(AsyncAPIResource):
+    def __init__(self, client: "AsyncTradeStation") -> None:
+        super().__init__(client)
+
+    async def place(self, order: OrderBody) -> OrdersResponse:
+        """
+        Place an order.
+
+        Args:
+            order: The order, or a body rendered from an OrderTemplate
+
+        Returns:
+            OrdersResponse: The placed order, or the reason it was rejected
+        """
+        return await self._client._make_request(
+            "POST",
+            "orderexecution/orders",
+            response_model=OrdersResponse,
+            content=_content(order),
+        )
+
+    async def confirm(self, order: OrderBody) -> OrderConfirmResponse:
+        """
+        Estimate the cost of an order without placing it.
+
+        Args:
+            order: The order, or a body rendered from an OrderTemplate
+        """
+        return await self._client._make_request(
+            "POST",
+            "orderexecution/orderconfirm",
+            response_model=OrderConfirmResponse,
+            content=_content(order),
+        )
+
+    async def place_group(self, group: OrderGroupBody) -> OrdersResponse:
+        """
+        Place an OCO or bracket order group.
+
+        Args:
+            group: The group, or a body rendered from an OrderTemplate
+        """
+        return await self._client._make_request(
+            "POST",
+            "orderexecution/ordergroups",
+            response_model=OrdersResponse,
+            content=_content(group),
+        )
+
+    async def confirm_group(self, group: OrderGroupBody) -> OrderConfirmResponse:
+        """
+        Estimate the cost of an order group without placing it.
+
+        Args:
+            group: The group, or a body rendered from an OrderTemplate
+        """
+        return await self._client._make_request(
+            "POST",
+            "orderexecution/ordergroupconfirm",
+            response_model=OrderConfirmResponse,
+            content=_content(group),
+        )
+
+    async def replace(
+        self,
+        order_id: str,
+        quantity: Optional[int] = None,
+        limit_price: Optional[Any] = None,  # noqa: ANN401
+        stop_price: Optional[Any] = None,  # noqa: ANN401
+        order_type: Optional[OrderType] = None,
+    ) -> OrderResponse:
+        """
+        Change a working order; fields left as None are kept.
+
+        Args:
+            order_id: The order to replace
+            quantity: New quantity
+            limit_price: New limit price
+            stop_price: New stop price
+            order_type: New order type, such as Market to take a limit order
+        """
+        payload = _replace_payload(quantity, limit_price, stop_price, order_type)
+        return await self._client._make_request(
+            "PUT",
+            f"orderexecution/orders/{order_id}",
+            response_model=OrderResponse,
+            json=payload,
+        )
+
+    async def cancel(self, order_id: str) -> OrderResponse:
+        """Cancel a working order."""
+        return await self._client._make_request(
+            "DELETE",
+            f"orderexecution/orders/{order_id}",
+            response_model=OrderResponse,
+        )
+
+    async def routes(self) -> RoutesResponse:
+        """List the routes orders can be sent to."""
+        return await self._client._make_request(
+            "GET", "orderexecution/routes", response_model=RoutesResponse
+        )
+
+    async def warm(self) -> None:
+        """
+        Open a pooled connection to the order endpoints ahead of time.
+
+        Makes a cheap routes request, which also refreshes an expiring access
+        token, so the next order skips the TCP and TLS handshakes.
+        """
+        await self._client._request("GET", "orderexecution/routes")
+
+    @asynccontextmanager
+    async def keep_warm(
+        self, interval: Optional[float] = None
+    ) -> AsyncIterator[WarmupStats]:
+        """
+        Keep the order connection warm from a background task.
+
+        Warms the connection before entering, then repeats every `interval`
+        seconds. Failed background requests, token refresh failures included,
+        are counted in the stats, never raised.
+
+        Args:
+            interval: Seconds between requests (default: half the pool's
+                keep-alive expiry)
+        """
+        stats = WarmupStats(
+            interval if interval is not None else _warm_interval(self._client.limits)
+        )
+        await self.warm()
+        stats.requests += 1
+
+        async def run() -> None:
+            while True:
+                await self._sleep(stats.interval)
+                try:
+                    await self.warm()
+                except Exception as exc:
+                    stats.failures += 1
+                    stats.last_error = exc
+                stats.requests += 1
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run)
+            try:
+                yield stats
+            finally:
+                tg.cancel_scope.cancel()
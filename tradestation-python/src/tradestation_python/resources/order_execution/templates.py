@@ -0,0 +1,138 @@
+import json
+import math
+from decimal import Decimal
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from ...types.requests import OrderGroupRequest, OrderRequest
+
+Number = Union[int, float, Decimal]
+# A value for every leg, or one sequence entry per leg (None keeps the default).
+Patch = Optional[Union[Number, Sequence[Optional[Number]]]]
+
+# Order fields a template leaves open, by keyword and JSON key.
+PATCHABLE_FIELDS: Dict[str, str] = {
+    "quantity": "Quantity",
+    "limit_price": "LimitPrice",
+    "stop_price": "StopPrice",
+}
+
+
+def format_quantity(value: Any) -> str:  # noqa: ANN401
+    """Format an order quantity, which must be a positive integer."""
+    if type(value) is not int or value <= 0:
+        raise ValueError(f"quantity must be a positive integer, got {value!r}")
+    return str(value)
+
+
+def format_price(value: Any) -> str:  # noqa: ANN401
+    """Format a price in plain decimal notation, which must be positive."""
+    if isinstance(value, float):
+        if not (value > 0 and math.isfinite(value)):
+            raise ValueError(f"price must be positive and finite, got {value!r}")
+        text = repr(value)
+        return format(value, "f") if "e" in text else text
+    if isinstance(value, (int, Decimal)) and not isinstance(value, bool):
+        if not value > 0:
+            raise ValueError(f"price must be positive, got {value!r}")
+        return str(value) if isinstance(value, int) else format(value, "f")
+    raise TypeError(f"price must be a number, got {type(value).__name__}")
+
+
+_FORMATTERS = {
+    "quantity": format_quantity,
+    "limit_price": format_price,
+    "stop_price": format_price,
+}
+
+
+class OrderTemplate:
+    """
+    An order or order group validated and serialized once for reuse.
+
+    The JSON body is split around the quantity and price fields, so
+    :meth:`render` only formats the values that change and joins bytes,
+    skipping model construction and validation on the hot path. Pass the
+    result to `place` or `confirm` (`place_group` or `confirm_group` for
+    groups).
+
+    Each keyword of `render` applies to every leg that has the field, or
+    takes one entry per leg. For a bracket group, `limit_price` therefore
+    moves the profit target and `stop_price` the stop loss.
+
+    Args:
+        order: The validated order or group; its values are the defaults
+    """
+
+    def __init__(self, order: Union[OrderRequest, OrderGroupRequest]) -> None:
+        self.order = order
+        self.is_group = isinstance(order, OrderGroupRequest)
+        payload = order.to_payload()
+        legs = payload["Orders"] if self.is_group else [payload]
+
+        # (keyword, leg) of every open field, with its serialized default.
+        slots: List[Tuple[str, int]] = []
+        defaults: List[bytes] = []
+        markers: List[str] = []
+        for leg, fields in enumerate(legs):
+            for name, key in PATCHABLE_FIELDS.items():
+                if key in fields:
+                    marker = f"\x00{len(slots)}\x00"
+                    slots.append((name, leg))
+                    defaults.append(fields[key].encode())
+                    markers.append(json.dumps(marker))
+                    fields[key] = marker
+        text = json.dumps(payload, separators=(",", ":"))
+
+        # Split around each quoted marker, keeping the quotes in the pieces.
+        # Markers appear in key order, which is not necessarily slot order.
+        found = sorted((text.index(marker), i) for i, marker in enumerate(markers))
+        pieces: List[bytes] = []
+        start = 0
+        for position, i in found:
+            pieces.append(text[start : position + 1].encode())
+            start = position + len(markers[i]) - 1
+        pieces.append(text[start:].encode())
+
+        self._pieces = pieces
+        self._slots = [slots[i] for _, i in found]
+        self._defaults = [defaults[i] for _, i in found]
+        self.fields: FrozenSet[str] = frozenset(name for name, _ in slots)
+        self.body = self.render()
+
+    def render(
+        self,
+        quantity: Patch = None,
+        limit_price: Patch = None,
+        stop_price: Patch = None,
+    ) -> bytes:
+        """
+        Return the JSON body with the given values patched in.
+
+        Raises:
+            ValueError: If a value is not positive, or the template has no
+                such field
+        """
+        patches = {
+            "quantity": quantity,
+            "limit_price": limit_price,
+            "stop_price": stop_price,
+        }
+        for name, value in patches.items():
+            if value is not None and name not in self.fields:
+                raise ValueError(f"This order template has no {name} to patch")
+
+        pieces = self._pieces
+        parts = [pieces[0]]
+        for i, (name, leg) in enumerate(self._slots):
+            value = patches[name]
+            if value is not None and not isinstance(value, (int, float, Decimal)):
+                value = value[leg]
+            if value is None:
+                parts.append(self._defaults[i])
+            else:
+                parts.append(_FORMATTERS[name](value).encode())
+            parts.append(pieces[i + 1])
+        return b"".join(parts)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.body.decode()})"
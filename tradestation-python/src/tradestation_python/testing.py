@@ -0,0 +1,470 @@
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple, Union
+
+import anyio
+import httpx
+
+from ._auth import OAuth2PasswordBearer, TradeStationAuth
+from ._client import AsyncTradeStation, TradeStation
+from ._token_store import MemoryTokenStore
+
+MOCK_BASE_URL = "https://api.tradestation.test/v3"
+MOCK_ISSUER = "https://signin.tradestation.test"
+
+# Last minute bar served; bar series end here unless `lastdate` says otherwise.
+DEFAULT_END = datetime(2024, 1, 2, 21, 0, tzinfo=timezone.utc)
+
+# Same cap as the real barcharts endpoint.
+_MAX_BARS = 57600
+_SPANS = {
+    "Minute": timedelta(minutes=1),
+    "Daily": timedelta(days=1),
+    "Weekly": timedelta(weeks=1),
+    "Monthly": timedelta(days=31),
+}
+_DATE_FORMAT = r"%Y-%m-%dT%H:%M:%SZ"
+_MAX_CACHED_BODIES = 256
+
+Chunks = List[bytes]
+
+
+def mock_bar(epoch: int, status: str = "Closed") -> Dict[str, Any]:
+    """A barcharts bar at `epoch` (ms), with prices derived from the epoch."""
+    step = epoch // 60_000
+    close = 100 + (step * 7919 % 2000) / 100
+    return {
+        "High": f"{close + 0.12:.2f}",
+        "Low": f"{close - 0.09:.2f}",
+        "Open": f"{close - 0.03:.2f}",
+        "Close": f"{close:.2f}",
+        "TimeStamp": _bar_time(epoch),
+        "TotalVolume": str(1000 + step % 500),
+        "DownTicks": 40 + step % 7,
+        "DownVolume": 400 + step % 250,
+        "OpenInterest": "0",
+        "IsRealtime": status == "Open",
+        "IsEndOfHistory": False,
+        "TotalTicks": 100 + step % 13,
+        "UnchangedTicks": 10,
+        "UnchangedVolume": 100,
+        "UpTicks": 50 + step % 6,
+        "UpVolume": 500 + step % 250,
+        "Epoch": epoch,
+        "BarStatus": status,
+    }
+
+
+def _dumps(payload: Any) -> bytes:  # noqa: ANN401
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _line(payload: Any) -> bytes:  # noqa: ANN401
+    return _dumps(payload) + b"\n"
+
+
+class MockTradeStation:
+    """
+    In-process stand-in for the TradeStation API, for tests and benchmarks.
+
+    Serves the OAuth token endpoint, OpenID discovery, barcharts (snapshot
+    and streaming), brokerage and order execution endpoints through
+    :class:`httpx.MockTransport`, with payloads shaped and sized like the
+    real ones, so SDK performance can be measured without credentials::
+
+        mock = MockTradeStation(latency=0.005, rate_limit_every=50)
+        bars = mock.client().market_data.bars("MSFT", barsback=1000)
+
+    Answers are deterministic: the same request always gets the same body,
+    so benchmark runs are comparable. Injected failures only hit API
+    endpoints, never the token or discovery endpoints.
+
+    Args:
+        latency: Seconds added before every response
+        rate_limit_every: Answer every Nth API request with 429 (0: never)
+        retry_after: `Retry-After` seconds sent with 429s
+        error_rate: Fraction of API requests answered with 500
+        positions_per_account: Open positions reported per account
+        orders_per_account: Orders reported per account
+        stream_updates: Open-bar updates sent after the history on a bar
+            stream, before the server asks the client to reconnect
+        end: Time of the last bar in every series
+        seed: Seed for `error_rate`
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        retry_after: float = 0.0,
+        error_rate: float = 0.0,
+        positions_per_account: int = 5,
+        orders_per_account: int = 10,
+        stream_updates: int = 0,
+        end: datetime = DEFAULT_END,
+        seed: int = 0,
+    ) -> None:
+        self.base_url = MOCK_BASE_URL
+        self.issuer = MOCK_ISSUER
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.positions_per_account = positions_per_account
+        self.orders_per_account = orders_per_account
+        self.stream_updates = stream_updates
+        self.end_epoch = int(end.timestamp() * 1000)
+        self.requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.tokens_issued = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies: Dict[str, bytes] = {}
+        self._next_order_id = 1000
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for sync clients; latency blocks the calling thread."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if self.latency:
+                time.sleep(self.latency)
+            status, headers, body = self.respond(request)
+            if isinstance(body, list):
+                return httpx.Response(status, headers=headers, content=iter(body))
+            return httpx.Response(status, headers=headers, content=body)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for async clients; latency yields to the event loop."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if self.latency:
+                await anyio.sleep(self.latency)
+            status, headers, body = self.respond(request)
+            if isinstance(body, list):
+                return httpx.Response(status, headers=headers, content=_aiter(body))
+            return httpx.Response(status, headers=headers, content=body)
+
+        return httpx.MockTransport(handler)
+
+    def auth(self) -> TradeStationAuth:
+        """
+        Auth that discovers the mock issuer and refreshes tokens against it.
+
+        The OAuth client starts with a refresh token, so no browser flow runs.
+        """
+        oauth_client = OAuth2PasswordBearer(
+            base_url=self.issuer, client_id="mock-client", client_secret="mock-secret"
+        )
+        oauth_client.refresh_token = "mock-refresh-token"
+        oauth_client._client = httpx.Client(
+            base_url=self.issuer, transport=self.transport()
+        )
+        auth = TradeStationAuth(token_store=MemoryTokenStore())
+        auth.oauth_client = oauth_client
+        return auth
+
+    def client(self, **kwargs: Any) -> TradeStation:  # noqa: ANN401
+        """A TradeStation client wired to the mock; `kwargs` are passed through."""
+        kwargs.setdefault("auth", self.auth())
+        return TradeStation(
+            base_url=self.base_url, transport=self.transport(), **kwargs
+        )
+
+    def async_client(self, **kwargs: Any) -> AsyncTradeStation:  # noqa: ANN401
+        """An AsyncTradeStation client wired to the mock."""
+        kwargs.setdefault("auth", self.auth())
+        return AsyncTradeStation(
+            base_url=self.base_url, transport=self.async_transport(), **kwargs
+        )
+
+    def respond(
+        self, request: httpx.Request
+    ) -> Tuple[int, Dict[str, str], Union[bytes, Chunks]]:
+        """Status, headers and body (or stream chunks) for `request`."""
+        url = request.url
+        if str(url).startswith(self.issuer):
+            return self._auth_endpoint(request)
+
+        with self._lock:
+            self.requests += 1
+            count = self.requests
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+        if self.rate_limit_every and count % self.rate_limit_every == 0:
+            with self._lock:
+                self.rate_limited += 1
+            headers = {"Retry-After": str(self.retry_after)}
+            return 429, headers, _dumps({"Error": "TooManyRequests"})
+        if failed:
+            with self._lock:
+                self.errors += 1
+            return 500, {}, _dumps({"Error": "InternalServerError"})
+
+        path = url.path[len(httpx.URL(self.base_url).path) :].strip("/")
+        parts = path.split("/")
+        try:
+            if parts[0] == "marketdata":
+                if parts[1:3] == ["stream", "barcharts"]:
+                    return 200, {}, self._bar_stream(url.params)
+                if parts[1] == "barcharts":
+                    return 200, {}, self._bars(url)
+            if parts[0] == "brokerage":
+                return 200, {}, self._brokerage(parts, url.params)
+            if parts[0] == "orderexecution":
+                return 200, {}, self._order_execution(request, parts)
+        except (IndexError, KeyError, ValueError) as e:
+            return 400, {}, _dumps({"Error": "BadRequest", "Message": str(e)})
+        return 404, {}, _dumps({"Error": "NotFound", "Message": path})
+
+    def _auth_endpoint(
+        self, request: httpx.Request
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        path = request.url.path
+        if path.endswith("/.well-known/openid-configuration"):
+            return (
+                200,
+                {},
+                _dumps(
+                    {
+                        "issuer": self.issuer,
+                        "authorization_endpoint": f"{self.issuer}/authorize",
+                        "token_endpoint": f"{self.issuer}/oauth/token",
+                        "jwks_uri": f"{self.issuer}/.well-known/jwks.json",
+                    }
+                ),
+            )
+        if path == "/oauth/token" and request.method == "POST":
+            with self._lock:
+                self.tokens_issued += 1
+                n = self.tokens_issued
+            return (
+                200,
+                {},
+                _dumps(
+                    {
+                        "access_token": f"mock-access-token-{n}",
+                        "id_token": "mock-id-token",
+                        "refresh_token": "mock-refresh-token",
+                        "scope": "openid profile offline_access MarketData ReadAccount Trade",
+                        "token_type": "Bearer",
+                        "expires_in": 1200,
+                    }
+                ),
+            )
+        return 404, {}, _dumps({"error": "not_found"})
+
+    def _series(self, params: httpx.QueryParams) -> Iterator[int]:
+        """Epochs of the bars a barcharts request asks for, oldest first."""
+        step = int(
+            _SPANS[params.get("unit", "Minute")]
+            * int(params.get("interval", 1))
+            / timedelta(milliseconds=1)
+        )
+        if "firstdate" in params:
+            first = _parse_date(params["firstdate"])
+            last = (
+                _parse_date(params["lastdate"])
+                if "lastdate" in params
+                else self.end_epoch
+            )
+            start = first + -first % step
+            end = min(last, start + step * (_MAX_BARS - 1))
+            return iter(range(start, end + 1, step))
+        barsback = min(int(params.get("barsback", 1)), _MAX_BARS)
+        last = self.end_epoch - self.end_epoch % step
+        return iter(range(last - step * (barsback - 1), last + 1, step))
+
+    def _bars(self, url: httpx.URL) -> bytes:
+        key = str(url)
+        body = self._bodies.get(key)
+        if body is None:
+            body = _dumps({"Bars": [mock_bar(e) for e in self._series(url.params)]})
+            with self._lock:
+                if len(self._bodies) >= _MAX_CACHED_BODIES:
+                    self._bodies.clear()
+                self._bodies[key] = body
+        return body
+
+    def _bar_stream(self, params: httpx.QueryParams) -> Chunks:
+        chunks = [_line(mock_bar(epoch)) for epoch in self._series(params)]
+        if self.stream_updates:
+            step = int(_SPANS[params.get("unit", "Minute")] / timedelta(milliseconds=1))
+            epoch = self.end_epoch - self.end_epoch % step + step
+            bar = mock_bar(epoch, "Open")
+            for n in range(self.stream_updates):
+                bar["TotalTicks"] = n + 1
+                chunks.append(_line(bar))
+        chunks.append(_line({"Heartbeat": 1, "Timestamp": _bar_time(self.end_epoch)}))
+        chunks.append(_line({"StreamStatus": "GoAway"}))
+        return chunks
+
+    def _brokerage(self, parts: List[str], params: httpx.QueryParams) -> bytes:
+        if parts == ["brokerage", "accounts"]:
+            accounts = [
+                {
+                    "AccountID": f"1100000{n}",
+                    "AccountType": "Margin",
+                    "Currency": "USD",
+                    "Status": "Active",
+                }
+                for n in range(3)
+            ]
+            return _dumps({"Accounts": accounts})
+        account_ids, kind = parts[2].split(","), parts[3]
+        if kind == "balances":
+            return _dumps({"Balances": [_balance(a) for a in account_ids]})
+        if kind == "positions":
+            positions = [
+                _position(a, n)
+                for a in account_ids
+                for n in range(self.positions_per_account)
+            ]
+            return _dumps({"Positions": positions})
+        if kind == "orders":
+            orders = [
+                _order(a, n)
+                for a in account_ids
+                for n in range(self.orders_per_account)
+            ]
+            start = int(params.get("nextToken", 0))
+            size = int(params.get("pageSize", 600))
+            page: Dict[str, Any] = {"Orders": orders[start : start + size]}
+            if start + size < len(orders):
+                page["NextToken"] = str(start + size)
+            return _dumps(page)
+        raise KeyError(kind)
+
+    def _order_execution(self, request: httpx.Request, parts: List[str]) -> bytes:
+        kind = parts[1]
+        if kind == "routes":
+            routes = [
+                {"Id": "AUTO", "Name": "Intelligent", "AssetTypes": ["STOCK"]},
+                {"Id": "ARCX", "Name": "ARCA", "AssetTypes": ["STOCK"]},
+            ]
+            return _dumps({"Routes": routes})
+        if request.method in ("PUT", "DELETE"):
+            return _dumps({"OrderID": parts[2], "Message": "Order accepted"})
+        body = json.loads(request.content)
+        legs = body.get("Orders", [body])
+        if kind in ("orderconfirm", "ordergroupconfirm"):
+            confirmations = [
+                {
+                    "OrderConfirmID": f"confirm-{n}",
+                    "EstimatedCost": "1000.00",
+                    "EstimatedCommission": "0.00",
+                    "SummaryMessage": f"{leg['TradeAction']} {leg['Quantity']} "
+                    f"{leg['Symbol']}",
+                }
+                for n, leg in enumerate(legs)
+            ]
+            return _dumps({"Confirmations": confirmations})
+        if kind in ("orders", "ordergroups"):
+            with self._lock:
+                first = self._next_order_id
+                self._next_order_id += len(legs)
+            orders = [
+                {
+                    "OrderID": str(first + n),
+                    "Message": f"Sent order: {leg['TradeAction']} {leg['Quantity']} "
+                    f"{leg['Symbol']}",
+                }
+                for n, leg in enumerate(legs)
+            ]
+            return _dumps({"Orders": orders})
+        raise KeyError(kind)
+
+
+def _bar_time(epoch: int) -> str:
+    return datetime.fromtimestamp(epoch / 1000, tz=timezone.utc).strftime(_DATE_FORMAT)
+
+
+def _parse_date(value: str) -> int:
+    parsed = datetime.strptime(value, _DATE_FORMAT).replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+async def _aiter(chunks: Chunks) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _balance(account_id: str) -> Dict[str, Any]:
+    return {
+        "AccountID": account_id,
+        "AccountType": "Margin",
+        "CashBalance": "25000.50",
+        "BuyingPower": "100000.00",
+        "Equity": "75000.25",
+        "MarketValue": "49999.75",
+        "TodaysProfitLoss": "125.40",
+        "UnclearedDeposit": "0",
+        "Commission": "0",
+        "BalanceDetail": {
+            "CostOfPositions": "48000.00",
+            "DayTrades": "0",
+            "MaintenanceRate": "0.25",
+            "OptionBuyingPower": "50000.00",
+            "OptionsMarketValue": "0",
+            "OvernightBuyingPower": "50000.00",
+            "RealizedProfitLoss": "0",
+            "RequiredMargin": "12500.00",
+            "UnrealizedProfitLoss": "1999.75",
+        },
+    }
+
+
+_SYMBOLS = ["MSFT", "AAPL", "NVDA", "AMZN", "GOOGL", "META", "TSLA", "SPY"]
+
+
+def _position(account_id: str, n: int) -> Dict[str, Any]:
+    return {
+        "AccountID": account_id,
+        "PositionID": f"{account_id}-{n}",
+        "Symbol": _SYMBOLS[n % len(_SYMBOLS)],
+        "AssetType": "STOCK",
+        "LongShort": "Long",
+        "Quantity": str(100 * (n + 1)),
+        "AveragePrice": "410.25",
+        "Last": "412.10",
+        "Bid": "412.05",
+        "Ask": "412.15",
+        "MarketValue": "41210.00",
+        "TotalCost": "41025.00",
+        "TodaysProfitLoss": "85.00",
+        "UnrealizedProfitLoss": "185.00",
+        "UnrealizedProfitLossPercent": "0.45",
+        "InitialRequirement": "20605.00",
+        "Timestamp": "2024-01-02T14:30:00Z",
+    }
+
+
+def _order(account_id: str, n: int) -> Dict[str, Any]:
+    symbol = _SYMBOLS[n % len(_SYMBOLS)]
+    return {
+        "AccountID": account_id,
+        "OrderID": f"{account_id}-{n}",
+        "Status": "OPN" if n % 3 else "FLL",
+        "StatusDescription": "Received" if n % 3 else "Filled",
+        "OrderType": "Limit",
+        "Duration": "DAY",
+        "LimitPrice": "400.00",
+        "FilledPrice": "0" if n % 3 else "399.95",
+        "OpenedDateTime": "2024-01-02T14:30:00Z",
+        "Legs": [
+            {
+                "Symbol": symbol,
+                "BuyOrSell": "Buy",
+                "AssetType": "STOCK",
+                "OpenOrClose": "Open",
+                "QuantityOrdered": "100",
+                "ExecQuantity": "0" if n % 3 else "100",
+                "QuantityRemaining": "100" if n % 3 else "0",
+                "ExecutionPrice": "0" if n % 3 else "399.95",
+            }
+        ],
+    }
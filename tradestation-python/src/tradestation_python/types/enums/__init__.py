@@ -1,3 +1,4 @@
+from .order import Duration, OrderGroupType, OrderType, TradeAction  # noqa: F401
 from .scope import Scope  # noqa: F401
 from .session_template import SessionTemplate  # noqa: F401
 from .unit import Unit  # noqa: F401
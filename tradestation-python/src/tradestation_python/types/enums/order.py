@@ -0,0 +1,38 @@
+from enum import Enum
+
+
+class OrderType(Enum):
+    MARKET = "Market"
+    LIMIT = "Limit"
+    STOP_MARKET = "StopMarket"
+    STOP_LIMIT = "StopLimit"
+
+
+class TradeAction(Enum):
+    BUY = "BUY"
+    SELL = "SELL"
+    BUY_TO_COVER = "BUYTOCOVER"
+    SELL_SHORT = "SELLSHORT"
+    BUY_TO_OPEN = "BUYTOOPEN"
+    BUY_TO_CLOSE = "BUYTOCLOSE"
+    SELL_TO_OPEN = "SELLTOOPEN"
+    SELL_TO_CLOSE = "SELLTOCLOSE"
+
+
+class Duration(Enum):
+    DAY = "DAY"
+    DAY_PLUS = "DYP"
+    GOOD_TILL_CANCELED = "GTC"
+    GOOD_TILL_CANCELED_PLUS = "GCP"
+    GOOD_TILL_DATE = "GTD"
+    GOOD_TILL_DATE_PLUS = "GDP"
+    OPENING = "OPG"
+    CLOSE = "CLO"
+    IMMEDIATE_OR_CANCEL = "IOC"
+    FILL_OR_KILL = "FOK"
+
+
+class OrderGroupType(Enum):
+    ORDER_CANCELS_ORDER = "OCO"
+    BRACKET = "BRK"
+    NORMAL = "NORMAL"
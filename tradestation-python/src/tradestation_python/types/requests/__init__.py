@@ -0,0 +1 @@
+from .orders import OrderGroupRequest, OrderRequest, TimeInForce  # noqa: F401
@@ -0,0 +1,21 @@
+from typing import Any, Dict
+
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+
+class BaseRequest(BaseModel):
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+        frozen=True,
+        use_enum_values=True,
+    )
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Return the JSON body the API expects."""
+        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    def to_json(self) -> bytes:
+        """Return the JSON body the API expects, serialized."""
+        return self.model_dump_json(by_alias=True, exclude_none=True).encode()
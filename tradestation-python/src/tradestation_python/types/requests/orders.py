@@ -0,0 +1,63 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from pydantic import Field, field_serializer, model_validator
+
+from ..enums import Duration, OrderGroupType, OrderType, TradeAction
+from .base import BaseRequest
+
+
+class TimeInForce(BaseRequest):
+    """How long an order stays working."""
+
+    duration: Duration = Field(alias="Duration")
+    expiration: Optional[datetime] = Field(None, alias="Expiration")
+
+
+class OrderRequest(BaseRequest):
+    """
+    A single order, as sent to the place and confirm endpoints.
+
+    Quantities and prices are sent as strings, as the API expects.
+    """
+
+    account_id: str = Field(alias="AccountID")
+    symbol: str = Field(alias="Symbol")
+    quantity: int = Field(alias="Quantity", gt=0)
+    order_type: OrderType = Field(alias="OrderType")
+    trade_action: TradeAction = Field(alias="TradeAction")
+    time_in_force: TimeInForce = Field(
+        default=TimeInForce(Duration=Duration.DAY, Expiration=None), alias="TimeInForce"
+    )
+    limit_price: Optional[Decimal] = Field(None, alias="LimitPrice", gt=0)
+    stop_price: Optional[Decimal] = Field(None, alias="StopPrice", gt=0)
+    route: Optional[str] = Field(None, alias="Route")
+
+    @model_validator(mode="after")
+    def _check_prices(self) -> "OrderRequest":
+        order_type = OrderType(self.order_type)
+        if order_type in (OrderType.LIMIT, OrderType.STOP_LIMIT):
+            if self.limit_price is None:
+                raise ValueError(f"{order_type.value} orders need a limit_price")
+        if order_type in (OrderType.STOP_MARKET, OrderType.STOP_LIMIT):
+            if self.stop_price is None:
+                raise ValueError(f"{order_type.value} orders need a stop_price")
+        return self
+
+    @field_serializer("quantity", "limit_price", "stop_price")
+    def _as_string(self, value: Optional[object]) -> Optional[str]:
+        return None if value is None else str(value)
+
+
+class OrderGroupRequest(BaseRequest):
+    """
+    Orders placed together as one group.
+
+    An OCO group cancels the remaining orders once one fills. A bracket
+    (BRK) group is a pair of exit orders, a profit target and a stop loss,
+    for the same position.
+    """
+
+    type: OrderGroupType = Field(alias="Type")
+    orders: List[OrderRequest] = Field(alias="Orders", min_length=2)
@@ -1,4 +1,66 @@
-from .accounts import AccountsResponse, Account, AccountDetail  # noqa: F401
-from .bars import BarsResponse, Bar  # noqa: F401
-from .openid import OpenID  # noqa: F401
-from .token import TokenInfo  # noqa: F401
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+# Each model module is imported the first time one of its models is used.
+__getattr__, __dir__, __all__ = lazy_exports(
+    __name__,
+    {
+        ".accounts": ["AccountsResponse", "Account", "AccountDetail"],
+        ".bars": ["BarsResponse", "Bar", "BarRecord", "BarsFrame"],
+        ".brokerage": [
+            "AccountError",
+            "AccountOrdersResponse",
+            "Balance",
+            "BalanceDetail",
+            "BalancesResponse",
+            "Order",
+            "OrderLeg",
+            "Position",
+            "PositionsResponse",
+        ],
+        ".openid": ["OpenID"],
+        ".orders": [
+            "OrderConfirmation",
+            "OrderConfirmResponse",
+            "OrderError",
+            "OrderResponse",
+            "OrderResult",
+            "OrdersResponse",
+            "Route",
+            "RoutesResponse",
+        ],
+        ".quotes": ["Quote", "QuotesResponse"],
+        ".stream": ["Heartbeat", "StreamErrorResponse", "StreamStatus"],
+        ".token": ["TokenInfo"],
+    },
+)
+
+if TYPE_CHECKING:
+    from .accounts import Account, AccountDetail, AccountsResponse  # noqa: F401
+    from .bars import Bar, BarRecord, BarsFrame, BarsResponse  # noqa: F401
+    from .brokerage import (  # noqa: F401
+        AccountError,
+        AccountOrdersResponse,
+        Balance,
+        BalanceDetail,
+        BalancesResponse,
+        Order,
+        OrderLeg,
+        Position,
+        PositionsResponse,
+    )
+    from .openid import OpenID  # noqa: F401
+    from .orders import (  # noqa: F401
+        OrderConfirmation,
+        OrderConfirmResponse,
+        OrderError,
+        OrderResponse,
+        OrderResult,
+        OrdersResponse,
+        Route,
+        RoutesResponse,
+    )
+    from .quotes import Quote, QuotesResponse  # noqa: F401
+    from .stream import Heartbeat, StreamErrorResponse, StreamStatus  # noqa: F401
+    from .token import TokenInfo  # noqa: F401
@@ -1,5 +1,20 @@
-from datetime import datetime
-from typing import List
+import json
+import sys
+from array import array
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 from pydantic import Field
 
@@ -33,3 +48,238 @@ class BarsResponse(BaseResponse):
     """Bars response model containing a list of bar data."""
 
     bars: List[Bar] = Field(alias="Bars")
+
+    def to_frame(self) -> "BarsFrame":
+        """Pack the bars into a columnar :class:`BarsFrame`."""
+        return BarsFrame.from_payload(self.model_dump(by_alias=True))
+
+
+# Column name, JSON key and array typecode for every numeric bar field.
+BAR_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("epoch", "Epoch", "q"),
+    ("open", "Open", "d"),
+    ("high", "High", "d"),
+    ("low", "Low", "d"),
+    ("close", "Close", "d"),
+    ("total_volume", "TotalVolume", "q"),
+    ("up_volume", "UpVolume", "q"),
+    ("down_volume", "DownVolume", "q"),
+    ("unchanged_volume", "UnchangedVolume", "q"),
+    ("total_ticks", "TotalTicks", "q"),
+    ("up_ticks", "UpTicks", "q"),
+    ("down_ticks", "DownTicks", "q"),
+    ("unchanged_ticks", "UnchangedTicks", "q"),
+    ("open_interest", "OpenInterest", "q"),
+    ("is_realtime", "IsRealtime", "b"),
+    ("is_end_of_history", "IsEndOfHistory", "b"),
+)
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {"q": int, "d": float}
+
+
+def _to_flag(value: Any) -> int:  # noqa: ANN401
+    if isinstance(value, str):
+        return int(value.lower() == "true")
+    return int(bool(value))
+
+
+class BarRecord:
+    """
+    Immutable view of one bar in a :class:`BarsFrame`.
+
+    A record only holds its frame and row index, so walking millions of bars
+    never allocates a model per bar. Fields are read from the packed columns
+    on access, and :meth:`to_bar` builds the full :class:`Bar` when needed.
+    """
+
+    __slots__ = ("_frame", "_index")
+    _frame: "BarsFrame"
+    _index: int
+
+    epoch: int
+    open: float
+    high: float
+    low: float
+    close: float
+    total_volume: int
+    up_volume: int
+    down_volume: int
+    unchanged_volume: int
+    total_ticks: int
+    up_ticks: int
+    down_ticks: int
+    unchanged_ticks: int
+    open_interest: int
+    is_realtime: bool
+    is_end_of_history: bool
+
+    def __init__(self, frame: "BarsFrame", index: int) -> None:
+        object.__setattr__(self, "_frame", frame)
+        object.__setattr__(self, "_index", index)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.epoch / 1000, tz=timezone.utc)
+
+    @property
+    def bar_status(self) -> str:
+        return self._frame.bar_status[self._index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the bar fields keyed by :class:`Bar` field name."""
+        fields = {name: getattr(self, name) for name, _, _ in BAR_COLUMNS}
+        fields["timestamp"] = self.timestamp
+        fields["bar_status"] = self.bar_status
+        return fields
+
+    def to_bar(self) -> Bar:
+        """Materialize the record as a full :class:`Bar` model."""
+        return Bar.model_validate(self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BarRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(epoch={self.epoch}, open={self.open}, "
+            f"high={self.high}, low={self.low}, close={self.close}, "
+            f"total_volume={self.total_volume}, bar_status={self.bar_status!r})"
+        )
+
+
+def _column_getter(name: str, typecode: str) -> property:
+    if typecode == "b":
+        return property(lambda self: bool(getattr(self._frame, name)[self._index]))
+    return property(lambda self: getattr(self._frame, name)[self._index])
+
+
+for _name, _, _typecode in BAR_COLUMNS:
+    setattr(BarRecord, _name, _column_getter(_name, _typecode))
+
+
+class BarsFrame:
+    """
+    Columnar bar data decoded without building per-bar models.
+
+    Numeric columns are :class:`array.array` instances (epoch and counts as
+    int64, prices as float64, flags as int8), so they expose the buffer
+    protocol and can be wrapped zero-copy with ``numpy.frombuffer``.
+    """
+
+    epoch: "array[int]"
+    open: "array[float]"
+    high: "array[float]"
+    low: "array[float]"
+    close: "array[float]"
+    total_volume: "array[int]"
+    up_volume: "array[int]"
+    down_volume: "array[int]"
+    unchanged_volume: "array[int]"
+    total_ticks: "array[int]"
+    up_ticks: "array[int]"
+    down_ticks: "array[int]"
+    unchanged_ticks: "array[int]"
+    open_interest: "array[int]"
+    is_realtime: "array[int]"
+    is_end_of_history: "array[int]"
+    bar_status: List[str]
+
+    def __init__(
+        self,
+        columns: Optional[Dict[str, "array[Any]"]] = None,
+        bar_status: Optional[List[str]] = None,
+    ) -> None:
+        columns = columns or {}
+        for name, _, typecode in BAR_COLUMNS:
+            setattr(self, name, columns.get(name, array(typecode)))
+        self.bar_status = bar_status if bar_status is not None else []
+
+        lengths = {len(column) for column in self.columns.values()}
+        lengths.add(len(self.bar_status))
+        if len(lengths) > 1:
+            raise ValueError("All bar columns must have the same length.")
+
+    def __len__(self) -> int:
+        return len(self.epoch)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(bars={len(self)})"
+
+    @overload
+    def __getitem__(self, index: int) -> BarRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BarsFrame": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[BarRecord, "BarsFrame"]:
+        if isinstance(index, slice):
+            columns = {name: column[index] for name, column in self.columns.items()}
+            return type(self)(columns, self.bar_status[index])
+        n = len(self)
+        if not -n <= index < n:
+            raise IndexError("BarsFrame index out of range")
+        return BarRecord(self, index % n)
+
+    def __iter__(self) -> Iterator[BarRecord]:
+        return (BarRecord(self, i) for i in range(len(self)))
+
+    @property
+    def columns(self) -> Dict[str, "array[Any]"]:
+        """Numeric columns keyed by field name."""
+        return {name: getattr(self, name) for name, _, _ in BAR_COLUMNS}
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "BarsFrame":
+        """Build a frame from a decoded barcharts payload (``{"Bars": [...]}``)."""
+        bars = payload.get("Bars", [])
+        if not bars:
+            return cls()
+
+        # Transpose rows into per-field tuples once, then convert column-wise.
+        keys = [key for _, key, _ in BAR_COLUMNS] + ["BarStatus"]
+        *values, bar_status = zip(*map(itemgetter(*keys), bars))
+        columns: Dict[str, "array[Any]"] = {}
+        for (name, _, typecode), column in zip(BAR_COLUMNS, values):
+            if typecode == "b" and all(isinstance(v, bool) for v in column):
+                columns[name] = array(typecode, column)
+            else:
+                convert = _CONVERTERS.get(typecode, _to_flag)
+                columns[name] = array(typecode, map(convert, column))
+        # Statuses repeat, so share one string object per distinct value.
+        return cls(columns, list(map(sys.intern, bar_status)))
+
+    @classmethod
+    def from_json(
+        cls,
+        content: Union[str, bytes],
+        loads: Callable[[Union[str, bytes]], Any] = json.loads,
+    ) -> "BarsFrame":
+        """
+        Build a frame straight from a raw barcharts JSON body.
+
+        Args:
+            content: The response body
+            loads: JSON parser to use, such as a client decoder's `loads`
+        """
+        return cls.from_payload(loads(content))
+
+    @classmethod
+    def concat(cls, frames: Iterable["BarsFrame"]) -> "BarsFrame":
+        """Concatenate frames in order into a single frame."""
+        result = cls()
+        for frame in frames:
+            for name, column in frame.columns.items():
+                getattr(result, name).extend(column)
+            result.bar_status.extend(frame.bar_status)
+        return result
+
+    def to_response(self) -> BarsResponse:
+        """Materialize the frame as a regular :class:`BarsResponse`."""
+        return BarsResponse.model_validate({"Bars": [r.to_bar() for r in self]})
@@ -0,0 +1,113 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from .base import BaseResponse
+
+
+class AccountError(BaseResponse):
+    """An account in a batched request that could not be queried."""
+
+    account_id: str = Field(alias="AccountID")
+    error: str = Field(alias="Error")
+    message: Optional[str] = Field(None, alias="Message")
+
+
+class BalanceDetail(BaseResponse):
+    """Margin and buying power breakdown of an account balance."""
+
+    cost_of_positions: Optional[float] = Field(None, alias="CostOfPositions")
+    day_trades: Optional[int] = Field(None, alias="DayTrades")
+    maintenance_rate: Optional[float] = Field(None, alias="MaintenanceRate")
+    option_buying_power: Optional[float] = Field(None, alias="OptionBuyingPower")
+    options_market_value: Optional[float] = Field(None, alias="OptionsMarketValue")
+    overnight_buying_power: Optional[float] = Field(None, alias="OvernightBuyingPower")
+    realized_profit_loss: Optional[float] = Field(None, alias="RealizedProfitLoss")
+    required_margin: Optional[float] = Field(None, alias="RequiredMargin")
+    unrealized_profit_loss: Optional[float] = Field(None, alias="UnrealizedProfitLoss")
+
+
+class Balance(BaseResponse):
+    """Current balance of one account."""
+
+    account_id: str = Field(alias="AccountID")
+    account_type: Optional[str] = Field(None, alias="AccountType")
+    cash_balance: Optional[float] = Field(None, alias="CashBalance")
+    buying_power: Optional[float] = Field(None, alias="BuyingPower")
+    equity: Optional[float] = Field(None, alias="Equity")
+    market_value: Optional[float] = Field(None, alias="MarketValue")
+    todays_profit_loss: Optional[float] = Field(None, alias="TodaysProfitLoss")
+    uncleared_deposit: Optional[float] = Field(None, alias="UnclearedDeposit")
+    commission: Optional[float] = Field(None, alias="Commission")
+    balance_detail: Optional[BalanceDetail] = Field(None, alias="BalanceDetail")
+
+
+class BalancesResponse(BaseResponse):
+    balances: List[Balance] = Field(default_factory=list, alias="Balances")
+    errors: List[AccountError] = Field(default_factory=list, alias="Errors")
+
+
+class Position(BaseResponse):
+    """An open position in one account."""
+
+    account_id: str = Field(alias="AccountID")
+    position_id: str = Field(alias="PositionID")
+    symbol: str = Field(alias="Symbol")
+    asset_type: Optional[str] = Field(None, alias="AssetType")
+    long_short: Optional[str] = Field(None, alias="LongShort")
+    quantity: float = Field(alias="Quantity")
+    average_price: Optional[float] = Field(None, alias="AveragePrice")
+    last: Optional[float] = Field(None, alias="Last")
+    bid: Optional[float] = Field(None, alias="Bid")
+    ask: Optional[float] = Field(None, alias="Ask")
+    market_value: Optional[float] = Field(None, alias="MarketValue")
+    total_cost: Optional[float] = Field(None, alias="TotalCost")
+    todays_profit_loss: Optional[float] = Field(None, alias="TodaysProfitLoss")
+    unrealized_profit_loss: Optional[float] = Field(None, alias="UnrealizedProfitLoss")
+    unrealized_profit_loss_percent: Optional[float] = Field(
+        None, alias="UnrealizedProfitLossPercent"
+    )
+    initial_requirement: Optional[float] = Field(None, alias="InitialRequirement")
+    timestamp: Optional[datetime] = Field(None, alias="Timestamp")
+
+
+class PositionsResponse(BaseResponse):
+    positions: List[Position] = Field(default_factory=list, alias="Positions")
+    errors: List[AccountError] = Field(default_factory=list, alias="Errors")
+
+
+class OrderLeg(BaseResponse):
+    """One leg of an account order."""
+
+    symbol: str = Field(alias="Symbol")
+    buy_or_sell: Optional[str] = Field(None, alias="BuyOrSell")
+    asset_type: Optional[str] = Field(None, alias="AssetType")
+    open_or_close: Optional[str] = Field(None, alias="OpenOrClose")
+    quantity_ordered: Optional[float] = Field(None, alias="QuantityOrdered")
+    exec_quantity: Optional[float] = Field(None, alias="ExecQuantity")
+    quantity_remaining: Optional[float] = Field(None, alias="QuantityRemaining")
+    execution_price: Optional[float] = Field(None, alias="ExecutionPrice")
+
+
+class Order(BaseResponse):
+    """An order in one account, as reported by the brokerage endpoints."""
+
+    account_id: str = Field(alias="AccountID")
+    order_id: str = Field(alias="OrderID")
+    status: Optional[str] = Field(None, alias="Status")
+    status_description: Optional[str] = Field(None, alias="StatusDescription")
+    order_type: Optional[str] = Field(None, alias="OrderType")
+    duration: Optional[str] = Field(None, alias="Duration")
+    limit_price: Optional[float] = Field(None, alias="LimitPrice")
+    stop_price: Optional[float] = Field(None, alias="StopPrice")
+    filled_price: Optional[float] = Field(None, alias="FilledPrice")
+    opened_date_time: Optional[datetime] = Field(None, alias="OpenedDateTime")
+    closed_date_time: Optional[datetime] = Field(None, alias="ClosedDateTime")
+    legs: List[OrderLeg] = Field(default_factory=list, alias="Legs")
+
+
+class AccountOrdersResponse(BaseResponse):
+    orders: List[Order] = Field(default_factory=list, alias="Orders")
+    errors: List[AccountError] = Field(default_factory=list, alias="Errors")
+    next_token: Optional[str] = Field(None, alias="NextToken")
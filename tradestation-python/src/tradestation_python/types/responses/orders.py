@@ -0,0 +1,66 @@
+from typing import List, Optional
+
+from pydantic import Field
+
+from .base import BaseResponse
+
+
+class OrderResult(BaseResponse):
+    """Outcome of placing one order."""
+
+    order_id: str = Field(alias="OrderID")
+    message: Optional[str] = Field(None, alias="Message")
+
+
+class OrderError(BaseResponse):
+    """An order the API rejected."""
+
+    order_id: Optional[str] = Field(None, alias="OrderID")
+    error: str = Field(alias="Error")
+    message: Optional[str] = Field(None, alias="Message")
+
+
+class OrdersResponse(BaseResponse):
+    """Response to placing an order or an order group."""
+
+    orders: List[OrderResult] = Field(default_factory=list, alias="Orders")
+    errors: List[OrderError] = Field(default_factory=list, alias="Errors")
+
+
+class OrderConfirmation(BaseResponse):
+    """Estimated cost and summary of an order that was not placed."""
+
+    order_confirm_id: str = Field(alias="OrderConfirmID")
+    summary_message: Optional[str] = Field(None, alias="SummaryMessage")
+    estimated_cost: Optional[float] = Field(None, alias="EstimatedCost")
+    estimated_commission: Optional[float] = Field(None, alias="EstimatedCommission")
+    estimated_price: Optional[float] = Field(None, alias="EstimatedPrice")
+
+
+class OrderConfirmResponse(BaseResponse):
+    """Response to confirming an order or an order group."""
+
+    confirmations: List[OrderConfirmation] = Field(
+        default_factory=list, alias="Confirmations"
+    )
+    errors: List[OrderError] = Field(default_factory=list, alias="Errors")
+
+
+class OrderResponse(BaseResponse):
+    """Response to replacing or cancelling an order."""
+
+    order_id: str = Field(alias="OrderID")
+    message: Optional[str] = Field(None, alias="Message")
+    error: Optional[str] = Field(None, alias="Error")
+
+
+class Route(BaseResponse):
+    """An order route accepted by the `Route` order field."""
+
+    id: str = Field(alias="Id")
+    name: str = Field(alias="Name")
+    asset_types: List[str] = Field(default_factory=list, alias="AssetTypes")
+
+
+class RoutesResponse(BaseResponse):
+    routes: List[Route] = Field(alias="Routes")
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from .base import BaseResponse
+
+
+class Quote(BaseResponse):
+    """
+    Quote data model.
+
+    Streamed quotes only carry the fields that changed since the previous
+    message for the symbol, so everything except the symbol is optional.
+    """
+
+    symbol: str = Field(alias="Symbol")
+    open: Optional[float] = Field(None, alias="Open")
+    high: Optional[float] = Field(None, alias="High")
+    low: Optional[float] = Field(None, alias="Low")
+    previous_close: Optional[float] = Field(None, alias="PreviousClose")
+    last: Optional[float] = Field(None, alias="Last")
+    ask: Optional[float] = Field(None, alias="Ask")
+    ask_size: Optional[int] = Field(None, alias="AskSize")
+    bid: Optional[float] = Field(None, alias="Bid")
+    bid_size: Optional[int] = Field(None, alias="BidSize")
+    net_change: Optional[float] = Field(None, alias="NetChange")
+    net_change_pct: Optional[float] = Field(None, alias="NetChangePct")
+    volume: Optional[int] = Field(None, alias="Volume")
+    trade_time: Optional[datetime] = Field(None, alias="TradeTime")
+
+
+class QuotesResponse(BaseResponse):
+    quotes: List[Quote] = Field(alias="Quotes")
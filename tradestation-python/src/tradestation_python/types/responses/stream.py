@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field
+
+from .base import BaseResponse
+
+
+class Heartbeat(BaseResponse):
+    """Keep-alive message sent on idle streams."""
+
+    heartbeat: int = Field(alias="Heartbeat")
+    timestamp: datetime = Field(alias="Timestamp")
+
+
+class StreamStatus(BaseResponse):
+    """Stream lifecycle message such as `EndSnapshot` or `GoAway`."""
+
+    stream_status: str = Field(alias="StreamStatus")
+
+
+class StreamErrorResponse(BaseResponse):
+    """Error reported in-band by a stream before it is closed."""
+
+    error: str = Field(alias="Error")
+    message: Optional[str] = Field(default=None, alias="Message")
+    symbol: Optional[str] = Field(default=None, alias="Symbol")
@@ -1,7 +1,6 @@
-from functools import cached_property
 from time import time
 
-from pydantic import BaseModel, ConfigDict, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class TokenInfo(BaseModel):
@@ -10,11 +9,13 @@ class TokenInfo(BaseModel):
     id_token: str
     scope: str
     expires_in: int
+    # Unix time the token was issued, recorded when the response is parsed.
+    issued_at: int = Field(default_factory=lambda: int(time()))
 
-    @computed_field
-    @cached_property
+    @computed_field  # type: ignore[prop-decorator]
+    @property
     def expires_at(self) -> int:
-        return int(time()) + self.expires_in
+        return self.issued_at + self.expires_in
 
 
 class TokenInfoWithRefresh(TokenInfo):
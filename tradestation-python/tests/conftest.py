@@ -0,0 +1,20 @@
+import httpx
+import pytest
+
+from tradestation_python import TradeStation
+
+from .helpers import BarsHandler
+
+
+@pytest.fixture
+def handler() -> BarsHandler:
+    return BarsHandler()
+
+
+@pytest.fixture
+def ts(handler: BarsHandler) -> TradeStation:
+    return TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(handler),
+    )
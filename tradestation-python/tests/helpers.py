@@ -0,0 +1,68 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import httpx
+
+START = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+N_BARS = 500
+
+
+def make_bar(epoch: int, status: str = "Closed") -> dict:
+    timestamp = datetime.fromtimestamp(epoch / 1000, tz=timezone.utc)
+    return {
+        "High": "101.5",
+        "Low": "99.5",
+        "Open": "100.0",
+        "Close": "101.0",
+        "TimeStamp": timestamp.strftime(r"%Y-%m-%dT%H:%M:%SZ"),
+        "TotalVolume": "1200",
+        "DownTicks": 4,
+        "DownVolume": 400,
+        "OpenInterest": "0",
+        "IsRealtime": False,
+        "IsEndOfHistory": False,
+        "TotalTicks": 10,
+        "UnchangedTicks": 1,
+        "UnchangedVolume": 100,
+        "UpTicks": 5,
+        "UpVolume": 700,
+        "Epoch": epoch,
+        "BarStatus": status,
+    }
+
+
+EPOCHS = [int((START + timedelta(minutes=i)).timestamp() * 1000) for i in range(N_BARS)]
+
+
+class BarsHandler:
+    """Serve minute bars between the requested firstdate and lastdate."""
+
+    def __init__(self, open_from: Optional[int] = None) -> None:
+        self.requests = []
+        self.lock = threading.Lock()
+        # Bars at or after this epoch are served as still open.
+        self.open_from = open_from
+
+    def bar(self, epoch: int) -> dict:
+        is_open = self.open_from is not None and epoch >= self.open_from
+        return make_bar(epoch, "Open" if is_open else "Closed")
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+        if request.url.path.endswith("/BAD"):
+            return httpx.Response(404, json={"Error": "NotFound"})
+        params = request.url.params
+        if "barsback" in params:
+            bars = [self.bar(epoch) for epoch in EPOCHS[: int(params["barsback"])]]
+            return httpx.Response(200, json={"Bars": bars})
+        fmt = r"%Y-%m-%dT%H:%M:%SZ"
+        first = datetime.strptime(params["firstdate"], fmt).replace(tzinfo=timezone.utc)
+        last = datetime.strptime(params["lastdate"], fmt).replace(tzinfo=timezone.utc)
+        bars = [
+            self.bar(epoch)
+            for epoch in EPOCHS
+            if first.timestamp() * 1000 <= epoch <= last.timestamp() * 1000
+        ]
+        return httpx.Response(200, json={"Bars": bars})
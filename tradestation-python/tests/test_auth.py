@@ -0,0 +1,257 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import httpx
+import pytest
+
+from tradestation_python._auth import TradeStationAuth
+from tradestation_python._token_store import (
+    FileTokenStore,
+    MemoryTokenStore,
+    StoredToken,
+)
+from tradestation_python.types.responses import TokenInfo
+
+
+class FakeOAuthClient:
+    def __init__(self, expires_in: int = 1200, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.expires_in = expires_in
+        self.delay = delay
+        self.refresh_token = "refresh-0"
+        self._lock = threading.Lock()
+
+    def get_token_info(self, code: Optional[str] = None) -> TokenInfo:
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        time.sleep(self.delay)
+        return TokenInfo(
+            access_token=f"token-{calls}",
+            id_token="id",
+            scope="openid",
+            expires_in=self.expires_in,
+        )
+
+
+@pytest.fixture
+def auth(monkeypatch: pytest.MonkeyPatch) -> TradeStationAuth:
+    monkeypatch.setenv("TS_AUTH_CLIENT_ID", "client-id")
+    monkeypatch.setenv("TS_AUTH_CLIENT_SECRET", "client-secret")
+    auth = TradeStationAuth(token_store=MemoryTokenStore())
+    auth.oauth_client = FakeOAuthClient()  # type: ignore[assignment]
+    return auth
+
+
+def echo_authorization(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"auth": request.headers["Authorization"]})
+
+
+def test_sync_auth_flow_sets_bearer(auth: TradeStationAuth):
+    transport = httpx.MockTransport(echo_authorization)
+    with httpx.Client(auth=auth, transport=transport) as client:
+        first = client.get("https://api.test/v3/brokerage/accounts").json()
+        second = client.get("https://api.test/v3/brokerage/accounts").json()
+
+    assert first == second == {"auth": "Bearer token-1"}
+    assert auth.oauth_client.calls == 1
+
+
+def test_async_auth_flow_sets_bearer(auth: TradeStationAuth):
+    async def main() -> dict:
+        transport = httpx.MockTransport(echo_authorization)
+        async with httpx.AsyncClient(auth=auth, transport=transport) as client:
+            response = await client.get("https://api.test/v3/brokerage/accounts")
+            return response.json()
+
+    assert asyncio.run(main()) == {"auth": "Bearer token-1"}
+
+
+def expired_token() -> TokenInfo:
+    return TokenInfo(access_token="old", id_token="id", scope="openid", expires_in=-600)
+
+
+def test_concurrent_requests_across_expiry_refresh_once(auth: TradeStationAuth):
+    auth.oauth_client = FakeOAuthClient(delay=0.05)  # type: ignore[assignment]
+    auth._token_info = expired_token()
+    transport = httpx.MockTransport(echo_authorization)
+
+    with httpx.Client(auth=auth, transport=transport) as client:
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: client.get("https://api.test/v3/brokerage/accounts"),
+                    range(200),
+                )
+            )
+
+    assert {response.json()["auth"] for response in responses} == {"Bearer token-1"}
+    assert auth.oauth_client.calls == 1
+    assert auth.refreshes == 1
+
+
+def test_async_concurrent_requests_across_expiry_refresh_once(auth: TradeStationAuth):
+    auth.oauth_client = FakeOAuthClient(delay=0.05)  # type: ignore[assignment]
+    auth._token_info = expired_token()
+
+    async def main() -> set:
+        transport = httpx.MockTransport(echo_authorization)
+        async with httpx.AsyncClient(auth=auth, transport=transport) as client:
+            responses = await asyncio.gather(
+                *(
+                    client.get("https://api.test/v3/brokerage/accounts")
+                    for _ in range(200)
+                )
+            )
+        return {response.json()["auth"] for response in responses}
+
+    assert asyncio.run(main()) == {"Bearer token-1"}
+    assert auth.oauth_client.calls == 1
+
+
+def test_token_near_expiry_is_refreshed_in_background(auth: TradeStationAuth):
+    auth.oauth_client = FakeOAuthClient(delay=0.2)  # type: ignore[assignment]
+    auth._token_info = TokenInfo(
+        access_token="old",
+        id_token="id",
+        scope="openid",
+        expires_in=1200,
+        issued_at=int(time.time()) - 900,
+    )
+    transport = httpx.MockTransport(echo_authorization)
+
+    with httpx.Client(auth=auth, transport=transport) as client:
+        started = time.monotonic()
+        first = client.get("https://api.test/v3/brokerage/accounts").json()
+        second = client.get("https://api.test/v3/brokerage/accounts").json()
+        elapsed = time.monotonic() - started
+
+        assert auth._background is not None
+        auth._background.join()
+        third = client.get("https://api.test/v3/brokerage/accounts").json()
+
+    # The stale token keeps serving requests while the refresh runs.
+    assert first == second == {"auth": "Bearer old"}
+    assert elapsed < 0.2
+    assert third == {"auth": "Bearer token-1"}
+    assert auth.oauth_client.calls == 1
+
+
+def test_expiry_counts_from_issuance():
+    token = TokenInfo(
+        access_token="a", id_token="id", scope="openid", expires_in=1200, issued_at=1000
+    )
+
+    assert token.expires_at == 2200
+    assert TokenInfo.model_validate(token.model_dump()).expires_at == 2200
+
+
+def test_buffer_treats_token_as_expired_early(auth: TradeStationAuth):
+    issued_at = int(time.time()) - 1080
+    fresh = TokenInfo(access_token="a", id_token="id", scope="openid", expires_in=600)
+    nearly = TokenInfo(
+        access_token="a",
+        id_token="id",
+        scope="openid",
+        expires_in=1200,
+        issued_at=issued_at,
+    )
+
+    assert not auth._is_expiring(fresh)
+    assert auth._is_expiring(nearly)
+
+
+def test_margins_shrink_for_short_lived_tokens(auth: TradeStationAuth):
+    now = int(time.time())
+
+    def issued(seconds_ago: int) -> TokenInfo:
+        return TokenInfo(
+            access_token="a",
+            id_token="id",
+            scope="openid",
+            expires_in=300,
+            issued_at=now - seconds_ago,
+        )
+
+    # With the default 600s refresh-ahead a 300s token would always be stale.
+    assert not auth._is_stale(issued(0))
+    assert auth._is_stale(issued(160))
+    assert not auth._is_expiring(issued(160))
+    assert auth._is_expiring(issued(230))
+
+
+def test_interactive_login_runs_without_the_store_lock(
+    auth: TradeStationAuth,
+):
+    store = MemoryTokenStore()
+    auth.token_store = store
+    auth.oauth_client.refresh_token = None
+    locked: List[bool] = []
+
+    def get_code() -> str:
+        locked.append(store._lock.locked())
+        return "code"
+
+    auth.oauth_client._get_code = get_code  # type: ignore[method-assign]
+
+    assert auth._refresh(None).access_token == "token-1"
+    assert locked == [False]
+    assert store.load() is not None
+
+
+def test_file_token_store_round_trip(tmp_path):
+    store = FileTokenStore(tmp_path / "tokens" / "token.json")
+    assert store.load() is None
+
+    token = TokenInfo(
+        access_token="a", id_token="id", scope="openid", expires_in=1200, issued_at=1000
+    )
+    with store.lock():
+        store.save(StoredToken(token, "refresh"))
+
+    loaded = store.load()
+    assert loaded == StoredToken(token, "refresh")
+    assert (store.path.stat().st_mode & 0o777) == 0o600
+    assert [p.name for p in store.path.parent.iterdir() if p.suffix == ".tmp"] == []
+
+    store.path.write_text("{not json")
+    assert store.load() is None
+    store.clear()
+    store.clear()
+
+
+def test_restart_reuses_stored_token(auth: TradeStationAuth, tmp_path):
+    store = FileTokenStore(tmp_path / "token.json")
+    token = TokenInfo(
+        access_token="saved", id_token="id", scope="openid", expires_in=1200
+    )
+    store.save(StoredToken(token, "refresh-saved"))
+    auth.token_store = store
+
+    transport = httpx.MockTransport(echo_authorization)
+    with httpx.Client(auth=auth, transport=transport) as client:
+        response = client.get("https://api.test/v3/brokerage/accounts").json()
+
+    assert response == {"auth": "Bearer saved"}
+    assert auth.oauth_client.calls == 0
+    assert auth.oauth_client.refresh_token == "refresh-saved"
+
+
+def test_shared_store_refreshes_once_across_clients(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("TS_AUTH_CLIENT_ID", "client-id")
+    monkeypatch.setenv("TS_AUTH_CLIENT_SECRET", "client-secret")
+    store = MemoryTokenStore()
+    first = TradeStationAuth(token_store=store)
+    second = TradeStationAuth(token_store=store)
+    first.oauth_client = FakeOAuthClient()  # type: ignore[assignment]
+    second.oauth_client = FakeOAuthClient()  # type: ignore[assignment]
+
+    assert first._refresh(None).access_token == "token-1"
+    assert second._refresh(None).access_token == "token-1"
+    assert (first.refreshes, second.refreshes) == (1, 0)
+    assert second.oauth_client.refresh_token == "refresh-0"
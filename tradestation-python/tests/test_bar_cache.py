@@ -0,0 +1,143 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from tradestation_python import TradeStation
+from tradestation_python.lib import BarCache, BarCacheKey
+from tradestation_python.types.enums import Unit
+from tradestation_python.types.responses import BarsFrame
+
+from .helpers import EPOCHS, START, BarsHandler, make_bar
+
+KEY = BarCacheKey("MSFT", 1, Unit.MINUTE)
+
+
+def cached(ts: TradeStation, cache: BarCache, minutes: int) -> BarsFrame:
+    return ts.market_data.cached_bars(
+        "MSFT",
+        cache,
+        firstdate=START,
+        lastdate=START + timedelta(minutes=minutes),
+        unit=Unit.MINUTE,
+    )
+
+
+def test_cached_bars_serves_cache_and_tops_up_tail(
+    ts: TradeStation, handler: BarsHandler, tmp_path: Path
+):
+    cache = BarCache(tmp_path)
+
+    assert list(cached(ts, cache, 99).epoch) == EPOCHS[:100]
+    assert cache.rows(KEY) == 100
+    assert len(handler.requests) == 1
+
+    # Fully cached ranges never reach the API.
+    assert list(cached(ts, cache, 49).epoch) == EPOCHS[:50]
+    assert len(handler.requests) == 1
+
+    # Extending the range only fetches bars after the last cached epoch.
+    assert list(cached(ts, cache, 199).epoch) == EPOCHS[:200]
+    assert len(handler.requests) == 2
+    assert handler.requests[-1].url.params["firstdate"] == "2024-01-02T16:09:00Z"
+    assert cache.rows(KEY) == 200
+
+
+def test_open_bars_are_returned_but_not_cached(
+    ts: TradeStation, handler: BarsHandler, tmp_path: Path
+):
+    cache = BarCache(tmp_path)
+    handler.open_from = EPOCHS[150]
+
+    frame = cached(ts, cache, 199)
+
+    assert list(frame.epoch) == EPOCHS[:200]
+    assert frame.bar_status[149:151] == ["Closed", "Open"]
+    assert cache.last_epoch(KEY) == EPOCHS[149]
+
+
+def test_request_around_cached_range_fetches_only_what_is_missing(
+    ts: TradeStation, handler: BarsHandler, tmp_path: Path
+):
+    cache = BarCache(tmp_path)
+    ts.market_data.cached_bars(
+        "MSFT",
+        cache,
+        firstdate=START + timedelta(minutes=100),
+        lastdate=START + timedelta(minutes=199),
+        unit=Unit.MINUTE,
+    )
+
+    assert list(cached(ts, cache, 299).epoch) == EPOCHS[:300]
+    head, tail = (request.url.params for request in handler.requests[1:])
+    assert (head["firstdate"], head["lastdate"]) == (
+        "2024-01-02T14:30:00Z",
+        "2024-01-02T16:10:00Z",
+    )
+    assert tail["firstdate"] == "2024-01-02T17:49:00Z"
+    assert cache.first_epoch(KEY) == EPOCHS[0]
+    assert cache.last_epoch(KEY) == EPOCHS[299]
+
+
+def test_request_ending_before_cached_range_leaves_no_hole(
+    ts: TradeStation, handler: BarsHandler, tmp_path: Path
+):
+    cache = BarCache(tmp_path)
+    ts.market_data.cached_bars(
+        "MSFT",
+        cache,
+        firstdate=START + timedelta(minutes=200),
+        lastdate=START + timedelta(minutes=299),
+        unit=Unit.MINUTE,
+    )
+
+    assert list(cached(ts, cache, 49).epoch) == EPOCHS[:50]
+    # The rebuild reached the old first bar, so the series is contiguous.
+    assert handler.requests[-1].url.params["lastdate"] == "2024-01-02T17:50:00Z"
+    assert cache.rows(KEY) == 300
+
+    assert list(cached(ts, cache, 299).epoch) == EPOCHS[:300]
+    assert len(handler.requests) == 2
+
+
+def test_series_can_be_rewritten_after_reads(tmp_path: Path):
+    cache = BarCache(tmp_path)
+    frame = BarsFrame.from_payload({"Bars": [make_bar(epoch) for epoch in EPOCHS[:3]]})
+    cache.write(KEY, frame)
+    cache.read(KEY)
+    cache.last_epoch(KEY)
+
+    # No mapping is left open, so the directory can be removed and rewritten.
+    cache.write(KEY, frame[:2])
+
+    assert cache.rows(KEY) == 2
+
+
+def test_interrupted_rewrite_keeps_the_old_series(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    cache = BarCache(tmp_path)
+    frame = BarsFrame.from_payload({"Bars": [make_bar(epoch) for epoch in EPOCHS[:3]]})
+    cache.write(KEY, frame)
+
+    def crash(*args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(BarCache, "_write_meta", staticmethod(crash))
+    with pytest.raises(OSError):
+        cache.write(KEY, frame[:1])
+
+    assert list(cache.read(KEY).epoch) == EPOCHS[:3]
+
+
+def test_uncommitted_append_is_ignored(tmp_path: Path):
+    cache = BarCache(tmp_path)
+    frame = BarsFrame.from_payload({"Bars": [make_bar(epoch) for epoch in EPOCHS[:3]]})
+    cache.append(KEY, frame)
+    # Simulate a crash after column data was written but before commit.
+    with open(tmp_path / KEY.path / "epoch.bin", "ab") as f:
+        f.write(b"\0" * 8)
+
+    assert list(cache.read(KEY).epoch) == EPOCHS[:3]
+    cache.append(KEY, frame)
+    assert cache.rows(KEY) == 3
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from tradestation_python.types.responses import BarRecord, BarsFrame, BarsResponse
+
+PAYLOAD = {
+    "Bars": [
+        {
+            "High": "218.32",
+            "Low": "212.42",
+            "Open": "214.02",
+            "Close": "216.39",
+            "TimeStamp": "2020-11-04T21:00:00Z",
+            "TotalVolume": "42311777",
+            "DownTicks": 231021,
+            "DownVolume": 19575455,
+            "OpenInterest": "0",
+            "IsRealtime": False,
+            "IsEndOfHistory": False,
+            "TotalTicks": 460552,
+            "UnchangedTicks": 0,
+            "UnchangedVolume": 0,
+            "UpTicks": 229531,
+            "UpVolume": 22736321,
+            "Epoch": 1604523600000,
+            "BarStatus": "Closed",
+        },
+        {
+            "High": "220.01",
+            "Low": "215.50",
+            "Open": "216.40",
+            "Close": "219.95",
+            "TimeStamp": "2020-11-05T21:00:00Z",
+            "TotalVolume": "36012000",
+            "DownTicks": 200000,
+            "DownVolume": 16000000,
+            "OpenInterest": "0",
+            "IsRealtime": True,
+            "IsEndOfHistory": True,
+            "TotalTicks": 410000,
+            "UnchangedTicks": 10000,
+            "UnchangedVolume": 12000,
+            "UpTicks": 200000,
+            "UpVolume": 20000000,
+            "Epoch": 1604610000000,
+            "BarStatus": "Open",
+        },
+    ]
+}
+
+
+def test_bars_frame_decodes_typed_columns():
+    frame = BarsFrame.from_json(json.dumps(PAYLOAD).encode())
+
+    assert len(frame) == 2
+    assert frame.epoch.typecode == "q"
+    assert frame.close.typecode == "d"
+    assert frame.total_volume.typecode == "q"
+    assert list(frame.epoch) == [1604523600000, 1604610000000]
+    assert list(frame.close) == [216.39, 219.95]
+    assert list(frame.total_volume) == [42311777, 36012000]
+    assert list(frame.is_realtime) == [0, 1]
+    assert frame.bar_status == ["Closed", "Open"]
+
+
+def test_bars_frame_round_trips_to_response():
+    frame = BarsFrame.from_payload(PAYLOAD)
+
+    assert frame.to_response() == BarsResponse.model_validate(PAYLOAD)
+
+
+def test_bars_frame_empty_payload():
+    frame = BarsFrame.from_payload({"Bars": []})
+
+    assert len(frame) == 0
+    assert frame.to_response().bars == []
+
+
+def test_bars_frame_records_read_packed_columns():
+    frame = BarsFrame.from_payload(PAYLOAD)
+    response = BarsResponse.model_validate(PAYLOAD)
+
+    record = frame[-1]
+    assert isinstance(record, BarRecord)
+    assert (record.epoch, record.close, record.is_realtime) == (
+        1604610000000,
+        219.95,
+        True,
+    )
+    assert record.timestamp == response.bars[1].timestamp
+    assert [r.to_bar() for r in frame] == response.bars
+    assert frame[0] == BarsFrame.from_payload(PAYLOAD)[0]
+    with pytest.raises(IndexError):
+        frame[2]
+
+
+def test_bar_records_are_immutable_and_compact():
+    record = BarsFrame.from_payload(PAYLOAD)[0]
+
+    with pytest.raises(AttributeError):
+        record.close = 1.0  # type: ignore[misc]
+    assert not hasattr(record, "__dict__")
+
+
+def test_bars_response_packs_into_frame():
+    response = BarsResponse.model_validate(PAYLOAD)
+
+    assert response.to_frame().to_response() == response
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from typing import List
+
+import httpx
+import pytest
+
+from tradestation_python import AsyncTradeStation, ResponseCache, TradeStation
+
+ACCOUNTS = [f"{11000000 + i}" for i in range(60)]
+
+
+class BrokerageHandler:
+    """Answer balances, positions and orders for the accounts in the path."""
+
+    def __init__(self, page_size: int = 2) -> None:
+        self.requests: List[httpx.Request] = []
+        self.lock = threading.Lock()
+        self.page_size = page_size
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+        *_, ids, kind = request.url.path.split("/")
+        accounts = ids.split(",")
+        if kind == "balances":
+            balances = [
+                {"AccountID": a, "CashBalance": "1000.50", "Equity": "2500"}
+                for a in accounts
+                if a != "BAD"
+            ]
+            errors = [
+                {"AccountID": "BAD", "Error": "FAILED", "Message": "Unknown"}
+                for a in accounts
+                if a == "BAD"
+            ]
+            return httpx.Response(200, json={"Balances": balances, "Errors": errors})
+        if kind == "positions":
+            positions = [
+                {
+                    "AccountID": a,
+                    "PositionID": f"{a}-1",
+                    "Symbol": request.url.params.get("symbol", "MSFT"),
+                    "Quantity": "100",
+                    "AveragePrice": "410.25",
+                    "LongShort": "Long",
+                }
+                for a in accounts
+            ]
+            return httpx.Response(200, json={"Positions": positions})
+        # Three orders per account, served `page_size` at a time.
+        orders = [
+            {
+                "AccountID": a,
+                "OrderID": f"{a}-{n}",
+                "Status": "OPN",
+                "Legs": [{"Symbol": "MSFT", "BuyOrSell": "Buy"}],
+            }
+            for a in accounts
+            for n in range(3)
+        ]
+        start = int(request.url.params.get("nextToken", 0))
+        page = {"Orders": orders[start : start + self.page_size]}
+        if start + self.page_size < len(orders):
+            page["NextToken"] = str(start + self.page_size)
+        return httpx.Response(200, json=page)
+
+
+@pytest.fixture
+def brokerage() -> BrokerageHandler:
+    return BrokerageHandler()
+
+
+@pytest.fixture
+def ts(brokerage: BrokerageHandler) -> TradeStation:
+    return TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(brokerage),
+    )
+
+
+def test_balances_are_batched_and_merged_in_order(
+    ts: TradeStation, brokerage: BrokerageHandler
+):
+    response = ts.brokerage.balances(ACCOUNTS + ACCOUNTS[:5])
+
+    assert [b.account_id for b in response.balances] == ACCOUNTS
+    assert response.balances[0].cash_balance == 1000.5
+    batch_sizes = sorted(
+        len(r.url.path.split("/")[4].split(",")) for r in brokerage.requests
+    )
+    assert batch_sizes == [10, 25, 25]
+
+
+def test_account_errors_are_collected(ts: TradeStation):
+    response = ts.brokerage.balances(f"{ACCOUNTS[0]},BAD")
+
+    assert [b.account_id for b in response.balances] == [ACCOUNTS[0]]
+    assert response.errors[0].account_id == "BAD"
+    with pytest.raises(ValueError):
+        ts.brokerage.balances([])
+
+
+def test_positions_pass_the_symbol_filter(
+    ts: TradeStation, brokerage: BrokerageHandler
+):
+    response = ts.brokerage.positions(ACCOUNTS[:3], symbol="MSFT *")
+
+    assert [p.account_id for p in response.positions] == ACCOUNTS[:3]
+    assert response.positions[0].quantity == 100
+    assert brokerage.requests[0].url.params["symbol"] == "MSFT *"
+
+
+def test_orders_follow_next_token(ts: TradeStation, brokerage: BrokerageHandler):
+    response = ts.brokerage.orders(ACCOUNTS[:30])
+
+    assert len(response.orders) == 90
+    assert response.orders[0].legs[0].symbol == "MSFT"
+    assert response.next_token is None
+    # 25 accounts in 38 pages of two, then 5 accounts in 8 pages.
+    assert len(brokerage.requests) == 38 + 8
+
+
+def test_account_ids_are_stripped(ts: TradeStation, brokerage: BrokerageHandler):
+    ts.brokerage.balances(f"{ACCOUNTS[0]}, {ACCOUNTS[1]} ,")
+
+    assert brokerage.requests[0].url.path.split("/")[4] == ",".join(ACCOUNTS[:2])
+
+
+def test_account_state_honours_a_configured_ttl(brokerage: BrokerageHandler):
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(brokerage),
+        response_cache=ResponseCache({"brokerage/accounts": 60}),
+    )
+
+    ts.brokerage.balances(ACCOUNTS[:1])
+    ts.brokerage.balances(ACCOUNTS[:1])
+    ts.brokerage.positions(ACCOUNTS[:1])
+
+    assert len(brokerage.requests) == 2
+
+
+def test_async_brokerage(brokerage: BrokerageHandler):
+    ts = AsyncTradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(brokerage),
+    )
+
+    async def run() -> None:
+        balances = await ts.brokerage.balances(ACCOUNTS, max_in_flight=2)
+        positions = await ts.brokerage.positions(ACCOUNTS[:1])
+        orders = await ts.brokerage.orders(ACCOUNTS[:1], page_size=2)
+
+        assert [b.account_id for b in balances.balances] == ACCOUNTS
+        assert positions.positions[0].position_id == f"{ACCOUNTS[0]}-1"
+        assert [o.order_id for o in orders.orders] == [
+            f"{ACCOUNTS[0]}-{n}" for n in range(3)
+        ]
+
+    asyncio.run(run())
+
+    assert brokerage.requests[-1].url.params["pageSize"] == "2"
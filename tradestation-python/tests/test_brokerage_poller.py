@@ -0,0 +1,203 @@
+import asyncio
+import hashlib
+import json
+from typing import Dict, List, Set
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from tradestation_python import AsyncTradeStation, TradeStation
+
+ACCOUNTS = [f"{11000000 + i}" for i in range(30)]
+
+
+class AccountState:
+    """Serve mutable balances and positions, with ETags when asked to."""
+
+    def __init__(self, etags: bool = False) -> None:
+        self.etags = etags
+        self.requests: List[httpx.Request] = []
+        self.cash: Dict[str, str] = {a: "1000" for a in ACCOUNTS}
+        self.positions: Dict[str, List[str]] = {a: ["MSFT"] for a in ACCOUNTS}
+        # Accounts the API currently fails to query.
+        self.failing: Set[str] = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        *_, ids, kind = request.url.path.split("/")
+        errors = [
+            {"AccountID": a, "Error": "FAILED", "Message": "Timeout"}
+            for a in ids.split(",")
+            if a in self.failing
+        ]
+        accounts = [a for a in ids.split(",") if a not in self.failing]
+        if kind == "balances":
+            payload = {
+                "Balances": [
+                    {"AccountID": a, "CashBalance": self.cash[a]} for a in accounts
+                ]
+            }
+        else:
+            payload = {
+                "Positions": [
+                    {
+                        "AccountID": a,
+                        "PositionID": f"{a}-{symbol}",
+                        "Symbol": symbol,
+                        "Quantity": "100",
+                    }
+                    for a in accounts
+                    for symbol in self.positions[a]
+                ]
+            }
+        payload["Errors"] = errors
+        body = json.dumps(payload).encode()
+        if not self.etags:
+            return httpx.Response(200, content=body)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, content=body, headers={"ETag": etag})
+
+
+def make_client(state: AccountState) -> TradeStation:
+    return TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(state),
+    )
+
+
+def test_first_poll_adds_everything():
+    state = AccountState()
+    poller = make_client(state).brokerage.poller(ACCOUNTS)
+
+    changes = poller.poll()
+
+    assert list(changes.balances.added) == ACCOUNTS
+    assert (ACCOUNTS[0], f"{ACCOUNTS[0]}-MSFT") in changes.positions.added
+    assert poller.balances[ACCOUNTS[0]].cash_balance == 1000
+    # Two batches of accounts for each endpoint.
+    assert poller.stats.requests == 4
+    assert poller.stats.validated == 60
+
+
+def test_only_changed_records_are_reported_and_validated():
+    state = AccountState()
+    poller = make_client(state).brokerage.poller(ACCOUNTS)
+    poller.poll()
+
+    state.cash[ACCOUNTS[3]] = "900"
+    state.positions[ACCOUNTS[5]] = ["AAPL"]
+    changes = poller.poll()
+
+    assert list(changes.balances.changed) == [ACCOUNTS[3]]
+    old, new = changes.balances.changed[ACCOUNTS[3]]
+    assert (old.cash_balance, new.cash_balance) == (1000, 900)
+    assert list(changes.positions.added) == [(ACCOUNTS[5], f"{ACCOUNTS[5]}-AAPL")]
+    assert list(changes.positions.removed) == [(ACCOUNTS[5], f"{ACCOUNTS[5]}-MSFT")]
+    assert (ACCOUNTS[5], f"{ACCOUNTS[5]}-MSFT") not in poller.positions
+    assert poller.stats.validated == 62
+
+
+def test_identical_bodies_skip_decoding():
+    state = AccountState()
+    poller = make_client(state).brokerage.poller(ACCOUNTS, positions=False)
+    poller.poll()
+
+    changes = poller.poll()
+
+    assert not changes
+    assert poller.stats.unchanged == 2
+    assert poller.stats.validated == 30
+
+
+def test_etags_are_sent_and_not_modified_is_skipped():
+    state = AccountState(etags=True)
+    poller = make_client(state).brokerage.poller(ACCOUNTS[:2], balances=False)
+    poller.poll()
+
+    changes = poller.poll()
+
+    assert not changes
+    assert "If-None-Match" not in state.requests[0].headers
+    assert state.requests[1].headers["If-None-Match"].startswith('"')
+    assert poller.stats.not_modified == 1
+    assert len(poller.positions) == 2
+
+
+def test_failed_accounts_keep_their_records():
+    state = AccountState()
+    poller = make_client(state).brokerage.poller(ACCOUNTS)
+    poller.poll()
+
+    state.failing.add(ACCOUNTS[2])
+    state.cash[ACCOUNTS[3]] = "900"
+    failed = poller.poll()
+    repeated = poller.poll()
+    state.failing.clear()
+    recovered = poller.poll()
+
+    assert list(failed.balances.changed) == [ACCOUNTS[3]]
+    assert not failed.balances.removed and not failed.positions.removed
+    assert [e.account_id for e in failed.errors] == [ACCOUNTS[2]] * 2
+    # The unchanged body is skipped, but its errors are still reported.
+    assert not repeated
+    assert [e.account_id for e in repeated.errors] == [ACCOUNTS[2]] * 2
+    assert not recovered and not recovered.errors
+    assert ACCOUNTS[2] in poller.balances
+
+
+def test_body_that_fails_validation_is_retried():
+    state = AccountState(etags=True)
+    poller = make_client(state).brokerage.poller(ACCOUNTS[:2], positions=False)
+
+    state.cash[ACCOUNTS[0]] = "not a number"
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            poller.poll()
+    assert "If-None-Match" not in state.requests[1].headers
+    assert poller.balances == {}
+
+    state.cash[ACCOUNTS[0]] = "1000"
+    changes = poller.poll()
+
+    assert list(changes.balances.added) == ACCOUNTS[:2]
+
+
+def test_errors_still_raise():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(handler),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ts.brokerage.poller(ACCOUNTS[:1]).poll()
+
+
+def test_async_poller():
+    state = AccountState(etags=True)
+    ts = AsyncTradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(state),
+    )
+    poller = ts.brokerage.poller(ACCOUNTS, max_in_flight=2)
+
+    async def run() -> None:
+        first = await poller.poll()
+        state.cash[ACCOUNTS[0]] = "1"
+        second = await poller.poll()
+
+        assert len(first.balances.added) == 30
+        assert list(second.balances.changed) == [ACCOUNTS[0]]
+        assert not second.positions
+
+    asyncio.run(run())
+
+    assert poller.stats.not_modified == 3
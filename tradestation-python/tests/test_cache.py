@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from tradestation_python import AsyncTradeStation, ResponseCache, TradeStation, _cache
+
+
+class AccountsHandler:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return httpx.Response(200, json={"Accounts": [], "Bars": []})
+
+
+def client(handler: AccountsHandler, cache: ResponseCache) -> TradeStation:
+    return TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(handler),
+        response_cache=cache,
+    )
+
+
+def test_ttl_longest_prefix_wins():
+    cache = ResponseCache({"brokerage": 5, "brokerage/accounts": 60})
+
+    assert cache.ttl_for("/brokerage/accounts") == 60
+    assert cache.ttl_for("brokerage/accounts/123/balances") == 60
+    assert cache.ttl_for("brokerage/orders") == 5
+    assert cache.ttl_for("brokerageX") is None
+    assert cache.ttl_for("marketdata/barcharts/MSFT") is None
+
+
+def test_caching_is_opt_in():
+    handler = AccountsHandler()
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(handler),
+    )
+
+    ts.brokerage.accounts()
+    ts.brokerage.accounts()
+
+    assert ts.response_cache is None
+    assert handler.calls == 2
+
+
+def test_accounts_served_from_cache_until_invalidated():
+    handler = AccountsHandler()
+    cache = ResponseCache({"brokerage/accounts": 60})
+    ts = client(handler, cache)
+
+    ts.brokerage.accounts()
+    ts.brokerage.accounts()
+    assert handler.calls == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    assert cache.invalidate("brokerage") == 1
+    ts.brokerage.accounts()
+    assert handler.calls == 2
+
+
+def test_endpoints_without_ttl_are_not_cached():
+    handler = AccountsHandler()
+    cache = ResponseCache({"brokerage/accounts": 60})
+    ts = client(handler, cache)
+
+    ts.market_data.bars("MSFT")
+    ts.market_data.bars("MSFT")
+
+    assert handler.calls == 2
+    assert len(cache) == 0
+
+
+def test_entries_expire(monkeypatch: pytest.MonkeyPatch):
+    now = [1000.0]
+    monkeypatch.setattr(_cache, "monotonic", lambda: now[0])
+    cache = ResponseCache({"brokerage/accounts": 10})
+    key = cache.key("brokerage/accounts")
+    cache.set(key, b"{}", 10)
+
+    now[0] += 9
+    assert cache.get(key) == b"{}"
+    now[0] += 1
+    assert cache.get(key) is None
+    assert cache.stats.expirations == 1
+
+
+def test_lru_eviction_bounds_entries_and_bytes():
+    cache = ResponseCache({"a": 60}, maxsize=2, max_bytes=10)
+    cache.set(cache.key("a/1"), b"1234", 60)
+    cache.set(cache.key("a/2"), b"1234", 60)
+    cache.get(cache.key("a/1"))
+    cache.set(cache.key("a/3"), b"1234", 60)
+
+    assert cache.get(cache.key("a/2")) is None
+    assert cache.get(cache.key("a/1")) == b"1234"
+
+    cache.set(cache.key("a/4"), b"12345678", 60)
+    assert len(cache) == 1
+    assert cache.stats.evictions == 3
+
+
+def test_concurrent_misses_share_one_request():
+    handler = AccountsHandler(delay=0.05)
+    cache = ResponseCache({"brokerage/accounts": 60})
+    ts = client(handler, cache)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: ts.brokerage.accounts(), range(8)))
+
+    assert handler.calls == 1
+    assert len(results) == 8
+    assert cache.stats.misses == 1
+    assert cache.stats.coalesced + cache.stats.hits == 7
+
+
+def test_failed_load_is_shared_but_not_cached():
+    cache = ResponseCache({"a": 60})
+    key = cache.key("a")
+    calls = []
+
+    def load() -> bytes:
+        calls.append(1)
+        raise httpx.ConnectError("down")
+
+    with pytest.raises(httpx.ConnectError):
+        cache.fetch(key, 60, load)
+    assert cache.fetch(key, 60, lambda: b"ok") == b"ok"
+    assert calls == [1]
+
+
+def test_async_concurrent_misses_share_one_request():
+    handler = AccountsHandler()
+    cache = ResponseCache({"brokerage/accounts": 60})
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return handler(request)
+
+    async def main() -> None:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=httpx.MockTransport(slow),
+            response_cache=cache,
+        ) as ts:
+            await asyncio.gather(*(ts.brokerage.accounts() for _ in range(8)))
+
+    asyncio.run(main())
+
+    assert handler.calls == 1
+    assert cache.stats.coalesced == 7
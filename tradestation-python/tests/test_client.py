@@ -0,0 +1,99 @@
+import asyncio
+
+import httpx
+import pytest
+
+from tradestation_python import AsyncTradeStation, TradeStation
+
+
+class SharedTransport(httpx.MockTransport):
+    def __init__(self) -> None:
+        super().__init__(lambda request: httpx.Response(200, json={"Bars": []}))
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.parametrize("client_class", [TradeStation, AsyncTradeStation])
+def test_pool_and_timeouts_come_from_settings(
+    monkeypatch: pytest.MonkeyPatch, client_class: type
+):
+    monkeypatch.setenv("TS_API_TIMEOUT", "20")
+    monkeypatch.setenv("TS_API_CONNECT_TIMEOUT", "2")
+    monkeypatch.setenv("TS_API_POOL_TIMEOUT", "1")
+    monkeypatch.setenv("TS_API_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("TS_API_KEEPALIVE_EXPIRY", "30")
+    monkeypatch.setenv("TS_API_HTTP2", "true")
+
+    ts = client_class(base_url="https://api.test/v3", auth=httpx.Auth())
+
+    assert ts.timeout == httpx.Timeout(connect=2, read=20, write=20, pool=1)
+    assert ts.limits == httpx.Limits(
+        max_connections=7, max_keepalive_connections=20, keepalive_expiry=30
+    )
+    assert ts.http2 is True
+
+
+def test_explicit_pool_options_win():
+    timeout = httpx.Timeout(5, connect=1)
+    limits = httpx.Limits(max_connections=1)
+    ts = AsyncTradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        timeout=timeout,
+        limits=limits,
+        http2=False,
+    )
+
+    assert ts.client.timeout == timeout
+    assert ts.limits is limits
+    assert ts.http2 is False
+
+
+def test_injected_transport_is_shared_and_not_closed():
+    transport = SharedTransport()
+
+    for _ in range(2):
+        with TradeStation(
+            base_url="https://api.test/v3", auth=httpx.Auth(), transport=transport
+        ) as ts:
+            ts.market_data.bars("MSFT")
+
+        assert ts.client.is_closed
+    assert transport.closed is False
+
+
+def test_async_client_closes_without_closing_injected_transport():
+    closed = []
+
+    class AsyncSharedTransport(httpx.MockTransport):
+        async def aclose(self) -> None:
+            closed.append(True)
+
+    transport = AsyncSharedTransport(
+        lambda request: httpx.Response(200, json={"Bars": []})
+    )
+
+    async def main() -> AsyncTradeStation:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3", auth=httpx.Auth(), transport=transport
+        ) as ts:
+            await ts.market_data.bars("MSFT")
+        return ts
+
+    assert asyncio.run(main()).client.is_closed
+    assert closed == []
+
+
+def test_endpoint_urls_are_parsed_once(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("tradestation_python._base_client.MAX_CACHED_URLS", 2)
+    ts = TradeStation(base_url="https://api.test/v3/", auth=httpx.Auth())
+
+    url = ts._url("/orderexecution/orders")
+
+    assert url == httpx.URL("https://api.test/v3/orderexecution/orders")
+    assert ts._url("orderexecution/orders") is not url
+    assert ts._url("/orderexecution/orders") is url
+    ts._url("orderexecution/routes")
+    assert len(ts._urls) == 1
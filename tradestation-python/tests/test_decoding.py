@@ -0,0 +1,84 @@
+import importlib.util
+import json
+
+import httpx
+import pytest
+
+from tradestation_python import (
+    Instrumentation,
+    JSONDecoder,
+    MsgspecDecoder,
+    OrjsonDecoder,
+    TradeStation,
+    get_decoder,
+)
+from tradestation_python._decoding import DECODERS
+from tradestation_python.types.responses import BarsFrame, BarsResponse
+
+from .helpers import EPOCHS, make_bar
+
+BARS = json.dumps({"Bars": [make_bar(epoch) for epoch in EPOCHS[:5]]}).encode()
+
+AVAILABLE = [
+    name
+    for name in DECODERS
+    if name not in ("orjson", "msgspec") or importlib.util.find_spec(name)
+]
+
+
+def client(**kwargs: object) -> TradeStation:
+    return TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=BARS)
+        ),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_backends_decode_identically(name: str):
+    decoder = get_decoder(name)
+    expected = BarsResponse.model_validate(json.loads(BARS))
+
+    assert decoder.validate(BARS, BarsResponse) == expected
+    assert decoder.loads(BARS) == json.loads(BARS)
+    assert BarsFrame.from_json(BARS, decoder.loads).columns == (
+        BarsFrame.from_json(BARS).columns
+    )
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown JSON decoder"):
+        get_decoder("simdjson")
+
+
+@pytest.mark.parametrize(
+    "name, decoder", [("orjson", OrjsonDecoder), ("msgspec", MsgspecDecoder)]
+)
+def test_missing_optional_backend_names_the_extra(name: str, decoder: type):
+    if importlib.util.find_spec(name):
+        pytest.skip(f"{name} is installed")
+    with pytest.raises(ImportError, match=rf"tradestation-python\[{name}\]"):
+        decoder()
+
+
+def test_client_decoder_comes_from_settings(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TS_API_JSON_DECODER", "json")
+
+    ts = client()
+
+    assert type(ts.decoder) is JSONDecoder
+    assert len(ts.market_data.bars("AAPL", barsback=5).bars) == 5
+    assert len(ts.market_data.bars("AAPL", barsback=5, as_columns=True)) == 5
+
+
+def test_two_pass_decoders_report_decode_time_separately():
+    instrumentation = Instrumentation()
+    ts = client(decoder=JSONDecoder(), instrumentation=instrumentation)
+
+    ts.market_data.bars("AAPL", barsback=5)
+
+    histograms = instrumentation.endpoints["marketdata/barcharts/{}"].histograms
+    assert {"decode", "validate"} <= set(histograms)
@@ -0,0 +1,101 @@
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from tradestation_python import TradeStation, _discovery
+from tradestation_python._auth import OAuth2PasswordBearer, TradeStationAuth
+from tradestation_python._discovery import clear_openid_cache, discover_openid
+
+ISSUER = "https://signin.test"
+CONFIG = {
+    "authorization_endpoint": f"{ISSUER}/authorize",
+    "token_endpoint": f"{ISSUER}/oauth/token",
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    clear_openid_cache()
+    yield
+    clear_openid_cache()
+
+
+class DiscoveryHandler:
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json=CONFIG)
+
+
+def test_discovery_is_cached_per_process():
+    handler = DiscoveryHandler()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    first = discover_openid(ISSUER, client=client)
+    second = discover_openid(ISSUER + "/", client=client)
+
+    assert first is second
+    assert first.token_endpoint == CONFIG["token_endpoint"]
+    assert len(handler.requests) == 1
+    assert handler.requests[0].url == f"{ISSUER}/.well-known/openid-configuration"
+
+
+def test_discovery_disk_cache_honours_ttl(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    handler = DiscoveryHandler()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    path = tmp_path / "openid.json"
+    now = [1000.0]
+    monkeypatch.setattr(_discovery, "time", lambda: now[0])
+
+    discover_openid(ISSUER, client=client, cache_path=path, ttl=60)
+    clear_openid_cache()
+    # A new process would find the document on disk.
+    discover_openid(ISSUER, client=client, cache_path=path, ttl=60)
+    assert len(handler.requests) == 1
+
+    clear_openid_cache()
+    now[0] += 61
+    discover_openid(ISSUER, client=client, cache_path=path, ttl=60)
+    assert len(handler.requests) == 2
+
+
+def test_discovery_ignores_disk_cache_for_other_issuer(tmp_path):
+    handler = DiscoveryHandler()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    path = tmp_path / "openid.json"
+
+    discover_openid(ISSUER, client=client, cache_path=path)
+    discover_openid("https://other.test", client=client, cache_path=path)
+
+    assert len(handler.requests) == 2
+
+
+def test_auth_client_discovers_over_its_own_connection(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("TS_AUTH_CLIENT_ID", "client-id")
+    monkeypatch.setenv("TS_AUTH_CLIENT_SECRET", "client-secret")
+    handler = DiscoveryHandler()
+    bearer = OAuth2PasswordBearer(base_url=ISSUER)
+    bearer._client = httpx.Client(
+        base_url=ISSUER, transport=httpx.MockTransport(handler)
+    )
+
+    assert bearer.openid.authorization_endpoint == CONFIG["authorization_endpoint"]
+    assert bearer.openid.token_endpoint == CONFIG["token_endpoint"]
+    assert len(handler.requests) == 1
+
+
+def test_client_construction_is_lazy(monkeypatch: pytest.MonkeyPatch):
+    def no_io(*args: object, **kwargs: object) -> None:
+        raise AssertionError("no client should be created at construction")
+
+    monkeypatch.setattr(httpx, "Client", no_io)
+    ts = TradeStation(base_url="https://api.test/v3")
+
+    assert ts._client is None
+    assert isinstance(ts.auth, TradeStationAuth)
+    assert ts.auth._oauth_client is None
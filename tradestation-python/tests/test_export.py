@@ -0,0 +1,162 @@
+import csv
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+
+from tradestation_python import TradeStation
+from tradestation_python.lib import BarDatasetWriter, CSVBarWriter, export_bars
+from tradestation_python.lib.export import ArrowBarWriter
+from tradestation_python.types.enums import Unit
+from tradestation_python.types.responses import BarsFrame
+
+from .helpers import EPOCHS, BarsHandler, make_bar
+
+ET = ZoneInfo("America/New_York")
+
+
+def frame_between(start: datetime, count: int) -> BarsFrame:
+    """`count` 1-minute bars, the first ending one minute after `start`."""
+    epochs = [
+        int((start + timedelta(minutes=i + 1)).timestamp() * 1000) for i in range(count)
+    ]
+    return BarsFrame.from_payload({"Bars": [make_bar(epoch) for epoch in epochs]})
+
+
+def read_rows(path: Path) -> List[dict]:
+    with open(path, newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_csv_writer_streams_rows(tmp_path):
+    frame = BarsFrame.from_payload({"Bars": [make_bar(e) for e in EPOCHS[:3]]})
+    path = tmp_path / "bars.csv"
+
+    with CSVBarWriter(path, symbol="AAPL") as writer:
+        writer.write(frame[:2])
+        writer.write(frame[2:])
+
+    rows = read_rows(path)
+    assert writer.rows == 3
+    assert [int(row["epoch"]) for row in rows] == EPOCHS[:3]
+    assert rows[0]["symbol"] == "AAPL"
+    assert rows[0]["timestamp"] == "2024-01-02T14:30:00Z"
+    assert float(rows[0]["close"]) == 101.0
+    assert rows[0]["bar_status"] == "Closed"
+
+
+def test_dataset_partitions_by_symbol_and_exchange_date(tmp_path):
+    # 19:58 to 20:02 ET on Jan 2: midnight UTC falls inside the same ET date,
+    # and a bar ending at midnight ET belongs to the day before.
+    evening = datetime(2024, 1, 2, 23, 58, tzinfo=ET)
+    frame = frame_between(evening, 4)
+
+    with BarDatasetWriter(tmp_path, format="csv") as writer:
+        writer.write("BRK.B", frame)
+        writer.write("MSFT", frame[:1])
+
+    parts = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.csv"))
+    assert parts == [
+        "symbol=BRK.B/date=2024-01-02/part-00000.csv",
+        "symbol=BRK.B/date=2024-01-03/part-00000.csv",
+        "symbol=MSFT/date=2024-01-02/part-00000.csv",
+    ]
+    first_day = read_rows(tmp_path / parts[0])
+    assert len(first_day) == 2
+    assert "symbol" not in first_day[0]
+    assert writer.rows == 5
+
+
+def test_dataset_without_symbol_partition_keeps_symbol_column(tmp_path):
+    frame = frame_between(datetime(2024, 1, 2, 10, 0, tzinfo=ET), 2)
+
+    with BarDatasetWriter(tmp_path, format="csv", partition_by=["date"]) as writer:
+        writer.write("AAPL", frame)
+        writer.write("MSFT", frame)
+
+    rows = read_rows(tmp_path / "date=2024-01-02" / "part-00000.csv")
+    assert [row["symbol"] for row in rows] == ["AAPL", "AAPL", "MSFT", "MSFT"]
+
+
+def test_append_adds_to_existing_partitions(tmp_path):
+    frame = frame_between(datetime(2024, 1, 2, 10, 0, tzinfo=ET), 4)
+
+    export_bars([frame[:2]], tmp_path, "AAPL", format="csv")
+    export_bars([frame[2:]], tmp_path, "AAPL", format="csv")
+
+    path = tmp_path / "symbol=AAPL" / "date=2024-01-02" / "part-00000.csv"
+    assert [int(row["epoch"]) for row in read_rows(path)] == list(frame.epoch)
+
+
+def test_overwrite_replaces_partitions(tmp_path):
+    frame = frame_between(datetime(2024, 1, 2, 10, 0, tzinfo=ET), 4)
+
+    export_bars([frame], tmp_path, "AAPL", format="csv")
+    written = export_bars([frame[:1]], tmp_path, "AAPL", format="csv", append=False)
+
+    path = tmp_path / "symbol=AAPL" / "date=2024-01-02" / "part-00000.csv"
+    assert written == 1
+    assert len(read_rows(path)) == 1
+
+
+def test_export_consumes_iter_bars(tmp_path):
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(BarsHandler()),
+    )
+    start = datetime.fromtimestamp(EPOCHS[0] / 1000, tz=timezone.utc)
+    end = datetime.fromtimestamp(EPOCHS[-1] / 1000, tz=timezone.utc)
+
+    frames = ts.market_data.iter_bars(
+        "AAPL", start, end, unit=Unit.MINUTE, window_size=100, as_columns=True
+    )
+    written = export_bars(frames, tmp_path, "AAPL", format="csv")
+
+    rows = read_rows(tmp_path / "symbol=AAPL" / "date=2024-01-02" / "part-00000.csv")
+    assert written == len(EPOCHS)
+    assert [int(row["epoch"]) for row in rows] == EPOCHS
+
+
+def test_rejects_unknown_options(tmp_path):
+    with pytest.raises(ValueError):
+        BarDatasetWriter(tmp_path, format="xlsx")
+    with pytest.raises(ValueError):
+        BarDatasetWriter(tmp_path, format="csv", partition_by=["month"])
+
+
+def test_parquet_row_groups_are_bounded(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    frame = frame_between(datetime(2024, 1, 2, 10, 0, tzinfo=ET), 10)
+    path = tmp_path / "bars.parquet"
+
+    with ArrowBarWriter(path, symbol="AAPL", row_group_size=4) as writer:
+        for start in range(0, 10, 3):
+            writer.write(frame[start : start + 3])
+            assert writer._pending_rows < 4
+
+    parquet = pq.ParquetFile(path)
+    table = parquet.read()
+    assert [parquet.metadata.row_group(i).num_rows for i in range(3)] == [4, 4, 2]
+    assert table.column("epoch").to_pylist() == list(frame.epoch)
+    assert table.column("is_realtime").to_pylist() == [False] * 10
+    assert table.column("symbol").to_pylist() == ["AAPL"] * 10
+
+
+def test_parquet_append_writes_new_part_files(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    frame = frame_between(datetime(2024, 1, 2, 10, 0, tzinfo=ET), 4)
+
+    export_bars([frame[:2]], tmp_path, "AAPL", format="parquet")
+    export_bars([frame[2:]], tmp_path, "AAPL", format="parquet")
+
+    partition = tmp_path / "symbol=AAPL" / "date=2024-01-02"
+    assert sorted(p.name for p in partition.iterdir()) == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+    ]
+    table = pq.read_table(partition)
+    assert sorted(table.column("epoch").to_pylist()) == list(frame.epoch)
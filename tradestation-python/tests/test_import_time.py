@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import tradestation_python
+
+# Cumulative `python -X importtime` budget for `import tradestation_python`,
+# in microseconds. Importing everything eagerly took over 300 ms.
+IMPORT_BUDGET_US = 50_000
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Cumulative import time of every module `statement` imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_package_import_is_within_budget():
+    times = import_times("import tradestation_python")
+
+    assert times["tradestation_python"] < IMPORT_BUDGET_US
+    for module in ("httpx", "pydantic", "anyio", "tradestation_python._client"):
+        assert module not in times
+
+
+def test_client_import_skips_auth_flow_and_resources():
+    times = import_times("from tradestation_python import TradeStation")
+
+    assert "tradestation_python._client" in times
+    for module in (
+        "http.server",
+        "webbrowser",
+        "tradestation_python._redirect_server",
+        "tradestation_python.resources.market_data",
+        "tradestation_python.types.responses.bars",
+    ):
+        assert module not in times
+
+
+def test_lazy_exports():
+    from tradestation_python.types import responses
+
+    assert tradestation_python.RetryPolicy.__name__ == "RetryPolicy"
+    assert "TradeStation" in dir(tradestation_python)
+    assert "BarsFrame" in responses.__all__
+    with pytest.raises(AttributeError):
+        tradestation_python.NotAThing  # noqa: B018
@@ -0,0 +1,119 @@
+import math
+import random
+from typing import List, Sequence
+
+import pytest
+
+from tradestation_python.lib import indicators
+from tradestation_python.lib.indicators import ATR, EMA, RSI, SMA, VWAP
+
+RNG = random.Random(7)
+N = 200
+CLOSE = [100 + math.sin(i / 5) * 3 + RNG.uniform(-1, 1) for i in range(N)]
+HIGH = [c + RNG.uniform(0, 1) for c in CLOSE]
+LOW = [c - RNG.uniform(0, 1) for c in CLOSE]
+VOLUME = [float(RNG.randint(0, 1000)) for _ in range(N)]
+
+
+def assert_series(actual: Sequence[float], expected: Sequence[float]) -> None:
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if math.isnan(e):
+            assert math.isnan(a)
+        else:
+            assert a == pytest.approx(e, rel=1e-9)
+
+
+def naive_wilder(values: List[float], period: int) -> List[float]:
+    out = [math.nan] * len(values)
+    for i in range(period - 1, len(values)):
+        if i == period - 1:
+            out[i] = sum(values[:period]) / period
+        else:
+            out[i] = (out[i - 1] * (period - 1) + values[i]) / period
+    return out
+
+
+def test_sma_matches_window_mean():
+    expected = [math.nan if i < 9 else sum(CLOSE[i - 9 : i + 1]) / 10 for i in range(N)]
+
+    assert_series(indicators.sma(CLOSE, 10), expected)
+
+
+def test_ema_is_seeded_with_the_simple_average():
+    alpha = 2 / 11
+    expected = [math.nan] * 9 + [sum(CLOSE[:10]) / 10]
+    for value in CLOSE[10:]:
+        expected.append(expected[-1] + alpha * (value - expected[-1]))
+
+    assert_series(indicators.ema(CLOSE, 10), expected)
+
+
+def test_rsi_uses_wilder_averages():
+    changes = [b - a for a, b in zip(CLOSE, CLOSE[1:])]
+    gains = naive_wilder([max(c, 0) for c in changes], 14)
+    losses = naive_wilder([max(-c, 0) for c in changes], 14)
+    expected = [math.nan] + [
+        100 - 100 / (1 + gain / loss) for gain, loss in zip(gains, losses)
+    ]
+
+    result = indicators.rsi(CLOSE)
+
+    assert_series(result, expected)
+    assert all(0 <= value <= 100 for value in result[14:])
+
+
+def test_rsi_of_rising_prices_is_100():
+    assert list(indicators.rsi([1.0, 2.0, 3.0, 4.0], period=2))[2:] == [100.0, 100.0]
+
+
+def test_atr_smooths_true_range():
+    ranges = [HIGH[0] - LOW[0]] + [
+        max(HIGH[i], CLOSE[i - 1]) - min(LOW[i], CLOSE[i - 1]) for i in range(1, N)
+    ]
+
+    assert_series(indicators.atr(HIGH, LOW, CLOSE), naive_wilder(ranges, 14))
+
+
+def test_vwap_accumulates_typical_price():
+    expected = []
+    weighted = volume = 0.0
+    for high, low, close, vol in zip(HIGH, LOW, CLOSE, VOLUME):
+        weighted += (high + low + close) / 3 * vol
+        volume += vol
+        expected.append(weighted / volume if volume else math.nan)
+
+    assert_series(indicators.vwap(HIGH, LOW, CLOSE, VOLUME), expected)
+
+
+def test_short_inputs_are_all_warm_up():
+    assert len(indicators.sma([1.0, 2.0], 5)) == 2
+    assert all(math.isnan(v) for v in indicators.ema([1.0, 2.0], 5))
+    assert len(indicators.rsi([])) == 0
+    with pytest.raises(ValueError):
+        indicators.sma(CLOSE, 0)
+
+
+def test_incremental_indicators_match_vectorized():
+    sma, ema, rsi, atr, vwap = SMA(10), EMA(10), RSI(), ATR(), VWAP()
+    results: List[List[float]] = [[], [], [], [], []]
+    for high, low, close, vol in zip(HIGH, LOW, CLOSE, VOLUME):
+        results[0].append(sma.update(close))
+        results[1].append(ema.update(close))
+        results[2].append(rsi.update(close))
+        results[3].append(atr.update(high, low, close))
+        results[4].append(vwap.update(high, low, close, vol))
+
+    assert_series(results[0], indicators.sma(CLOSE, 10))
+    assert_series(results[1], indicators.ema(CLOSE, 10))
+    assert_series(results[2], indicators.rsi(CLOSE))
+    assert_series(results[3], indicators.atr(HIGH, LOW, CLOSE))
+    assert_series(results[4], indicators.vwap(HIGH, LOW, CLOSE, VOLUME))
+
+
+def test_vwap_reset_starts_a_new_session():
+    vwap = VWAP()
+    vwap.update(10, 10, 10, 100)
+    vwap.reset()
+
+    assert vwap.update(20, 20, 20, 1) == 20
@@ -0,0 +1,179 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import httpx
+
+from tradestation_python import (
+    AsyncTradeStation,
+    Instrumentation,
+    RequestRecord,
+    RetryPolicy,
+    TradeStation,
+)
+from tradestation_python._instrumentation import Histogram, endpoint_route
+
+from .helpers import EPOCHS, make_bar
+
+BARS = json.dumps({"Bars": [make_bar(epoch) for epoch in EPOCHS[:3]]}).encode()
+
+
+def flaky_transport() -> httpx.MockTransport:
+    """Fail the first attempt of every call with a 503."""
+    calls: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) % 2:
+            return httpx.Response(503)
+        return httpx.Response(200, content=BARS)
+
+    return httpx.MockTransport(handler)
+
+
+def test_endpoint_route_collapses_symbols_and_ids():
+    assert endpoint_route("marketdata/barcharts/AAPL") == "marketdata/barcharts/{}"
+    assert (
+        endpoint_route("/brokerage/accounts/1,2/balances")
+        == "brokerage/accounts/{}/balances"
+    )
+    assert endpoint_route("marketdata/unknown/thing") == "market_data"
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert histogram.count == 4
+    assert histogram.sum == 3.65
+
+
+def test_hooks_and_metrics_cover_retried_calls():
+    requests: List[httpx.Request] = []
+    records: List[RequestRecord] = []
+    instrumentation = Instrumentation(
+        request_hooks=[requests.append], response_hooks=[records.append]
+    )
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=flaky_transport(),
+        retry_policy=RetryPolicy(retries=1, backoff_factor=0),
+        instrumentation=instrumentation,
+    )
+
+    bars = ts.market_data.bars("AAPL", barsback=3)
+
+    assert len(bars.bars) == 3
+    assert len(requests) == 2
+    assert requests[0].url.path == "/v3/marketdata/barcharts/AAPL"
+    [record] = records
+    assert (record.status, record.attempts, record.retries) == (200, 2, 1)
+
+    metrics = instrumentation.endpoints["marketdata/barcharts/{}"]
+    assert (metrics.requests, metrics.errors, metrics.retries) == (1, 0, 1)
+    # The default decoder parses and validates in one pass.
+    assert set(metrics.histograms) == {"total", "validate"}
+
+
+def test_failed_calls_are_counted_as_errors():
+    records: List[RequestRecord] = []
+    instrumentation = Instrumentation(response_hooks=[records.append])
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(lambda request: httpx.Response(404)),
+        instrumentation=instrumentation,
+    )
+
+    try:
+        ts.market_data.bars("AAPL", barsback=3)
+    except httpx.HTTPStatusError:
+        pass
+
+    assert (records[0].status, records[0].error) == (404, "HTTPStatusError")
+    assert instrumentation.endpoints["marketdata/barcharts/{}"].errors == 1
+
+
+def test_prometheus_export():
+    instrumentation = Instrumentation(buckets=(0.5,))
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=BARS)
+        ),
+        instrumentation=instrumentation,
+    )
+    ts.market_data.bars("AAPL", barsback=3)
+    ts.market_data.bars("MSFT", barsback=3)
+    instrumentation.record_auth_refresh()
+
+    text = instrumentation.prometheus()
+
+    assert "# TYPE tradestation_requests_total counter" in text
+    assert 'tradestation_requests_total{endpoint="marketdata/barcharts/{}"} 2' in text
+    assert (
+        'tradestation_request_phase_seconds_bucket{endpoint="marketdata/barcharts/{}",'
+        'phase="total",le="+Inf"} 2'
+    ) in text
+    assert "tradestation_auth_refreshes_total 1" in text
+    assert text.endswith("\n")
+
+
+def test_uninstrumented_client_records_nothing():
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=BARS)
+        ),
+    )
+
+    assert ts.instrumentation is None
+    assert len(ts.market_data.bars("AAPL", barsback=3).bars) == 3
+
+
+def test_async_client_records_network_phases():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(BARS)))
+            self.end_headers()
+            self.wfile.write(BARS)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    records: List[RequestRecord] = []
+
+    async def main() -> None:
+        async with AsyncTradeStation(
+            base_url=f"http://127.0.0.1:{server.server_address[1]}/v3",
+            auth=httpx.Auth(),
+            instrumentation=Instrumentation(response_hooks=[records.append]),
+        ) as ts:
+            await ts.market_data.bars("AAPL", barsback=3)
+            await ts.market_data.bars("AAPL", barsback=3)
+
+    try:
+        asyncio.run(main())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    first, second = records
+    assert {"connect", "ttfb", "total"} <= set(first.timings)
+    assert first.bytes_in == len(BARS)
+    # The second call reuses the pooled connection.
+    assert "connect" not in second.timings
+    assert second.timings["ttfb"] <= second.timings["total"]
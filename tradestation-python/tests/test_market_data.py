@@ -0,0 +1,170 @@
+import asyncio
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from tradestation_python import AsyncTradeStation, TradeStation
+from tradestation_python.types.enums import Unit
+from tradestation_python.types.responses import BarsFrame, BarsResponse
+
+from .helpers import EPOCHS, N_BARS, START, BarsHandler
+
+
+def test_bars_as_columns(ts: TradeStation):
+    frame = ts.market_data.bars(
+        "MSFT",
+        unit=Unit.MINUTE,
+        firstdate=START,
+        lastdate=START + timedelta(minutes=9),
+        as_columns=True,
+    )
+
+    assert isinstance(frame, BarsFrame)
+    assert list(frame.epoch) == EPOCHS[:10]
+
+
+def test_bars_range_stitches_windows(ts: TradeStation, handler: BarsHandler):
+    result = ts.market_data.bars_range(
+        "MSFT",
+        firstdate=START,
+        lastdate=START + timedelta(minutes=N_BARS - 1),
+        unit=Unit.MINUTE,
+        window_size=60,
+        max_workers=3,
+    )
+
+    assert isinstance(result, BarsResponse)
+    assert [bar.epoch for bar in result.bars] == EPOCHS
+    assert len(handler.requests) == -(-(N_BARS - 1) // 60)
+
+
+def test_iter_bars_columns_dedupes_boundaries(ts: TradeStation):
+    frames = list(
+        ts.market_data.iter_bars(
+            "MSFT",
+            firstdate=START,
+            lastdate=START + timedelta(minutes=N_BARS - 1),
+            unit=Unit.MINUTE,
+            window_size=100,
+            as_columns=True,
+        )
+    )
+
+    assert len(frames) == 5
+    assert list(BarsFrame.concat(frames).epoch) == EPOCHS
+
+
+def test_bars_range_rejects_inverted_dates(ts: TradeStation):
+    with pytest.raises(ValueError):
+        ts.market_data.bars_range(
+            "MSFT", firstdate=START, lastdate=START - timedelta(1)
+        )
+
+
+def test_async_bars_range_matches_sync(handler: BarsHandler):
+    async def main() -> BarsFrame:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=httpx.MockTransport(handler),
+        ) as ts:
+            return await ts.market_data.bars_range(
+                "MSFT",
+                firstdate=START,
+                lastdate=START + timedelta(minutes=N_BARS - 1),
+                unit=Unit.MINUTE,
+                window_size=70,
+                max_workers=3,
+                as_columns=True,
+            )
+
+    frame = asyncio.run(main())
+
+    assert list(frame.epoch) == EPOCHS
+
+
+def test_async_iter_bars_does_not_wait_for_the_slowest_of_a_batch(
+    handler: BarsHandler,
+):
+    events = []
+
+    async def uneven(request: httpx.Request) -> httpx.Response:
+        index = sum(event == "start" for event, _ in events)
+        events.append(("start", index))
+        # The second window is slow; the third should not wait for it.
+        await asyncio.sleep(0.2 if index == 1 else 0)
+        events.append(("end", index))
+        return handler(request)
+
+    async def main() -> list:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=httpx.MockTransport(uneven),
+        ) as ts:
+            async with ts.market_data.iter_bars(
+                "MSFT",
+                firstdate=START,
+                lastdate=START + timedelta(minutes=N_BARS - 1),
+                unit=Unit.MINUTE,
+                window_size=70,
+                max_workers=2,
+            ) as bars:
+                return [bar.epoch async for bar in bars]
+
+    assert asyncio.run(main()) == EPOCHS
+    assert events.index(("start", 2)) < events.index(("end", 1))
+
+
+def test_bars_many_captures_errors_per_symbol(ts: TradeStation):
+    results = ts.market_data.bars_many(
+        ["AAPL", "BAD", "MSFT"], barsback=3, max_in_flight=2, as_columns=True
+    )
+
+    assert list(results) == ["AAPL", "BAD", "MSFT"]
+    assert list(results["AAPL"].bars.epoch) == EPOCHS[:3]
+    assert results["AAPL"].error is None
+    assert results["BAD"].bars is None
+    assert isinstance(results["BAD"].error, httpx.HTTPStatusError)
+
+
+def test_async_iter_bars_many_streams_results(handler: BarsHandler):
+    symbols = [f"SYM{i}" for i in range(20)] + ["BAD"]
+
+    async def main() -> list:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=httpx.MockTransport(handler),
+        ) as ts:
+            async with ts.market_data.iter_bars_many(
+                symbols, barsback=2, max_in_flight=4
+            ) as stream:
+                return [result async for result in stream]
+
+    results = asyncio.run(main())
+
+    assert sorted(result.symbol for result in results) == sorted(symbols)
+    errors = [result.symbol for result in results if result.error is not None]
+    assert errors == ["BAD"]
+    assert len(handler.requests) == len(symbols)
+
+
+def test_async_iter_bars_many_cancels_on_early_exit(handler: BarsHandler):
+    symbols = [f"SYM{i}" for i in range(20)]
+
+    async def main() -> str:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=httpx.MockTransport(handler),
+        ) as ts:
+            async with ts.market_data.iter_bars_many(
+                symbols, barsback=2, max_in_flight=1
+            ) as stream:
+                result = await stream.receive()
+            return result.symbol
+
+    assert asyncio.run(main()) in symbols
+    assert len(handler.requests) < len(symbols)
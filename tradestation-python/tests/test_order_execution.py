@@ -0,0 +1,334 @@
+import asyncio
+import json
+import time
+from decimal import Decimal
+from typing import List
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from tradestation_python import AsyncTradeStation, TradeStation
+from tradestation_python.resources.order_execution import OrderTemplate, WarmupStats
+from tradestation_python.types.enums import (
+    Duration,
+    OrderGroupType,
+    OrderType,
+    TradeAction,
+)
+from tradestation_python.types.requests import (
+    OrderGroupRequest,
+    OrderRequest,
+    TimeInForce,
+)
+
+LIMIT_BUY = OrderRequest(
+    account_id="11111111",
+    symbol="MSFT",
+    quantity=10,
+    order_type=OrderType.LIMIT,
+    trade_action=TradeAction.BUY,
+    limit_price=Decimal("101.25"),
+)
+BRACKET = OrderGroupRequest(
+    type=OrderGroupType.BRACKET,
+    orders=[
+        OrderRequest(
+            account_id="11111111",
+            symbol="MSFT",
+            quantity=10,
+            order_type=OrderType.LIMIT,
+            trade_action=TradeAction.SELL,
+            limit_price=110,
+        ),
+        OrderRequest(
+            account_id="11111111",
+            symbol="MSFT",
+            quantity=10,
+            order_type=OrderType.STOP_MARKET,
+            trade_action=TradeAction.SELL,
+            stop_price=95,
+        ),
+    ],
+)
+
+
+class OrderHandler:
+    """Answer order endpoints like the API and record every request."""
+
+    def __init__(self) -> None:
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/v3/")
+        if path == "orderexecution/routes":
+            return httpx.Response(
+                200, json={"Routes": [{"Id": "AUTO", "Name": "Intelligent"}]}
+            )
+        if path in ("orderexecution/orders", "orderexecution/ordergroups"):
+            body = json.loads(request.content)
+            legs = body.get("Orders", [body])
+            orders = [
+                {"OrderID": str(100 + i), "Message": "Sent order"}
+                for i in range(len(legs))
+            ]
+            return httpx.Response(200, json={"Orders": orders})
+        if path.endswith("confirm"):
+            return httpx.Response(
+                200,
+                json={
+                    "Confirmations": [
+                        {"OrderConfirmID": "abc", "EstimatedCost": 1012.5}
+                    ]
+                },
+            )
+        order_id = path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"OrderID": order_id, "Message": "OK"})
+
+    def body(self, index: int = -1) -> dict:
+        return json.loads(self.requests[index].content)
+
+
+@pytest.fixture
+def orders() -> OrderHandler:
+    return OrderHandler()
+
+
+@pytest.fixture
+def ts(orders: OrderHandler) -> TradeStation:
+    return TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(orders),
+    )
+
+
+def test_order_request_serializes_like_the_api():
+    assert LIMIT_BUY.to_payload() == {
+        "AccountID": "11111111",
+        "Symbol": "MSFT",
+        "Quantity": "10",
+        "OrderType": "Limit",
+        "TradeAction": "BUY",
+        "TimeInForce": {"Duration": "DAY"},
+        "LimitPrice": "101.25",
+    }
+    assert json.loads(LIMIT_BUY.to_json()) == LIMIT_BUY.to_payload()
+
+
+def test_order_request_checks_prices():
+    with pytest.raises(ValidationError, match="limit_price"):
+        OrderRequest(
+            account_id="1",
+            symbol="MSFT",
+            quantity=1,
+            order_type=OrderType.LIMIT,
+            trade_action=TradeAction.BUY,
+        )
+    with pytest.raises(ValidationError):
+        OrderRequest.model_validate({**LIMIT_BUY.to_payload(), "Quantity": "0"})
+
+
+def test_template_patches_quantity_and_price():
+    template = OrderTemplate(LIMIT_BUY)
+
+    assert json.loads(template.body) == LIMIT_BUY.to_payload()
+    assert json.loads(template.render(quantity=5, limit_price=99.5)) == {
+        **LIMIT_BUY.to_payload(),
+        "Quantity": "5",
+        "LimitPrice": "99.5",
+    }
+    assert json.loads(template.render(limit_price=Decimal("1E+2")))["LimitPrice"] == (
+        "100"
+    )
+
+
+def test_template_rejects_bad_values():
+    template = OrderTemplate(LIMIT_BUY)
+
+    with pytest.raises(ValueError):
+        template.render(quantity=0)
+    with pytest.raises(ValueError):
+        template.render(quantity=1.5)
+    with pytest.raises(ValueError):
+        template.render(limit_price=float("nan"))
+    with pytest.raises(ValueError, match="stop_price"):
+        template.render(stop_price=90)
+
+
+def test_group_template_patches_each_leg():
+    template = OrderTemplate(BRACKET)
+
+    body = json.loads(template.render(quantity=3, limit_price=112, stop_price=94.5))
+
+    target, stop = body["Orders"]
+    assert body["Type"] == "BRK"
+    assert (target["Quantity"], target["LimitPrice"]) == ("3", "112")
+    assert (stop["Quantity"], stop["StopPrice"]) == ("3", "94.5")
+    per_leg = json.loads(template.render(quantity=[None, 7]))
+    assert [leg["Quantity"] for leg in per_leg["Orders"]] == ["10", "7"]
+
+
+def test_place_sends_model_or_rendered_body(ts: TradeStation, orders: OrderHandler):
+    template = OrderTemplate(LIMIT_BUY)
+
+    placed = ts.order_execution.place(LIMIT_BUY)
+    ts.order_execution.place(template.render(limit_price=100))
+
+    assert placed.orders[0].order_id == "100"
+    assert orders.body(0) == LIMIT_BUY.to_payload()
+    assert orders.body(1)["LimitPrice"] == "100"
+    assert orders.requests[1].headers["Content-Type"] == "application/json"
+
+
+def test_confirm_and_groups(ts: TradeStation, orders: OrderHandler):
+    confirmation = ts.order_execution.confirm(LIMIT_BUY)
+    group = ts.order_execution.place_group(BRACKET)
+    ts.order_execution.confirm_group(OrderTemplate(BRACKET).body)
+
+    assert confirmation.confirmations[0].estimated_cost == 1012.5
+    assert [order.order_id for order in group.orders] == ["100", "101"]
+    assert [r.url.path for r in orders.requests] == [
+        "/v3/orderexecution/orderconfirm",
+        "/v3/orderexecution/ordergroups",
+        "/v3/orderexecution/ordergroupconfirm",
+    ]
+
+
+def test_replace_and_cancel(ts: TradeStation, orders: OrderHandler):
+    replaced = ts.order_execution.replace(
+        "123", limit_price=102.5, order_type=OrderType.LIMIT
+    )
+    cancelled = ts.order_execution.cancel("123")
+
+    assert replaced.order_id == cancelled.order_id == "123"
+    assert orders.requests[0].method == "PUT"
+    assert orders.body(0) == {"LimitPrice": "102.5", "OrderType": "Limit"}
+    assert orders.requests[1].method == "DELETE"
+    with pytest.raises(ValueError):
+        ts.order_execution.replace("123")
+
+
+def test_rejected_placement_is_not_retried():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(503)
+
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(handler),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ts.order_execution.place(LIMIT_BUY)
+    assert len(attempts) == 1
+
+
+def test_keep_warm_repeats_routes_requests(ts: TradeStation, orders: OrderHandler):
+    with ts.order_execution.keep_warm(interval=0.01) as stats:
+        assert len(orders.requests) == 1
+        deadline = time.monotonic() + 2
+        while stats.requests < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert stats.requests >= 3
+    assert stats.failures == 0
+    assert {r.url.path for r in orders.requests} == {"/v3/orderexecution/routes"}
+
+
+class ExpiringAuth(httpx.Auth):
+    """Authorize the first request, then fail like an unrefreshable token."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def auth_flow(self, request: httpx.Request):
+        self.calls += 1
+        if self.calls > 1:
+            raise ValueError("Token refresh failed")
+        yield request
+
+
+def test_keep_warm_counts_auth_failures(orders: OrderHandler):
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=ExpiringAuth(),
+        transport=httpx.MockTransport(orders),
+    )
+
+    with ts.order_execution.keep_warm(interval=0.01) as stats:
+        deadline = time.monotonic() + 2
+        while stats.failures < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert stats.failures >= 2
+    assert isinstance(stats.last_error, ValueError)
+
+
+def test_async_keep_warm_keeps_auth_failures_out_of_the_block(
+    orders: OrderHandler,
+):
+    ts = AsyncTradeStation(
+        base_url="https://api.test/v3",
+        auth=ExpiringAuth(),
+        transport=httpx.MockTransport(orders),
+    )
+
+    async def run() -> WarmupStats:
+        async with ts.order_execution.keep_warm(interval=0.01) as stats:
+            while stats.failures < 2:
+                await asyncio.sleep(0.01)
+        return stats
+
+    stats = asyncio.run(run())
+
+    assert isinstance(stats.last_error, ValueError)
+
+
+def test_warm_interval_follows_keepalive_expiry(orders: OrderHandler):
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(orders),
+        limits=httpx.Limits(keepalive_expiry=8),
+    )
+
+    with ts.order_execution.keep_warm() as stats:
+        pass
+
+    assert stats.interval == 4
+
+
+def test_async_order_execution(orders: OrderHandler):
+    ts = AsyncTradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(orders),
+    )
+    template = OrderTemplate(
+        LIMIT_BUY.model_copy(
+            update={"time_in_force": TimeInForce(Duration=Duration.GOOD_TILL_CANCELED)}
+        )
+    )
+
+    async def run() -> None:
+        async with ts.order_execution.keep_warm(interval=0.01) as stats:
+            placed = await ts.order_execution.place(template.render(quantity=2))
+            await ts.order_execution.confirm(LIMIT_BUY)
+            await ts.order_execution.place_group(BRACKET)
+            await ts.order_execution.replace("100", quantity=3)
+            await ts.order_execution.cancel("100")
+            while stats.requests < 2:
+                await asyncio.sleep(0.01)
+        assert placed.orders[0].order_id == "100"
+
+    asyncio.run(run())
+
+    placed_body = json.loads(orders.requests[1].content)
+    assert placed_body["Quantity"] == "2"
+    assert placed_body["TimeInForce"] == {"Duration": "GTC"}
+    assert orders.requests[-1].url.path == "/v3/orderexecution/routes"
@@ -0,0 +1,240 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable, List, Union
+
+import anyio
+import httpx
+import pytest
+
+from tradestation_python import AsyncTradeStation, RetryPolicy
+from tradestation_python.resources.market_data import QuoteStreamManager
+
+
+class QuoteServer:
+    """Send `per_symbol` quotes for every requested symbol, then idle."""
+
+    def __init__(self, per_symbol: int = 1, status: int = 200) -> None:
+        self.per_symbol = per_symbol
+        self.status = status
+        self.connections: List[List[str]] = []
+        # Messages sent ahead of the quotes; strings are sent as raw lines.
+        self.extra: List[Union[dict, str]] = []
+        self.trade_time = datetime.now(timezone.utc)
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        symbols = request.url.path.rsplit("/", 1)[1].split(",")
+        self.connections.append(symbols)
+        if self.status != 200:
+            return httpx.Response(self.status, json={"Error": "Failed"})
+
+        async def body() -> AsyncIterator[bytes]:
+            for message in self.extra:
+                line = message if isinstance(message, str) else json.dumps(message)
+                yield (line + "\n").encode()
+            for i in range(self.per_symbol):
+                for symbol in symbols:
+                    quote = {
+                        "Symbol": symbol,
+                        "Last": str(i),
+                        "TradeTime": self.trade_time.isoformat(),
+                    }
+                    yield (json.dumps(quote) + "\n").encode()
+            await anyio.sleep_forever()
+
+        return httpx.Response(200, content=body())
+
+
+def run(
+    server: QuoteServer,
+    test: Callable[[QuoteStreamManager], Awaitable[None]],
+    **kwargs: int,
+) -> None:
+    async def main() -> None:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=httpx.MockTransport(server),
+            retry_policy=RetryPolicy(retries=0),
+        ) as ts:
+            async with ts.market_data.quote_streams(**kwargs) as manager:
+                with anyio.fail_after(5):
+                    await test(manager)
+
+    asyncio.run(main())
+
+
+async def settle() -> None:
+    await anyio.sleep(0.02)
+
+
+def test_symbols_are_packed_into_fewest_streams():
+    server = QuoteServer()
+
+    async def test(manager: QuoteStreamManager) -> None:
+        manager.subscribe([f"S{i:03}" for i in range(250)])
+        await settle()
+        assert [len(stream.symbols) for stream in manager.streams] == [100, 100, 50]
+
+    run(server, test)
+
+    assert sorted(len(symbols) for symbols in server.connections) == [50, 100, 100]
+
+
+def test_quotes_fan_out_to_every_subscriber_of_a_symbol():
+    server = QuoteServer()
+
+    async def test(manager: QuoteStreamManager) -> None:
+        both = manager.subscribe(["AAPL", "MSFT"])
+        msft = manager.subscribe(["MSFT"])
+
+        received = {(await both.__anext__()).symbol for _ in range(2)}
+        assert received == {"AAPL", "MSFT"}
+        assert (await msft.__anext__()).symbol == "MSFT"
+        await settle()
+        assert len(msft) == 0
+
+    run(server, test)
+
+    assert server.connections == [["AAPL", "MSFT"]]
+
+
+def test_slow_subscribers_drop_oldest_quotes():
+    server = QuoteServer(per_symbol=5)
+
+    async def test(manager: QuoteStreamManager) -> None:
+        subscription = manager.subscribe(["AAPL"], maxsize=2)
+        await settle()
+
+        assert [(await subscription.__anext__()).last for _ in range(2)] == [3, 4]
+        assert subscription.dropped == 3
+        assert manager.stats()[0].dropped == 3
+        assert manager.stats()[0].messages == 5
+
+    run(server, test)
+
+
+def test_subscription_changes_only_reconnect_affected_streams():
+    server = QuoteServer()
+
+    async def test(manager: QuoteStreamManager) -> None:
+        manager.subscribe(["A", "B", "C"])
+        d = manager.subscribe(["D"])
+        await settle()
+        e = manager.subscribe(["E"])
+        await settle()
+        manager.unsubscribe(d)
+        await settle()
+        assert d.closed
+        manager.unsubscribe(e)
+        await settle()
+
+        assert len(manager.streams) == 1
+        assert manager.symbols == ["A", "B", "C"]
+
+    run(server, test, symbols_per_stream=3)
+
+    assert server.connections == [["A", "B", "C"], ["D"], ["D", "E"], ["E"]]
+
+
+def test_stream_stats_report_trade_age():
+    server = QuoteServer()
+    server.trade_time -= timedelta(seconds=2)
+
+    async def test(manager: QuoteStreamManager) -> None:
+        subscription = manager.subscribe(["AAPL"])
+        await subscription.__anext__()
+
+        stats = manager.stats()[0]
+        assert stats.trade_age == pytest.approx(2, abs=0.5)
+        assert stats.idle is not None
+
+    run(server, test)
+
+
+def test_symbol_errors_do_not_stop_the_stream():
+    server = QuoteServer()
+    server.extra = [{"Symbol": "BAD", "Error": "Failed", "Message": "Unknown symbol"}]
+
+    async def test(manager: QuoteStreamManager) -> None:
+        subscription = manager.subscribe(["AAPL", "BAD"])
+        quote = await subscription.__anext__()
+
+        assert quote.symbol == "AAPL"
+        assert manager.stats()[0].errors == {"BAD": "Failed: Unknown symbol"}
+
+    run(server, test)
+
+
+def test_malformed_messages_are_skipped():
+    server = QuoteServer()
+    server.extra = ["{not json", {"Symbol": "A", "Last": "not a number"}]
+
+    async def test(manager: QuoteStreamManager) -> None:
+        a = manager.subscribe(["A"])
+        b = manager.subscribe(["B"])
+
+        assert (await a.__anext__()).symbol == "A"
+        assert (await b.__anext__()).symbol == "B"
+        first, second = manager.stats()
+        assert (first.malformed, second.malformed) == (2, 2)
+        assert first.errors["A"].startswith("Malformed quote")
+
+    run(server, test, symbols_per_stream=1)
+
+
+def test_unexpected_errors_only_drop_their_stream():
+    server = QuoteServer(per_symbol=2)
+
+    async def test(manager: QuoteStreamManager) -> None:
+        a = manager.subscribe(["A"])
+        b = manager.subscribe(["B"])
+
+        def fail(session: object, line: str) -> None:
+            raise RuntimeError("boom")
+
+        manager.streams[1]._handle = fail  # type: ignore[method-assign]
+
+        with pytest.raises(RuntimeError):
+            await b.__anext__()
+        assert [(await a.__anext__()).last for _ in range(2)] == [0, 1]
+        assert manager.symbols == ["A"]
+
+    run(server, test, symbols_per_stream=1)
+
+
+def test_unrecoverable_stream_closes_its_subscriptions():
+    server = QuoteServer(status=404)
+
+    async def test(manager: QuoteStreamManager) -> None:
+        subscription = manager.subscribe(["AAPL"])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            async for _ in subscription:
+                pass
+
+        assert manager.streams == []
+        assert manager.symbols == []
+        manager.subscribe(["AAPL"])
+        assert len(manager.streams) == 1
+
+    run(server, test)
+
+
+def test_failed_stream_releases_symbols_shared_with_other_streams():
+    server = QuoteServer()
+
+    async def test(manager: QuoteStreamManager) -> None:
+        manager.subscribe(["A"])
+        both = manager.subscribe(["B", "C"])
+        await settle()
+        first, second = manager.streams
+
+        manager._fail(second, RuntimeError("gone"))
+
+        assert both.closed
+        assert manager.streams == [first]
+        assert manager.symbols == ["A"]
+        assert first.symbols == ["A"]
+
+    run(server, test, symbols_per_stream=2)
@@ -0,0 +1,94 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from tradestation_python import AsyncTradeStation, RateLimiter, TradeStation
+from tradestation_python._rate_limit import TokenBucket, endpoint_group
+
+
+def ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"Accounts": [], "Bars": []})
+
+
+@pytest.mark.parametrize(
+    "endpoint, group",
+    [
+        ("marketdata/barcharts/MSFT", "bars"),
+        ("/marketdata/stream/barcharts/MSFT", "streams"),
+        ("marketdata/quotes/MSFT", "market_data"),
+        ("brokerage/accounts", "brokerage"),
+        ("orderexecution/orders", "order_execution"),
+        ("unknown", "default"),
+    ],
+)
+def test_endpoint_group(endpoint: str, group: str):
+    assert endpoint_group(endpoint) == group
+
+
+def test_token_bucket_is_thread_safe():
+    bucket = TokenBucket(capacity=10, period=60)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        waits = list(executor.map(lambda _: bucket.reserve(), range(50)))
+
+    assert sum(wait == 0 for wait in waits) == 10
+    # Each reservation beyond the burst queues one refill interval further out.
+    assert max(waits) == pytest.approx(40 * 6, rel=0.01)
+
+
+def test_rate_limiting_is_opt_in(monkeypatch: pytest.MonkeyPatch):
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(ok),
+    )
+    assert ts.rate_limiter is None
+
+    monkeypatch.setenv("TS_API_RATE_LIMITS", '{"bars": [500, 300]}')
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(ok),
+    )
+    assert ts.rate_limiter is not None
+    assert ts.rate_limiter.buckets["bars"].capacity == 500
+
+
+def test_sync_client_waits_for_budget():
+    limiter = RateLimiter({"bars": (2, 0.2)})
+    ts = TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(ok),
+        rate_limiter=limiter,
+    )
+
+    for _ in range(4):
+        ts.market_data.bars("MSFT")
+    ts.brokerage.accounts()
+
+    stats = limiter.stats["bars"]
+    assert stats.requests == 4
+    assert stats.waits == 2
+    assert stats.wait_time == pytest.approx(0.2, abs=0.05)
+    assert "brokerage" not in limiter.stats
+
+
+def test_async_client_shares_limiter():
+    limiter = RateLimiter({"brokerage": (3, 0.3)})
+
+    async def main() -> None:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=httpx.MockTransport(ok),
+            rate_limiter=limiter,
+        ) as ts:
+            await asyncio.gather(*(ts.brokerage.accounts() for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert limiter.stats["brokerage"].waits == 3
+    assert limiter.stats["brokerage"].max_wait == pytest.approx(0.3, abs=0.05)
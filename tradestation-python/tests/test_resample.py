@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from tradestation_python.lib import resample
+from tradestation_python.types.enums import SessionTemplate, Unit
+from tradestation_python.types.responses import BarsFrame
+
+from .helpers import make_bar
+
+ET = ZoneInfo("America/New_York")
+
+
+def minute_bars(start: datetime, count: int) -> List[dict]:
+    """`count` 1-minute bars, the first ending one minute after `start` (ET)."""
+    bars = []
+    for i in range(count):
+        end = (start + timedelta(minutes=i + 1)).astimezone(timezone.utc)
+        bar = make_bar(int(end.timestamp() * 1000))
+        price = 100.0 + i
+        bar.update(
+            Open=price,
+            High=price + 2,
+            Low=price - 1,
+            Close=price + 0.5,
+            TotalVolume=10,
+            UpVolume=6,
+            DownVolume=3,
+            UnchangedVolume=1,
+            TotalTicks=4,
+            UpTicks=2,
+            DownTicks=1,
+            UnchangedTicks=1,
+        )
+        bars.append(bar)
+    return bars
+
+
+def frame(*bars: List[dict]) -> BarsFrame:
+    return BarsFrame.from_payload({"Bars": [bar for day in bars for bar in day]})
+
+
+def et(epoch: int) -> datetime:
+    return datetime.fromtimestamp(epoch / 1000, tz=ET).replace(tzinfo=None)
+
+
+# A full extended-hours winter day: 04:00-20:00 ET.
+WINTER = minute_bars(datetime(2024, 1, 2, 4, 0, tzinfo=ET), 16 * 60)
+# Regular hours of a summer (daylight saving) day.
+SUMMER = minute_bars(datetime(2024, 7, 1, 9, 30, tzinfo=ET), 390)
+
+
+def test_five_minute_bars_aggregate_ohlc_and_volumes():
+    bars = resample(frame(WINTER), 5)
+
+    assert len(bars) == 78
+    assert et(bars.epoch[0]) == datetime(2024, 1, 2, 9, 35)
+    assert et(bars.epoch[-1]) == datetime(2024, 1, 2, 16, 0)
+    # 09:30 is 330 minutes after 04:00.
+    assert (bars.open[0], bars.high[0], bars.low[0], bars.close[0]) == (
+        430.0,
+        436.0,
+        429.0,
+        434.5,
+    )
+    assert (bars.total_volume[0], bars.up_volume[0], bars.down_ticks[0]) == (50, 30, 5)
+    assert bars.bar_status == ["Closed"] * 78
+
+
+def test_hourly_bars_align_to_the_open_and_stop_at_the_close():
+    bars = resample(frame(SUMMER), 60)
+
+    assert [et(epoch).time().isoformat("minutes") for epoch in bars.epoch] == [
+        "10:30",
+        "11:30",
+        "12:30",
+        "13:30",
+        "14:30",
+        "15:30",
+        "16:00",
+    ]
+    assert bars.total_volume[-1] == 300
+
+
+def test_session_template_keeps_extended_hours():
+    bars = resample(
+        frame(WINTER), 60, sessiontemplate=SessionTemplate.USEQ_PRE_AND_POST
+    )
+
+    assert len(bars) == 16
+    assert et(bars.epoch[0]) == datetime(2024, 1, 2, 5, 0)
+    assert sum(bars.total_volume) == 16 * 60 * 10
+
+
+def test_daily_bars_are_one_per_session():
+    bars = resample(frame(WINTER, SUMMER), 1, Unit.DAILY)
+
+    assert len(bars) == 2
+    assert [et(epoch) for epoch in bars.epoch] == [
+        datetime(2024, 1, 2, 16, 0),
+        datetime(2024, 7, 1, 16, 0),
+    ]
+    assert bars.total_volume[0] == bars.total_volume[1] == 3900
+    assert bars.open[1] == 100.0
+    assert bars.close[1] == 489.5
+
+
+def test_weekly_and_monthly_bars_group_sessions():
+    later = minute_bars(datetime(2024, 7, 5, 9, 30, tzinfo=ET), 390)
+    next_week = minute_bars(datetime(2024, 7, 8, 9, 30, tzinfo=ET), 390)
+    source = frame(SUMMER, later, next_week)
+
+    assert len(resample(source, 1, Unit.WEEKLY)) == 2
+    assert len(resample(source, 1, Unit.MONTHLY)) == 1
+
+
+def test_trailing_partial_bucket_is_open():
+    bars = resample(frame(SUMMER[:33]), 15)
+
+    assert bars.bar_status == ["Closed", "Closed", "Open"]
+    assert bars.total_volume[-1] == 30
+
+
+def test_empty_and_invalid_input():
+    assert len(resample(BarsFrame(), 5)) == 0
+    with pytest.raises(ValueError):
+        resample(BarsFrame(), 0)
@@ -0,0 +1,96 @@
+import asyncio
+from email.utils import formatdate
+from time import time
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from tradestation_python import AsyncTradeStation, RetryPolicy, TradeStation
+from tradestation_python._retry import parse_retry_after
+from tradestation_python.types.responses import AccountsResponse
+
+
+def scripted(outcomes: List) -> httpx.MockTransport:
+    """Transport replaying status codes (or exceptions) in order."""
+    remaining: Iterator = iter(outcomes)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = next(remaining)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, httpx.Response):
+            return outcome
+        return httpx.Response(outcome, json={"Accounts": []})
+
+    return httpx.MockTransport(handler)
+
+
+def make_client(outcomes: List, **policy: float) -> TradeStation:
+    return TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=scripted(outcomes),
+        retry_policy=RetryPolicy(backoff_factor=0, **policy),
+    )
+
+
+def test_get_retries_transient_statuses():
+    ts = make_client([503, 502, 200])
+
+    assert isinstance(ts.brokerage.accounts(), AccountsResponse)
+    assert ts.retry_stats.attempts == 3
+    assert ts.retry_stats.reasons == {"503": 1, "502": 1}
+
+
+def test_gives_up_after_retries():
+    ts = make_client([500, 500, 500], retries=2)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ts.brokerage.accounts()
+    assert ts.retry_stats.retries == 2
+
+
+def test_post_is_not_retried_unless_idempotent():
+    ts = make_client([503, 503, 200])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ts._request("POST", "orderexecution/orders")
+    assert ts._request("POST", "orderexecution/orders", idempotent=True)
+    assert ts.retry_stats.retries == 1
+
+
+def test_post_retries_unsent_requests():
+    ts = make_client([httpx.ConnectError("refused"), 429, 200])
+
+    assert ts._request("POST", "orderexecution/orders").status_code == 200
+    assert ts.retry_stats.reasons == {"ConnectError": 1, "429": 1}
+
+
+def test_retry_after_beyond_deadline_gives_up():
+    ts = make_client([httpx.Response(429, headers={"Retry-After": "30"})], deadline=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ts.brokerage.accounts()
+    assert ts.retry_stats.retries == 0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 8 <= parse_retry_after(formatdate(time() + 10, usegmt=True)) <= 10
+
+
+def test_async_client_retries():
+    async def main() -> int:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=scripted([httpx.ReadError("reset"), 504, 200]),
+            retry_policy=RetryPolicy(backoff_factor=0),
+        ) as ts:
+            await ts.brokerage.accounts()
+            return ts.retry_stats.retries
+
+    assert asyncio.run(main()) == 2
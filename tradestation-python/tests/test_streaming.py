@@ -0,0 +1,233 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Union
+
+import httpx
+import pytest
+
+from tradestation_python import (
+    AsyncTradeStation,
+    RetryPolicy,
+    StreamError,
+    TradeStation,
+)
+from tradestation_python.types.enums import Unit
+from tradestation_python.types.responses import Bar, Heartbeat, StreamStatus
+
+from .helpers import EPOCHS, make_bar
+
+HEARTBEAT = {"Heartbeat": 1, "Timestamp": "2024-01-02T14:30:00Z"}
+GO_AWAY = {"StreamStatus": "GoAway"}
+
+Item = Union[dict, str, Exception]
+
+
+def encode(item: Item) -> bytes:
+    if isinstance(item, str):
+        return (item + "\n").encode()
+    return (json.dumps(item) + "\n").encode()
+
+
+class StreamHandler:
+    """Serve one scripted body per connection; exceptions cut the stream."""
+
+    def __init__(self, *connections: Union[int, List[Item]]) -> None:
+        self.connections = list(connections)
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        connection = self.connections.pop(0)
+        if isinstance(connection, int):
+            return httpx.Response(connection, json={"Error": "NotFound"})
+
+        def body() -> Iterator[bytes]:
+            for item in connection:
+                if isinstance(item, Exception):
+                    raise item
+                yield encode(item)
+
+        async def abody() -> AsyncIterator[bytes]:
+            for chunk in body():
+                yield chunk
+
+        return httpx.Response(200, content=abody() if self.is_async else body())
+
+    is_async = False
+
+
+def client(handler: StreamHandler, retries: int = 3) -> TradeStation:
+    return TradeStation(
+        base_url="https://api.test/v3",
+        auth=httpx.Auth(),
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(retries=retries, backoff_factor=0),
+    )
+
+
+def epochs(messages: List[Bar]) -> List[tuple]:
+    return [(bar.epoch, bar.bar_status) for bar in messages]
+
+
+def test_stream_bars_skips_heartbeats_by_default():
+    handler = StreamHandler(
+        [make_bar(EPOCHS[0]), HEARTBEAT, "", make_bar(EPOCHS[1], "Open")]
+    )
+    ts = client(handler)
+
+    bars = list(islice(ts.market_data.stream_bars("MSFT", barsback=2), 2))
+
+    assert epochs(bars) == [(EPOCHS[0], "Closed"), (EPOCHS[1], "Open")]
+    request = handler.requests[0]
+    assert request.url.path == "/v3/marketdata/stream/barcharts/MSFT"
+    assert request.url.params["barsback"] == "2"
+
+
+def test_stream_bars_can_include_status_messages():
+    handler = StreamHandler([HEARTBEAT, {"StreamStatus": "EndSnapshot"}])
+    ts = client(handler)
+
+    messages = list(islice(ts.market_data.stream_bars("MSFT", include_status=True), 2))
+
+    assert isinstance(messages[0], Heartbeat)
+    assert isinstance(messages[1], StreamStatus)
+    assert messages[1].stream_status == "EndSnapshot"
+
+
+def test_stream_bars_resumes_after_disconnect():
+    handler = StreamHandler(
+        [make_bar(EPOCHS[0]), make_bar(EPOCHS[1], "Open"), httpx.ReadError("reset")],
+        [
+            make_bar(EPOCHS[0]),
+            make_bar(EPOCHS[1]),
+            make_bar(EPOCHS[2], "Open"),
+        ],
+    )
+    ts = client(handler)
+
+    bars = list(islice(ts.market_data.stream_bars("MSFT"), 4))
+
+    assert epochs(bars) == [
+        (EPOCHS[0], "Closed"),
+        (EPOCHS[1], "Open"),
+        (EPOCHS[1], "Closed"),
+        (EPOCHS[2], "Open"),
+    ]
+    assert len(handler.requests) == 2
+    assert "barsback" not in handler.requests[0].url.params
+    assert int(handler.requests[1].url.params["barsback"]) > 2
+
+
+def test_stream_bars_reconnects_on_go_away():
+    handler = StreamHandler(
+        [make_bar(EPOCHS[0]), GO_AWAY, make_bar(EPOCHS[1])],
+        [make_bar(EPOCHS[0]), make_bar(EPOCHS[1])],
+    )
+    ts = client(handler, retries=0)
+
+    bars = list(islice(ts.market_data.stream_bars("MSFT"), 2))
+
+    assert epochs(bars) == [(EPOCHS[0], "Closed"), (EPOCHS[1], "Closed")]
+    assert len(handler.requests) == 2
+
+
+def test_stream_bars_gives_up_after_consecutive_failures():
+    handler = StreamHandler(
+        [httpx.ReadError("reset")],
+        [make_bar(EPOCHS[0]), httpx.ReadError("reset")],
+        [httpx.ReadError("reset")],
+    )
+    ts = client(handler, retries=1)
+
+    stream = ts.market_data.stream_bars("MSFT")
+    assert next(stream).epoch == EPOCHS[0]
+    with pytest.raises(httpx.ReadError):
+        next(stream)
+    # The bar on the second connection reset the failure count.
+    assert len(handler.requests) == 3
+
+
+def test_stream_bars_does_not_retry_client_errors():
+    handler = StreamHandler(404)
+    ts = client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        next(ts.market_data.stream_bars("BAD"))
+    assert len(handler.requests) == 1
+
+
+def test_stream_bars_raises_in_band_errors():
+    handler = StreamHandler([{"Error": "Failed", "Message": "Symbol not found"}])
+    ts = client(handler)
+
+    with pytest.raises(StreamError, match="Symbol not found"):
+        next(ts.market_data.stream_bars("BAD"))
+
+
+def test_async_stream_bars_resumes_after_disconnect():
+    handler = StreamHandler(
+        [make_bar(EPOCHS[0]), httpx.ReadError("reset")],
+        [make_bar(EPOCHS[0]), HEARTBEAT, make_bar(EPOCHS[1])],
+    )
+    handler.is_async = True
+
+    async def main() -> List[Bar]:
+        async with AsyncTradeStation(
+            base_url="https://api.test/v3",
+            auth=httpx.Auth(),
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(backoff_factor=0),
+        ) as ts:
+            bars = []
+            async for bar in ts.market_data.stream_bars("MSFT", unit=Unit.MINUTE):
+                bars.append(bar)
+                if len(bars) == 2:
+                    break
+            return bars
+
+    bars = asyncio.run(main())
+
+    assert epochs(bars) == [(EPOCHS[0], "Closed"), (EPOCHS[1], "Closed")]
+    assert len(handler.requests) == 2
+
+
+def test_stream_bars_consumes_chunks_as_they_arrive():
+    """Each bar is yielded before the server sends the next one."""
+    delivered = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for epoch in EPOCHS[:2]:
+                chunk = encode(make_bar(epoch))
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.flush()
+                delivered.wait(timeout=5)
+            self.wfile.write(b"0\r\n\r\n")
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        ts = TradeStation(
+            base_url=f"http://127.0.0.1:{server.server_address[1]}/v3",
+            auth=httpx.Auth(),
+        )
+        stream = ts.market_data.stream_bars("MSFT")
+        assert next(stream).epoch == EPOCHS[0]
+        delivered.set()
+        assert next(stream).epoch == EPOCHS[1]
+        stream.close()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,108 @@
+import asyncio
+from itertools import islice
+
+import httpx
+import pytest
+
+from tradestation_python import RetryPolicy
+from tradestation_python._discovery import clear_openid_cache
+from tradestation_python.testing import MockTradeStation
+from tradestation_python.types.enums import OrderType, TradeAction, Unit
+from tradestation_python.types.requests import OrderRequest
+
+ACCOUNTS = [f"{11000000 + i}" for i in range(30)]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_openid_cache()
+    yield
+    clear_openid_cache()
+
+
+def test_client_authenticates_against_the_mock_issuer():
+    mock = MockTradeStation()
+    ts = mock.client()
+
+    ts.market_data.bars("MSFT", barsback=10)
+    ts.market_data.bars("MSFT", barsback=10)
+
+    assert mock.tokens_issued == 1
+    assert ts.tradestation_auth._token_info.access_token == "mock-access-token-1"
+
+
+def test_bars_follow_barsback_and_date_ranges():
+    ts = MockTradeStation().client()
+
+    recent = ts.market_data.bars("MSFT", unit=Unit.MINUTE, barsback=1000)
+    ranged = ts.market_data.bars_range(
+        "MSFT",
+        unit=Unit.MINUTE,
+        firstdate=recent.bars[0].timestamp,
+        lastdate=recent.bars[-1].timestamp,
+        as_columns=True,
+    )
+
+    assert len(recent.bars) == 1000
+    assert list(ranged.epoch) == [bar.epoch for bar in recent.bars]
+
+
+def test_brokerage_and_orders():
+    mock = MockTradeStation(positions_per_account=3, orders_per_account=4)
+    ts = mock.client()
+    order = OrderRequest(
+        account_id=ACCOUNTS[0],
+        symbol="MSFT",
+        quantity=10,
+        order_type=OrderType.MARKET,
+        trade_action=TradeAction.BUY,
+    )
+
+    assert len(ts.brokerage.balances(ACCOUNTS).balances) == 30
+    assert len(ts.brokerage.positions(ACCOUNTS).positions) == 90
+    assert len(ts.brokerage.orders(ACCOUNTS[:2], page_size=3).orders) == 8
+    placed = ts.order_execution.place(order)
+    assert placed.orders[0].message == "Sent order: BUY 10 MSFT"
+    assert ts.order_execution.cancel(placed.orders[0].order_id).order_id == "1000"
+
+
+def test_injected_rate_limits_are_retried():
+    mock = MockTradeStation(rate_limit_every=3)
+    ts = mock.client(retry_policy=RetryPolicy(retries=2, backoff_factor=0))
+
+    for _ in range(4):
+        ts.brokerage.balances(ACCOUNTS[:1])
+
+    assert mock.rate_limited == 1
+    assert ts.retry_stats.reasons == {"429": 1}
+
+
+def test_injected_errors_surface_once_retries_run_out():
+    ts = MockTradeStation(error_rate=1.0).client(
+        retry_policy=RetryPolicy(retries=1, backoff_factor=0)
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        ts.brokerage.balances(ACCOUNTS[:1])
+
+
+def test_bar_stream_sends_history_then_updates():
+    ts = MockTradeStation(stream_updates=3).client()
+
+    bars = list(islice(ts.market_data.stream_bars("MSFT", barsback=2), 5))
+
+    assert [bar.bar_status for bar in bars] == ["Closed"] * 2 + ["Open"] * 3
+    assert len({bar.epoch for bar in bars[2:]}) == 1
+
+
+def test_async_client_with_latency():
+    mock = MockTradeStation(latency=0.001)
+    ts = mock.async_client()
+
+    async def run() -> None:
+        results = await ts.market_data.bars_many(["MSFT", "AAPL"], barsback=5)
+        assert all(len(result.bars.bars) == 5 for result in results.values())
+
+    asyncio.run(run())
+
+    assert mock.requests == 2